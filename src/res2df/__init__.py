@@ -1,6 +1,7 @@
 from . import compdat as compdat
 from . import csv2res as csv2res
 from . import equil as equil
+from . import extractall as extractall
 from . import faults as faults
 from . import fipreports as fipreports
 from . import grid as grid
@@ -48,6 +49,7 @@ __all__ = [
     "compdat",
     "csv2res",
     "equil",
+    "extractall",
     "faults",
     "fipreports",
     "getLogger_res2csv",
@@ -2,7 +2,7 @@
 
 import argparse
 import datetime
-import inspect
+import functools
 import itertools
 import json
 import logging
@@ -11,7 +11,8 @@ import shlex
 import signal
 import sys
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from importlib import resources
 from pathlib import Path
 from typing import Any, cast
@@ -405,6 +406,33 @@ def merge_zones(
     return df
 
 
+def grouping_indices(*keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Compute a sort permutation and segment boundaries for grouping rows
+    on one or more key arrays.
+
+    The groups are sorted lexicographically by the keys, as in
+    DataFrame.groupby(). Aggregations over the groups can then be done with
+    segmented reductions, like ``np.add.reduceat(values[order], starts)``.
+
+    Args:
+        keys: Arrays of equal length to group on. The first array is
+            the primary sort key.
+
+    Returns:
+        The sort permutation of the rows, and the position in the sorted
+        rows where each group starts.
+    """
+    if not keys or len(keys[0]) == 0:
+        return np.arange(len(keys[0]) if keys else 0), np.zeros(0, dtype=np.int64)
+    order = np.lexsort(keys[::-1])
+    newgroup = np.zeros(len(order), dtype=bool)
+    newgroup[0] = True
+    for key in keys:
+        sorted_key = np.asarray(key)[order]
+        newgroup[1:] |= sorted_key[1:] != sorted_key[:-1]
+    return order, np.flatnonzero(newgroup)
+
+
 def comment_formatter(multiline: str | None, prefix: str = "-- ") -> str:
     """Prepends comment characters to every line in input
 
@@ -512,11 +540,13 @@ def df2res(
     supported: list[str] | None = None,
     consecutive: str | None = None,
     filename: str | None = None,
+    writers: Mapping[str, Callable[..., str]] | None = None,
 ) -> str:
     """Generate resdata :term:`include file` content from dataframes in res2df format.
 
     This function hands over the actual text generation pr. keyword
-    to functions named df2res_<keywordname> in the calling module.
+    to the functions in ``writers``, typically the df2res_<keywordname>
+    functions in a res2df module.
 
     These functions may again use generic_deck_table() from this module
     for the actual string construction.
@@ -529,18 +559,24 @@ def df2res(
             included pr. keyword. If a key named "master" is present
             it will be used as a master comment for the outputted file.
         supported: List of strings of keywords which are
-            supported in this invocation of this function.
+            supported in this invocation of this function. Defaults to
+            the keywords in ``writers``.
         consecutive: Column name for which we require the
             numbers to be consecutive. Typically PVTNUM, EQLNUM, SATNUM.
         filename: If supplied, the generated text will also be dumped
             to file.
+        writers: Dictionary from keyword to the function producing the
+            text for that keyword, taking the dataframe and an optional
+            comment as arguments.
 
     Returns:
         string that can be used as contents of :term:`include file`.
     """
-    from_module = inspect.stack()[1]
-    calling_module = inspect.getmodule(from_module[0])
-    assert calling_module is not None
+    if not writers:
+        raise ValueError("writers must map keywords to df2res functions")
+    if supported is None:
+        supported = list(writers)
+    modulename = next(iter(writers.values())).__module__
     if dataframe.empty:
         raise ValueError("Empty dataframe")
     if (
@@ -568,17 +604,15 @@ def df2res(
         keywords = [keywords]
     keywords_in_frame = set(dataframe["KEYWORD"])
     if keywords[0] is None and len(keywords) == 1:
-        assert supported is not None
         keywords = supported
     else:
         # Warn if some keywords are unsupported:
         assert keywords is not None
-        assert supported is not None
         not_supported: set[str | None] = set(keywords) - set(supported)
         if not_supported:
             logger.warning(
                 "Requested keyword(s) not supported by %s: %s",
-                calling_module.__name__,
+                modulename,
                 not_supported,
             )
         # Warn if some requested keywords are not in frame:
@@ -599,7 +633,7 @@ def df2res(
     string = ""
     res2df_header = (
         "Output file printed by "
-        + calling_module.__name__
+        + modulename
         + " "
         + __version__
         + "\n"
@@ -611,9 +645,7 @@ def df2res(
     if "master" in comments:
         string += comment_formatter(comments["master"])
     for keyword in keywords:
-        # Construct the associated function names
-        function_name = "df2res_" + keyword.lower()
-        function = getattr(calling_module, function_name)
+        function = writers[keyword]
         if keyword in comments:
             string += function(dataframe, comments[keyword])
         else:
@@ -625,6 +657,114 @@ def df2res(
     return string
 
 
+# Replaced by the realization number in filenames in df2res_realizations():
+REALIZATION_PLACEHOLDER = "{realization}"
+
+
+def _df2res_realization(
+    df2res_function: Callable[..., str],
+    dframe: pd.DataFrame,
+    filename: str,
+    kwargs: dict[str, object],
+) -> str:
+    """Write the include file for one realization, return its filename"""
+    df2res_function(dframe, filename=filename, **kwargs)
+    return filename
+
+
+def df2res_realizations(
+    df2res_function: Callable[..., str],
+    dframe: pd.DataFrame,
+    filename: str,
+    processes: int = 1,
+    **kwargs: object,
+) -> list[str]:
+    """Write one :term:`include file` pr. realization from a dataframe with
+    data for many realizations.
+
+    Args:
+        df2res_function: The df2res function of a res2df module, like
+            :func:`res2df.satfunc.df2res`.
+        dframe: Dataframe with res2df format and a REALIZATION column.
+        filename: Name of the include file for each realization, where
+            ``{realization}`` is replaced by the realization number,
+            like ``realization-{realization}/relperm.inc``.
+        processes: Number of processes to generate and write the include
+            files in. Defaults to 1, which means no extra processes.
+        kwargs: Passed on to df2res_function, like keywords and comments.
+
+    Returns:
+        The filenames written, sorted by realization.
+    """
+    if "REALIZATION" not in dframe:
+        raise ValueError("REALIZATION must be in the dataframe")
+    if REALIZATION_PLACEHOLDER not in filename:
+        raise ValueError(f"filename must contain {REALIZATION_PLACEHOLDER}")
+    realization_frames = []
+    filenames = []
+    for realization, realization_df in dframe.groupby("REALIZATION", sort=True):
+        realization_frames.append(realization_df.drop(columns="REALIZATION"))
+        filenames.append(filename.replace(REALIZATION_PLACEHOLDER, str(realization)))
+    if processes > 1:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            return list(
+                executor.map(
+                    _df2res_realization,
+                    itertools.repeat(df2res_function),
+                    realization_frames,
+                    filenames,
+                    itertools.repeat(kwargs),
+                )
+            )
+    return [
+        _df2res_realization(df2res_function, realization_df, realization_file, kwargs)
+        for realization_df, realization_file in zip(
+            realization_frames, filenames, strict=True
+        )
+    ]
+
+
+def fixed_width_tables(
+    dframe: pd.DataFrame, columns: list[str], sortcolumn: str, fmt: str = "%20.7f"
+) -> list[tuple[Any, str]]:
+    """Format tables of numbers in a dataframe as include file text with
+    fixed width columns.
+
+    The dataframe index must be sorted and tells which table each row belongs
+    to, typically SATNUM, PVTNUM or EQLNUM. All values are formatted in one
+    go for all tables, and the rows of each table are sorted on
+    ``sortcolumn``, keeping the order of rows with equal values. Each row is
+    indented with two spaces, and ends with a newline.
+
+    Args:
+        dframe: Dataframe indexed by table number.
+        columns: Columns to include, in the order they are printed.
+        sortcolumn: Column to sort the rows of each table on.
+        fmt: Printf-style format for each value.
+
+    Returns:
+        List of table numbers and the text for each table.
+    """
+    cells = [np.char.mod(fmt, dframe[col].to_numpy(dtype=float)) for col in columns]
+    rows = np.array(
+        ["  " + " ".join(row) + "\n" for row in zip(*cells, strict=True)],
+        dtype=object,
+    )
+    table_numbers = dframe.index.to_numpy()
+    sortvalues = dframe[sortcolumn].to_numpy()
+    starts = np.flatnonzero(
+        np.concatenate(([True], table_numbers[1:] != table_numbers[:-1]))
+    )
+    ends = np.append(starts[1:], len(dframe))
+    return [
+        (
+            table_numbers[start],
+            "".join(rows[start + np.argsort(sortvalues[start:end], kind="stable")]),
+        )
+        for start, end in zip(starts, ends, strict=True)
+    ]
+
+
 def generic_deck_table(
     dframe: pd.DataFrame,
     keyword: str,
@@ -660,10 +800,6 @@ def generic_deck_table(
     if dframe.empty:
         return string
 
-    # Ensure we work on a copy as we are going to modify it in order to have
-    # Pandas make a pretty txt table:
-    dframe = dframe.copy()
-
     # Column names are pr. res2df standard, redo to opm.common in order to use
     # sorting from that:
     if renamer is not None:
@@ -683,27 +819,6 @@ def generic_deck_table(
         # No relevant data in the dataframe
         return string
     relevant_columns = keyword_col_headers[0 : rightmost_column + 1]
-    for colname in relevant_columns:
-        # Add those that are missing, as Eclipse defaults
-        if colname not in dframe:
-            dframe[colname] = "1*"
-
-    # Reorder and slice columns:
-    dframe = dframe[relevant_columns]
-
-    # NaN or Nones are assumed to be defaulted, which in Eclipse terminology is
-    # the string "1*":
-    dframe = dframe.fillna(value="1*")
-
-    if drop_trailing_columns:
-        columns_to_drop = []
-        for col_name in reversed(relevant_columns):
-            if (dframe[col_name] == "1*").all():
-                columns_to_drop.append(col_name)
-            else:
-                break
-        if columns_to_drop:
-            dframe = dframe.drop(columns=columns_to_drop)
 
     # It is critical for opm.common, maybe also E100 to have integers printed
     # as integers, for correct parsing. Ensure these are integer where the json
@@ -713,43 +828,124 @@ def generic_deck_table(
         for item in OPMKEYWORDS[keyword]["items"]
         if item["value_type"] == "INT"
     }
-    for int_col in integer_cols.intersection(dframe.columns):
-        mask = dframe[int_col] != "1*"
-        dframe[int_col] = dframe[int_col].astype(str)
-        if mask.any():
-            dframe.loc[mask, int_col] = (
-                dframe.loc[mask, int_col].astype(float).astype(int).astype(str)
-            )
-
     # Quote all string data. This is not always needed, but needed
     # for some colums, for example well-names containing a slash.
     string_cols = {
         item["name"]
         for item in OPMKEYWORDS[keyword]["items"]
-        if item["value_type"] == "STRING"  # and item["name"] in col_headers
+        if item["value_type"] == "STRING"
     }
-    for str_col in string_cols.intersection(dframe.columns):
-        # Ensure 1* is not quoted.
-        non_defaulted_rows = dframe[str_col] != "1*"
-        dframe.loc[non_defaulted_rows, str_col] = (
-            "'" + dframe.loc[non_defaulted_rows, str_col].str.replace("'", "") + "'"
-        )
 
-    # Now rename again to have prettier column names:
-    if renamer is not None:
-        dframe = dframe.rename(renamer, axis="columns")
-    # Add a final column with the end-slash, invisible header:
-    dframe[" "] = "/"
-    tablestring = dframe.to_string(header=True, index=False)
-    # Indent all lines with two spaces:
-    tablestring = "\n".join(
-        "  " + line.strip().replace("  /", " /") for line in tablestring.splitlines()
+    # Format each column to strings, with NaN or None assumed to be defaulted,
+    # which in Eclipse terminology is the string "1*". Missing columns are
+    # added as defaulted.
+    headers: list[str] = []
+    columns: list[list[str]] = []
+    all_defaulted: list[bool] = []
+    for colname in relevant_columns:
+        header = colname if renamer is None else renamer.get(colname, colname)
+        if colname not in dframe:
+            headers.append(header)
+            columns.append(["1*"] * len(dframe))
+            all_defaulted.append(True)
+            continue
+        series = dframe[colname]
+        defaulted = (series.isna() | (series.astype(object) == "1*")).to_numpy()
+        if colname in integer_cols:
+            values = [
+                "1*" if default else str(int(float(value)))
+                for value, default in zip(series.tolist(), defaulted, strict=True)
+            ]
+        elif colname in string_cols:
+            values = [
+                "1*" if default else "'" + str(value).replace("'", "") + "'"
+                for value, default in zip(series.tolist(), defaulted, strict=True)
+            ]
+        elif not defaulted.any():
+            if pd.api.types.is_numeric_dtype(series.dtype):
+                # Numeric headers are right-aligned with a space for the sign
+                header = " " + header
+            values = _format_deck_values(series)
+        else:
+            values = [
+                "1*" if default else _format_deck_value(value)
+                for value, default in zip(series.tolist(), defaulted, strict=True)
+            ]
+        headers.append(header)
+        columns.append(values)
+        all_defaulted.append(bool(defaulted.all()))
+
+    if drop_trailing_columns:
+        while all_defaulted and all_defaulted[-1]:
+            all_defaulted.pop()
+            headers.pop()
+            columns.pop()
+
+    widths = [
+        max(len(header), *map(len, values))
+        for header, values in zip(headers, columns, strict=True)
+    ]
+    # Columns are right-aligned, and every row ends with a slash:
+    lines = [
+        "".join(
+            header.rjust(width) + " "
+            for header, width in zip(headers, widths, strict=True)
+        )
+        + " "
+    ]
+    rows = zip(*columns, strict=True) if columns else [()] * len(dframe)
+    lines.extend(
+        "".join(
+            value.rjust(width) + " " for value, width in zip(row, widths, strict=True)
+        )
+        + "/"
+        for row in rows
     )
+    # Indent all lines with two spaces:
+    tablestring = "\n".join("  " + line.strip().replace("  /", " /") for line in lines)
     # Eclipse comment for the header line:
     tablestring = "--" + tablestring[1:]
     return string + tablestring + "\n"
 
 
+def _format_deck_value(value: object) -> str:
+    """Format a single value in a :term:`.DATA file` table, floats with up
+    to six decimals"""
+    if isinstance(value, (float, np.floating)):
+        formatted = f"{value: .6f}".rstrip("0")
+        return formatted + "0" if formatted.endswith(".") else formatted
+    return str(value)
+
+
+def _format_deck_values(series: pd.Series) -> list[str]:
+    """Format a column without defaulted values in a :term:`.DATA file` table.
+
+    Floating point columns are printed with six decimals, trimming trailing
+    zeros equally for all values, or in scientific notation if some values
+    are very small, or if some are large and the decimals would be too long.
+    """
+    if series.dtype.kind != "f" or not isinstance(series.dtype, np.dtype):
+        return [_format_deck_value(value) for value in series.tolist()]
+    values = series.to_numpy()
+    strings = np.char.mod("%.6f", values)
+    finite = np.isfinite(values)
+    if finite.any():
+        trailing_zeros = np.char.str_len(strings) - np.char.str_len(
+            np.char.rstrip(strings, "0")
+        )
+        # Keep at least one decimal:
+        trim = min(int(trailing_zeros[finite].min()), 5)
+        if trim:
+            strings[finite] = [value[:-trim] for value in strings[finite].tolist()]
+    abs_values = np.abs(values)
+    too_long = np.char.str_len(strings).max() > 12
+    has_large_values = (abs_values > 1e6).any()
+    has_small_values = ((abs_values < 1e-6) & (abs_values > 0)).any()
+    if has_small_values or (too_long and has_large_values):
+        strings = np.char.mod("%.6e", values)
+    return strings.tolist()
+
+
 def runlength_compress(string: str, sep: str = "  ") -> str:
     """Compress a string of space-separated elements so that
 
@@ -970,11 +1166,21 @@ def get_wells_matching_template(template: str, wells: list[str]) -> list[str]:
     Returns:
         List of matched wells
     """
+    regex = _well_template_regex(template)
+    return [well for well in wells if regex.match(well)]
+
+
+@functools.cache
+def _well_template_regex(template: str) -> re.Pattern:
+    """Compile a well name template into a regular expression.
+
+    The compiled expressions are cached, as the same templates are
+    typically matched against many wells and at many dates.
+    """
     if template.startswith(("*", "?")):
         raise ValueError(
             "Well template not allowed to start with a wildcard character: "
             f"Must be preceded with a \\: {template}"
         )
     template = template.removeprefix("\\")
-    regex = template.replace("*", ".*").replace("?", ".")
-    return [well for well in wells if bool(re.match(regex, well))]
+    return re.compile(template.replace("*", ".*").replace("?", "."))
@@ -18,6 +18,7 @@ from typing import Any
 import numpy as np
 import opm.io.deck
 import pandas as pd
+import pyarrow as pa
 
 from .common import (
     get_wells_matching_template,
@@ -56,6 +57,9 @@ COMPDAT_RENAMER: dict[str, str] = {
     "PR": "PEQVR",
 }
 
+# Columns identifying a connection in an unrolled COMPDAT dataframe:
+CONNECTION_KEYS: list[str] = ["WELL", "I", "J", "K1"]
+
 # Workaround an inconsistency in JSON-files for OPM-common < 2021.04:
 WSEG_RENAMER: dict[str, str] = {
     "SEG1": "SEGMENT1",
@@ -64,7 +68,7 @@ WSEG_RENAMER: dict[str, str] = {
 
 
 def deck2dfs(
-    deck: "opm.io.Deck",
+    deck: "opm.io.Deck | list",
     start_date: str | datetime.date | None = None,
     unroll: bool = True,
 ) -> dict[str, pd.DataFrame]:
@@ -74,7 +78,8 @@ def deck2dfs(
     potential information from the WELSPECS keyword.
 
     Args:
-        deck: A :term:`deck` representing the schedule
+        deck: A :term:`deck` representing the schedule, or a list
+            of its keywords in deck order.
         start_date: The default date to use for
             events where the DATE or START keyword is not found in advance.
             Default: None
@@ -455,19 +460,28 @@ def unrolldf(
         )
         return dframe
     start_eq_end_bools = dframe[start_column] == dframe[end_column]
+    if start_eq_end_bools.all():
+        return dframe
+    rangerows = dframe[~start_eq_end_bools]
+    starts = rangerows[start_column].astype(int).to_numpy()
+    lengths = np.maximum(rangerows[end_column].astype(int).to_numpy() - starts + 1, 0)
+
+    # Repeat each range row once pr. layer, and count layers within each range:
+    row_positions = np.repeat(np.arange(len(rangerows)), lengths)
+    offsets = np.arange(len(row_positions)) - np.repeat(
+        np.cumsum(lengths) - lengths, lengths
+    )
+    list_unrolled = rangerows.iloc[row_positions].copy()
+    for column in [start_column, end_column]:
+        list_unrolled[column] = pd.Series(
+            starts[row_positions] + offsets,
+            index=list_unrolled.index,
+            dtype=dframe[column].dtype,
+        )
     unrolled = dframe[start_eq_end_bools]
-    list_unrolled = []
-    if (~start_eq_end_bools).any():
-        for _, rangerow in dframe[~start_eq_end_bools].iterrows():
-            for k_idx in range(
-                int(rangerow[start_column]), int(rangerow[end_column]) + 1
-            ):
-                rangerow[start_column] = k_idx
-                rangerow[end_column] = k_idx
-                list_unrolled.append(rangerow.copy())
-    if list_unrolled:
-        unrolled = pd.concat([unrolled, pd.DataFrame(list_unrolled)], axis=0)
-    return unrolled
+    if unrolled.empty:
+        return list_unrolled
+    return pd.concat([unrolled, list_unrolled], axis=0)
 
 
 def unroll_complump(complump_df: pd.DataFrame) -> pd.DataFrame:
@@ -496,21 +510,24 @@ def unroll_complump(complump_df: pd.DataFrame) -> pd.DataFrame:
     if complump_df is None or complump_df.empty:
         return complump_df
 
-    for _, row in complump_df.iterrows():
-        val_i = int(row["I"])
-        val_j = int(row["J"])
-        val_k1 = int(row["K1"])
-        val_k2 = int(row["K2"])
-        if val_i < 0 or val_j < 0 or val_k1 < 0 or val_k2 < 0:
+    coords = complump_df[["I", "J", "K1", "K2"]].astype(int)
+    negative = (coords < 0).any(axis=1).to_numpy()
+    defaulted = (coords == 0).any(axis=1).to_numpy()
+    k_reversed = (coords["K2"] < coords["K1"]).to_numpy()
+    invalid = negative | defaulted | k_reversed
+    if invalid.any():
+        # Report the first offending row:
+        idx = int(invalid.argmax())
+        row = complump_df.iloc[idx]
+        if negative[idx]:
             raise ValueError(
                 f"Negative values for COMPLUMP coordinates are not allowed: {row}"
             )
-        if val_i == 0 or val_j == 0 or val_k1 == 0 or val_k2 == 0:
+        if defaulted[idx]:
             raise ValueError(
                 f"Defaulted COMPLUMP coordinates are not supported in res2df: {row}"
             )
-        if val_k2 < val_k1:
-            raise ValueError(f"K2 must be equal to or greater than K1: {row}")
+        raise ValueError(f"K2 must be equal to or greater than K1: {row}")
     return unrolldf(complump_df)
 
 
@@ -554,11 +571,11 @@ def expand_wlist(wlist_df: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame. WLIST rows with only NEW directives
     """
 
-    # This function maintain all current (as in pr. date) well lists as a list
-    # of dictionaries, which accumulates all WLIST directives. Every time the date
+    # This function maintains all current (as in pr. date) well lists as sets
+    # of well names, which accumulates all WLIST directives. Every time the date
     # changes, the current state is outputted as it was valid for the previous date.
 
-    currentstate: dict[str, str] = {}
+    currentstate: dict[str, set[str]] = {}
 
     if wlist_df.empty:
         return wlist_df
@@ -566,7 +583,7 @@ def expand_wlist(wlist_df: pd.DataFrame) -> pd.DataFrame:
     currentdate = wlist_df["DATE"].min()
     new_records = []
 
-    for _, wlist_record in wlist_df.iterrows():
+    for wlist_record in wlist_df.to_dict(orient="records"):
         date = wlist_record["DATE"]
         if date > currentdate:
             # Store current state
@@ -576,78 +593,50 @@ def expand_wlist(wlist_df: pd.DataFrame) -> pd.DataFrame:
                         "DATE": currentdate,
                         "NAME": wlistname,
                         "ACTION": "NEW",
-                        "WELLS": wells,
+                        "WELLS": " ".join(sorted(wells)),
                     }
                 )
         currentdate = date
 
-        if wlist_record["ACTION"] in ["ADD", "NEW"]:
+        name = wlist_record["NAME"]
+        action = wlist_record["ACTION"]
+        record_wells = set(wlist_record["WELLS"].split())
+        if action in ["ADD", "NEW"]:
             # Already defined well-lists can be used to append whole
             # well lists to other lists:
-            recursive_wlists = [
-                r_wlist
-                for r_wlist in wlist_record["WELLS"].split()
-                if r_wlist.startswith("*")
-            ]
-            for r_wlist in recursive_wlists:
-                if r_wlist[1:] in currentstate:
-                    wlist_record["WELLS"] = wlist_record["WELLS"].replace(
-                        r_wlist, currentstate[r_wlist[1:]]
-                    )
-                else:
-                    print(wlist_record)
+            for r_wlist in [well for well in record_wells if well.startswith("*")]:
+                if r_wlist[1:] not in currentstate:
                     raise ValueError(
                         f"Recursive well list {r_wlist} does not exist in "
                         f"{currentstate}"
                     )
-        if wlist_record["ACTION"] == "NEW":
-            currentstate[wlist_record["NAME"]] = " ".join(
-                sorted(wlist_record["WELLS"].split())
-            )
-        elif (
-            wlist_record["ACTION"] in ["ADD", "DEL"]
-            and wlist_record["NAME"] not in currentstate
-        ):
+                record_wells.remove(r_wlist)
+                record_wells |= currentstate[r_wlist[1:]]
+        if action == "NEW":
+            currentstate[name] = record_wells
+        elif action in ["ADD", "DEL"] and name not in currentstate:
             raise ValueError(
                 f"WLIST ADD/DEL only works on existing well lists: {wlist_record!s}"
             )
-        if wlist_record["ACTION"] == "ADD":
-            currentstate[wlist_record["NAME"]] = " ".join(
-                sorted(
-                    set(
-                        wlist_record["WELLS"].split()
-                        + currentstate[wlist_record["NAME"]].split()
-                    )
-                )
-            )
-        if wlist_record["ACTION"] == "DEL":
-            currentstate[wlist_record["NAME"]] = " ".join(
-                sorted(
-                    set(currentstate[wlist_record["NAME"]].split())
-                    - set(wlist_record["WELLS"].split())
-                )
-            )
-        if wlist_record["ACTION"] == "MOV":
-            if wlist_record["NAME"] not in currentstate:
-                currentstate[wlist_record["NAME"]] = ""
-            currentstate[wlist_record["NAME"]] = " ".join(
-                sorted(
-                    set(currentstate[wlist_record["NAME"]].split()).union(
-                        set(wlist_record["WELLS"].split())
-                    )
-                )
-            )
-            for wlist, value in currentstate.items():
-                if wlist == wlist_record["NAME"]:
-                    continue
-                currentstate[wlist] = " ".join(
-                    sorted(set(value.split()) - set(wlist_record["WELLS"].split()))
-                )
+        if action == "ADD":
+            currentstate[name] |= record_wells
+        if action == "DEL":
+            currentstate[name] -= record_wells
+        if action == "MOV":
+            currentstate[name] = currentstate.get(name, set()) | record_wells
+            for wlist, wells in currentstate.items():
+                if wlist != name:
+                    currentstate[wlist] = wells - record_wells
 
     # Dump final state:
     for wlistname, wells in currentstate.items():
         new_records.append(
-            {"DATE": currentdate, "NAME": wlistname, "ACTION": "NEW", "WELLS": wells}
+            {
+                "DATE": currentdate,
+                "NAME": wlistname,
+                "ACTION": "NEW",
+                "WELLS": " ".join(sorted(wells)),
+            }
         )
 
     return pd.DataFrame(new_records)
@@ -754,6 +743,56 @@ def expand_complump_in_welopen_df(
     return dframe.astype(object).where(pd.notna(dframe), None)  # type: ignore[call-overload]
 
 
+def wlist_intervals(wlist_df: pd.DataFrame) -> pd.DataFrame:
+    """Represent well list memberships as validity intervals.
+
+    Each row in the returned dataframe states that the well WELL is a member
+    of the well list NAME from the date VALID_FROM and up to, but not
+    including, VALID_TO. VALID_TO is NaT for memberships that are valid
+    throughout the schedule. The rows are sorted by NAME and VALID_FROM,
+    so that the members of a list at a date can be found by binary search.
+
+    Args:
+        wlist_df: Dataframe with WLIST records. If it contains other actions
+            than NEW, it is expanded through expand_wlist() first.
+
+    Returns:
+        Dataframe with the columns NAME, WELL, VALID_FROM and VALID_TO.
+    """
+    columns = ["NAME", "WELL", "VALID_FROM", "VALID_TO"]
+    if wlist_df.empty:
+        return pd.DataFrame(columns=columns)
+    if set(wlist_df["ACTION"]) != {"NEW"}:
+        wlist_df = expand_wlist(wlist_df)
+
+    snapshots = wlist_df.assign(DATE=pd.to_datetime(wlist_df["DATE"])).sort_values(
+        "DATE", kind="stable"
+    )
+    records: list[tuple] = []
+    valid_from: dict[tuple[str, str], pd.Timestamp] = {}
+    members: dict[str, set[str]] = {}
+    for name, date, wells in zip(
+        snapshots["NAME"], snapshots["DATE"], snapshots["WELLS"], strict=True
+    ):
+        new_members = set(wells.split())
+        old_members = members.get(name, set())
+        records.extend(
+            (name, well, valid_from.pop((name, well)), date)
+            for well in old_members - new_members
+        )
+        for well in new_members - old_members:
+            valid_from[name, well] = date
+        members[name] = new_members
+    for (name, well), date in valid_from.items():
+        records.append((name, well, date, pd.NaT))
+
+    intervals = pd.DataFrame(records, columns=columns)
+    intervals["VALID_TO"] = pd.to_datetime(intervals["VALID_TO"])
+    # Memberships that were overwritten at the same date are never valid:
+    intervals = intervals[intervals["VALID_FROM"] != intervals["VALID_TO"]]
+    return intervals.sort_values(["NAME", "VALID_FROM", "WELL"]).reset_index(drop=True)
+
+
 def expand_wlist_in_welopen_df(
     welopen_df: pd.DataFrame, wlist_df: pd.DataFrame
 ) -> pd.DataFrame:
@@ -764,27 +803,44 @@ def expand_wlist_in_welopen_df(
     if welopen_df.empty or welopen_df is None or wlist_df is None or wlist_df.empty:
         return welopen_df
 
-    exp_welopens = []
-    for _, row in welopen_df.iterrows():
-        relevant_wlist_df = wlist_df[wlist_df["DATE"] <= row["DATE"]]
-        if row["WELL"].startswith("*"):
-            wlistname = row["WELL"].replace("*", "")
-            if wlistname in relevant_wlist_df["NAME"].to_numpy():
-                for well in (
-                    relevant_wlist_df[relevant_wlist_df["NAME"] == wlistname]
-                    .tail(1)["WELLS"]
-                    .reset_index(drop=True)[0]
-                    .split()
-                ):
-                    wellrow = row.copy()
-                    wellrow["WELL"] = well
-                    exp_welopens.append(wellrow)
-            else:
-                raise ValueError(f"Well list {wlistname} not defined at {row['DATE']}")
-        else:
+    defined_from = (
+        pd.to_datetime(wlist_df["DATE"]).groupby(wlist_df["NAME"].to_numpy()).min()
+    )
+    memberships = {
+        name: (
+            group["VALID_FROM"].to_numpy(),
+            group["VALID_TO"].to_numpy(),
+            group["WELL"].to_numpy(),
+        )
+        for name, group in wlist_intervals(wlist_df).groupby("NAME")
+    }
+
+    rows = []
+    wells = []
+    for idx, (well, date) in enumerate(
+        zip(welopen_df["WELL"], welopen_df["DATE"], strict=True)
+    ):
+        if not well.startswith("*"):
             # Explicit wellname was used, no expansion to happen:
-            exp_welopens.append(row)
-    dframe = pd.DataFrame(exp_welopens)
+            rows.append(idx)
+            wells.append(well)
+            continue
+        wlistname = well.replace("*", "")
+        timestamp = pd.Timestamp(date)
+        if wlistname not in defined_from or defined_from[wlistname] > timestamp:
+            raise ValueError(f"Well list {wlistname} not defined at {date}")
+        if wlistname not in memberships:
+            continue
+        valid_from, valid_to, members = memberships[wlistname]
+        started = np.searchsorted(valid_from, timestamp.to_datetime64(), side="right")
+        not_ended = np.isnat(valid_to[:started]) | (
+            valid_to[:started] > timestamp.to_datetime64()
+        )
+        for member in sorted(members[:started][not_ended]):
+            rows.append(idx)
+            wells.append(member)
+    dframe = welopen_df.iloc[rows].copy()
+    dframe["WELL"] = wells
     return dframe.astype(object).where(pd.notna(dframe), None)  # type: ignore[call-overload]
 
 
@@ -924,6 +980,133 @@ def applywelopen(
     return compdat_df
 
 
+def state_cube(compdat_df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the COMPDAT event log into a table of connection states with
+    validity intervals.
+
+    Each row in the COMPDAT dataframe is an event, where a connection is
+    defined or changed. In the returned dataframe, each row is the state of a
+    connection from the date in VALID_FROM and up to, but not including, the
+    date in VALID_TO. VALID_TO is NaT for the last state of every connection,
+    and VALID_FROM is NaT for connections defined before any date in the
+    :term:`deck`.
+
+    A connection is identified by WELL, I, J and K1, so the COMPDAT dataframe
+    must be unrolled. If a connection has more than one event at the same date,
+    the last one is used.
+
+    The returned dataframe is sorted by connection and VALID_FROM, which is
+    what state_at() relies on for its lookups. It can be exported through
+    state_cube2pyarrow().
+
+    Args:
+        compdat_df: Dataframe with unrolled COMPDAT data, e.g. from df()
+
+    Returns:
+        Dataframe with the COMPDAT columns except DATE, and VALID_FROM
+        and VALID_TO.
+
+    Raises:
+        ValueError: If the COMPDAT data is not unrolled (K1 differs from K2)
+    """
+    if {"K1", "K2"}.issubset(compdat_df) and (
+        compdat_df["K1"] != compdat_df["K2"]
+    ).any():
+        raise ValueError("COMPDAT data must be unrolled, use unrolldf()")
+    cube = compdat_df.drop(columns="DATE", errors="ignore")
+    if compdat_df.empty:
+        return cube.assign(
+            VALID_FROM=pd.Series(dtype="datetime64[ns]"),
+            VALID_TO=pd.Series(dtype="datetime64[ns]"),
+        )
+    cube["VALID_FROM"] = pd.to_datetime(compdat_df["DATE"])
+    cube = cube.sort_values(
+        [*CONNECTION_KEYS, "VALID_FROM"], kind="stable", na_position="first"
+    ).drop_duplicates(subset=[*CONNECTION_KEYS, "VALID_FROM"], keep="last")
+    cube["VALID_TO"] = cube.groupby(CONNECTION_KEYS, sort=False)["VALID_FROM"].shift(-1)
+    return cube.reset_index(drop=True)
+
+
+def state_at(
+    cube: pd.DataFrame,
+    dates: str | datetime.date | list | pd.Index,
+) -> pd.DataFrame:
+    """Look up the state of all connections at the given dates.
+
+    Each lookup is a binary search in the state cube, so this is cheap
+    also for long schedules. Use f.ex. ``dframe[dframe["OP/SH"] == "OPEN"]``
+    on the result to get the open connections and their KH at each date.
+
+    Args:
+        cube: Dataframe from state_cube()
+        dates: One or more dates to look up the state for.
+
+    Returns:
+        Dataframe with one row pr. connection defined at each date, with
+        the date in the DATE column.
+    """
+    if isinstance(dates, (str, datetime.date)):
+        dates = [dates]
+    query_dates = pd.DatetimeIndex(pd.to_datetime(list(dates))).normalize()
+    if cube.empty or query_dates.empty:
+        return cube.iloc[0:0].assign(DATE=pd.Series(dtype="datetime64[ns]"))
+
+    # Integer id for each connection, consecutive as the cube is sorted
+    # by connection:
+    new_connection = (
+        cube[CONNECTION_KEYS].ne(cube[CONNECTION_KEYS].shift()).any(axis="columns")
+    )
+    conn_id = np.cumsum(new_connection.to_numpy()) - 1
+    n_connections = conn_id[-1] + 1
+
+    # Days since the epoch, where NaT (before the first date) gets the
+    # smallest value:
+    from_days = cube["VALID_FROM"].to_numpy(dtype="datetime64[D]").astype(np.int64)
+    query_days = query_dates.to_numpy(dtype="datetime64[D]").astype(np.int64)
+    is_nat = cube["VALID_FROM"].isna().to_numpy()
+    first_day = min(from_days[~is_nat].min(initial=query_days.min()), query_days.min())
+    last_day = max(from_days[~is_nat].max(initial=query_days.max()), query_days.max())
+    from_days = np.where(is_nat, first_day - 1, from_days) - (first_day - 1)
+    query_days -= first_day - 1
+
+    # The cube is sorted on (connection, day), which is encoded as one integer
+    # key so all lookups can be done by one call to searchsorted():
+    span = last_day - first_day + 2
+    cube_keys = conn_id * span + from_days
+    query_conn = np.tile(np.arange(n_connections), len(query_days))
+    query_date_idx = np.repeat(np.arange(len(query_days)), n_connections)
+    query_keys = query_conn * span + query_days[query_date_idx]
+    row_idx = np.searchsorted(cube_keys, query_keys, side="right") - 1
+
+    # Drop connections not yet defined at the date in question:
+    found = row_idx >= 0
+    found[found] = conn_id[row_idx[found]] == query_conn[found]
+
+    state = cube.iloc[row_idx[found]].reset_index(drop=True)
+    state["DATE"] = query_dates[query_date_idx[found]]
+    return state
+
+
+def state_cube2pyarrow(cube: pd.DataFrame) -> pa.Table:
+    """Convert a state cube from state_cube() to a pyarrow table.
+
+    The index in the dataframe will be ignored. Grid indices are
+    stored as 32-bit integers.
+    """
+    table = pa.Table.from_pandas(cube, preserve_index=False)
+    schema = table.schema
+    for colname in ["I", "J", "K1", "K2"]:
+        if colname in schema.names:
+            schema = schema.set(
+                schema.get_field_index(colname), pa.field(colname, pa.int32())
+            )
+    for colname in ["VALID_FROM", "VALID_TO"]:
+        schema = schema.set(
+            schema.get_field_index(colname), pa.field(colname, pa.timestamp("ms"))
+        )
+    return table.cast(schema)
+
+
 def fill_parser(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
     """Set up sys.argv parsers.
 
@@ -9,6 +9,8 @@ import argparse
 from .__version__ import __version__
 from .equil import equil_reverse_main
 from .equil import fill_reverse_parser as equil_fill_reverse_parser
+from .grid import fill_reverse_parser as grid_fill_reverse_parser
+from .grid import grid_reverse_main
 from .pvt import fill_reverse_parser as pvt_fill_reverse_parser
 from .pvt import pvt_reverse_main
 from .satfunc import fill_reverse_parser as satfunc_fill_reverse_parser
@@ -87,6 +89,17 @@ def get_parser() -> argparse.ArgumentParser:
     vfp_fill_reverse_parser(vfp_parser)
     vfp_parser.set_defaults(func=vfp_reverse_main)
 
+    grid_parser = subparsers.add_parser(
+        "grid",
+        help="Write GRID include files",
+        description=(
+            "Write grid keywords like PERMX, PORO and FIPNUM to include files "
+            "from CSV files with res2df format, as text or in binary format."
+        ),
+    )
+    grid_fill_reverse_parser(grid_parser)
+    grid_parser.set_defaults(func=grid_reverse_main)
+
     return parser
 
 
@@ -4,7 +4,7 @@ Extract EQUIL from a :term:`.DATA file` as Pandas DataFrame
 
 import argparse
 import logging
-from collections.abc import Container
+from collections.abc import Callable, Container
 from pathlib import Path
 from typing import Final
 
@@ -13,6 +13,7 @@ import pandas as pd
 
 from .common import (
     comment_formatter,
+    fixed_width_tables,
     generic_deck_table,
     handle_wanted_keywords,
     keyworddata_to_df,
@@ -395,6 +396,7 @@ def df2res(
         supported=SUPPORTED_KEYWORDS,
         consecutive="EQLNUM",
         filename=filename,
+        writers=DF2RES_WRITERS,
     )
     return string
 
@@ -500,24 +502,18 @@ def _df2res_equilfuncs(
     # Use everything if KEYWORD not in dframe..
     subset = dframe if "KEYWORD" not in dframe else dframe[dframe["KEYWORD"] == keyword]
 
-    def _df2res_equilfuncs_eqlnum(dframe: pd.DataFrame) -> str:
-        """Create string with :term:`include file` contents
-        for one equilibriation function table for a specific EQLNUM
-
-        Args:
-            dframe (pd.DataFrame): Cropped to only contain data for one EQLNUM
-
-        Returns:
-            string
-        """
-        string = ""
-        dframe = dframe.sort_values("Z")
-        for _, row in dframe.iterrows():
-            string += f"  {row[col_headers[0]]:20.7f} {row[col_headers[1]]:20.7f}\n"
-        return string + "/\n"
-
     subset = subset.set_index("EQLNUM").sort_index()
-    for eqlnum in subset.index.unique():
+    for eqlnum, table in fixed_width_tables(subset, col_headers[0:2], "Z"):
         string += f"-- EQLNUM: {eqlnum}\n"
-        string += _df2res_equilfuncs_eqlnum(subset[subset.index == eqlnum])
+        string += table + "/\n"
     return string + "\n"
+
+
+# The functions producing include file text pr. keyword, used by df2res():
+DF2RES_WRITERS: dict[str, Callable[[pd.DataFrame, str | None], str]] = {
+    "EQUIL": df2res_equil,
+    "RSVD": df2res_rsvd,
+    "RVVD": df2res_rvvd,
+    "PBVD": df2res_pbvd,
+    "PDVD": df2res_pdvd,
+}
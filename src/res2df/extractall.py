@@ -0,0 +1,282 @@
+"""Run several res2df extractors on one simulation case in a single process
+
+The deck is parsed only once, and the schedule related extractors (compdat,
+wcon and gruptree) share one walk over the deck keywords. Binary output
+files are opened once through a shared ResdataFiles object.
+"""
+
+import argparse
+import logging
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import opm.io
+import pandas as pd
+import pyarrow as pa
+
+from . import (
+    compdat,
+    equil,
+    faults,
+    fipreports,
+    grid,
+    gruptree,
+    nnc,
+    pillars,
+    pvt,
+    rft,
+    satfunc,
+    summary,
+    trans,
+    wcon,
+    wellcompletiondata,
+    wellconnstatus,
+)
+from .common import merge_zones, write_dframe_stdout_file
+from .res2csvlogger import getLogger_res2csv
+from .resdatafiles import ResdataFiles
+
+logger = logging.getLogger(__name__)
+
+# Keywords that advance the date in the schedule state machines:
+DATE_KEYWORDS: list[str] = ["DATES", "START", "TSTEP"]
+
+# Keywords needed by each of the schedule extractors.
+SCHEDULE_KEYWORDS: dict[str, list[str]] = {
+    "compdat": [
+        "COMPDAT",
+        "COMPLUMP",
+        "COMPSEGS",
+        "WELOPEN",
+        "WELSEGS",
+        "WELSPECS",
+        "WLIST",
+        "WSEGAICD",
+        "WSEGSICD",
+        "WSEGVALV",
+    ],
+    "gruptree": ["BRANPROP", "GRUPNET", "GRUPTREE", "NODEPROP", "WELSPECS"],
+    "wcon": wcon.WCONKEYS,
+}
+
+
+def schedule_keywords(
+    deck: "opm.opmcommon_python.Deck", extractors: list[str]
+) -> list["opm.opmcommon_python.DeckKeyword"]:
+    """Walk once through the :term:`deck` and collect the keywords that
+    any of the given schedule extractors will look at.
+
+    The returned list keeps the order of the deck, and can be given
+    in place of the deck to compdat.deck2dfs(), wcon.df() and gruptree.df().
+
+    Args:
+        deck: A :term:`deck` with the schedule
+        extractors: Names of schedule extractors, keys in SCHEDULE_KEYWORDS.
+    """
+    wanted = set(DATE_KEYWORDS)
+    for extractor in extractors:
+        wanted |= set(SCHEDULE_KEYWORDS.get(extractor, []))
+    return [kword for kword in deck if kword.name in wanted]
+
+
+def _compdat(
+    resdatafiles: ResdataFiles, schedule: list["opm.opmcommon_python.DeckKeyword"]
+) -> pd.DataFrame:
+    compdat_df = compdat.deck2dfs(schedule)["COMPDAT"]
+    zonemap = resdatafiles.get_zonemap()
+    if zonemap:
+        compdat_df = merge_zones(compdat_df, zonemap)
+    return compdat_df
+
+
+def _summary(resdatafiles: ResdataFiles, arrow: bool) -> pd.DataFrame | pa.Table:
+    sum_df = summary.df(resdatafiles)
+    if arrow:
+        return summary._df2pyarrow(sum_df)
+    return sum_df.reset_index()
+
+
+def _grid(resdatafiles: ResdataFiles, arrow: bool) -> pd.DataFrame | pa.Table:
+    grid_df = grid.df(resdatafiles)
+    if arrow:
+        return grid._df2pyarrow(grid_df)
+    return grid_df
+
+
+def _wellcompletiondata(
+    resdatafiles: ResdataFiles, arrow: bool
+) -> pd.DataFrame | pa.Table:
+    wcd_df = wellcompletiondata.df(resdatafiles)
+    if arrow:
+        return wellcompletiondata._df2pyarrow(wcd_df)
+    return wcd_df
+
+
+# Functions called for each extractor. The arguments are the shared
+# ResdataFiles object, the shared list of schedule keywords and the arrow flag.
+EXTRACTORS: dict[
+    str,
+    Callable[
+        [ResdataFiles, list["opm.opmcommon_python.DeckKeyword"], bool],
+        pd.DataFrame | pa.Table,
+    ],
+] = {
+    "compdat": lambda rdf, sch, _: _compdat(rdf, sch),
+    "equil": lambda rdf, _, __: equil.df(rdf),
+    "faults": lambda rdf, _, __: faults.df(rdf),
+    "fipreports": lambda rdf, _, __: fipreports.df(rdf),
+    "grid": lambda rdf, _, arrow: _grid(rdf, arrow),
+    "gruptree": lambda _, sch, __: gruptree.df(sch),
+    "nnc": lambda rdf, _, __: nnc.df(rdf),
+    "pillars": lambda rdf, _, __: pillars.df(rdf),
+    "pvt": lambda rdf, _, __: pvt.df(rdf.get_deck()),
+    "rft": lambda rdf, _, __: rft.df(rdf),
+    "satfunc": lambda rdf, _, __: satfunc.df(rdf),
+    "summary": lambda rdf, _, arrow: _summary(rdf, arrow),
+    "trans": lambda rdf, _, __: trans.df(rdf),
+    "wcon": lambda _, sch, __: wcon.df(sch),
+    "wellcompletiondata": lambda rdf, _, arrow: _wellcompletiondata(rdf, arrow),
+    "wellconnstatus": lambda rdf, _, __: wellconnstatus.df(rdf),
+}
+
+
+def _split_names(extractors: str | list[str]) -> list[str]:
+    """Split comma and/or space separated extractor names"""
+    if isinstance(extractors, str):
+        extractors = [extractors]
+    return [
+        name.strip()
+        for string in extractors
+        for name in string.replace(",", " ").split()
+        if name.strip()
+    ]
+
+
+def parse_extractors(extractors: str | list[str]) -> list[str]:
+    """Parse a user supplied list of extractors.
+
+    Accepts comma and/or space separated strings, and the special
+    value "all" for every supported extractor.
+
+    Raises:
+        ValueError if an unsupported extractor is requested.
+    """
+    names = _split_names(extractors)
+    if "all" in names:
+        return list(EXTRACTORS)
+    unsupported = [name for name in names if name not in EXTRACTORS]
+    if unsupported:
+        raise ValueError(
+            f"Unsupported extractor(s) {unsupported}, choose from {list(EXTRACTORS)}"
+        )
+    # Remove duplicates but keep the user supplied order:
+    return list(dict.fromkeys(names))
+
+
+def iterdfs(
+    resdatafiles: ResdataFiles,
+    extractors: str | list[str],
+    arrow: bool = False,
+    skip_missing: bool | None = None,
+) -> Iterator[tuple[str, pd.DataFrame | pa.Table]]:
+    """Run a set of extractors on one simulation case, yielding each
+    frame as soon as it is produced.
+
+    Args:
+        resdatafiles: Shared object for all extractors, the deck and
+            the binary output files are only loaded once.
+        extractors: List of extractor names, see EXTRACTORS.
+        arrow: Return pyarrow tables for the extractors that support it.
+        skip_missing: Log a warning and skip extractors whose input files
+            are missing instead of raising FileNotFoundError. Defaults
+            to True when "all" extractors are requested.
+
+    Yields:
+        Tuples of extractor name and dataframe (or pyarrow table),
+        in the requested order.
+    """
+    if skip_missing is None:
+        skip_missing = "all" in _split_names(extractors)
+    extractors = parse_extractors(extractors)
+    schedule: list[opm.opmcommon_python.DeckKeyword] = []
+    schedule_extractors = [name for name in extractors if name in SCHEDULE_KEYWORDS]
+    if schedule_extractors:
+        schedule = schedule_keywords(resdatafiles.get_deck(), schedule_extractors)
+    for extractor in extractors:
+        logger.info("Extracting %s", extractor)
+        try:
+            frame = EXTRACTORS[extractor](resdatafiles, schedule, arrow)
+        except FileNotFoundError as err:
+            if not skip_missing:
+                raise
+            logger.warning("Skipping %s, input file missing: %s", extractor, err)
+            continue
+        yield extractor, frame
+
+
+def dfs(
+    resdatafiles: ResdataFiles,
+    extractors: str | list[str],
+    arrow: bool = False,
+    skip_missing: bool | None = None,
+) -> dict[str, pd.DataFrame | pa.Table]:
+    """Run a set of extractors on one simulation case.
+
+    See iterdfs() for the arguments.
+
+    Returns:
+        Dictionary of dataframes (or pyarrow tables), indexed by
+        extractor name, in the requested order.
+    """
+    return dict(iterdfs(resdatafiles, extractors, arrow, skip_missing))
+
+
+def fill_parser(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """Set up sys.argv parsers.
+
+    Arguments:
+        parser: parser to fill with arguments
+    """
+    parser.add_argument(
+        "DATAFILE", help="Name of the .DATA input file for the reservoir simulator"
+    )
+    parser.add_argument(
+        "-e",
+        "--extractors",
+        type=str,
+        nargs="+",
+        help=(
+            "Extractors to run, comma or space separated, or 'all'. "
+            f"Supported: {', '.join(EXTRACTORS)}"
+        ),
+        default=["all"],
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        help=(
+            "Directory for the output files. Each extractor "
+            "writes to <extractor>.csv, or <extractor>.arrow with --arrow"
+        ),
+        default=".",
+    )
+    parser.add_argument("--arrow", action="store_true", help="Write to pyarrow format")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Be verbose")
+    return parser
+
+
+def extractall_main(args: argparse.Namespace) -> None:
+    """Entry-point for module, for command line utility"""
+    logger = getLogger_res2csv(__name__, vars(args))
+    resdatafiles = ResdataFiles(args.DATAFILE)
+    outputdir = Path(args.output)
+    outputdir.mkdir(parents=True, exist_ok=True)
+    for extractor, frame in iterdfs(resdatafiles, args.extractors, arrow=args.arrow):
+        suffix = ".arrow" if isinstance(frame, pa.Table) else ".csv"
+        write_dframe_stdout_file(
+            frame,
+            str(outputdir / (extractor + suffix)),
+            index=False,
+            caller_logger=logger,
+        )
@@ -1,9 +1,15 @@
 """Extract FIP region reports from PRT file"""
 
 import argparse
+import collections
 import datetime
+import gzip
+import itertools
 import logging
+import mmap
 import re
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -30,6 +36,24 @@ REGION_REPORT_COLUMNS: list[str] = [
     "GIIP_TOTAL",
 ]
 
+# Size of the decompressed pieces read at a time from gzipped PRT files:
+GZ_CHUNKSIZE: int = 64 * 1024 * 1024
+
+
+def _float_or_nan(string: str) -> float:
+    try:
+        return float(string)
+    except ValueError:
+        return np.nan
+
+
+ALLOWED_LINE_STARTS: tuple[str, ...] = (
+    ":CURRENTLY",
+    ":OUTFLOW",
+    ":MATERIAL",
+    ":ORIGINALLY",
+)
+
 
 def report_block_lineparser(line: str) -> tuple:
     """
@@ -37,15 +61,7 @@ def report_block_lineparser(line: str) -> tuple:
 
     Does not support many different phase configurations yet.
     """
-
-    def float_or_nan(string: str) -> float:
-        try:
-            return float(string)
-        except ValueError:
-            return np.nan
-
-    allowed_line_starts = [":CURRENTLY", ":OUTFLOW", ":MATERIAL", ":ORIGINALLY"]
-    if not any(line.strip().upper().startswith(x) for x in allowed_line_starts):
+    if not line.strip().upper().startswith(ALLOWED_LINE_STARTS):
         return ()
 
     colonsections = line.split(":")
@@ -55,35 +71,33 @@ def report_block_lineparser(line: str) -> tuple:
         row_name = "OUTFLOW TO REGION"
     else:
         to_index = None
-        row_name = " ".join(colonsections[1].strip().upper().split())
+        row_name = " ".join(colonsections[1].upper().split())
 
     # Oil section:
     liquid_oil: float | None = None
     vapour_oil: float | None = None
     total_oil: float | None = None
-    if len(colonsections[2].split()) == 3:
-        (liquid_oil, vapour_oil, total_oil) = map(
-            float_or_nan, colonsections[2].split()
-        )
-    elif len(colonsections[2].split()) == 2:
-        (liquid_oil, total_oil) = map(float_or_nan, colonsections[2].split())
-    elif len(colonsections[2].split()) == 1:
-        total_oil = float_or_nan(colonsections[2])
+    oil_values = colonsections[2].split()
+    if len(oil_values) == 3:
+        (liquid_oil, vapour_oil, total_oil) = map(_float_or_nan, oil_values)
+    elif len(oil_values) == 2:
+        (liquid_oil, total_oil) = map(_float_or_nan, oil_values)
+    elif len(oil_values) == 1:
+        total_oil = _float_or_nan(colonsections[2])
 
-    total_water = float_or_nan(colonsections[3])
+    total_water = _float_or_nan(colonsections[3])
 
     # Gas section:
     free_gas = None
     dissolved_gas = None
     total_gas = None
-    if len(colonsections[4].split()) == 1:
-        total_gas = float_or_nan(colonsections[4])
-    elif len(colonsections[4].split()) == 2:
-        (free_gas, total_gas) = map(float_or_nan, colonsections[4].split())
+    gas_values = colonsections[4].split()
+    if len(gas_values) == 1:
+        total_gas = _float_or_nan(colonsections[4])
+    elif len(gas_values) == 2:
+        (free_gas, total_gas) = map(_float_or_nan, gas_values)
     else:
-        (free_gas, dissolved_gas, total_gas) = map(
-            float_or_nan, colonsections[4].split()
-        )
+        (free_gas, dissolved_gas, total_gas) = map(_float_or_nan, gas_values)
     return (
         row_name,
         to_index,
@@ -97,97 +111,286 @@ def report_block_lineparser(line: str) -> tuple:
     )
 
 
-def df(prtfile: str | ResdataFiles, fipname: str = "FIPNUM") -> pd.DataFrame:
+def _prt_scanner(fipnames: list[str] | None) -> re.Pattern:
+    """Compile one pattern matching all lines in a PRT file that change
+    the parser state: date lines from Eclipse and OPM flow, region report
+    headers and the end of report blocks.
+
+    Each match extends to the end of its line. Whitespace is not allowed
+    to span lines.
+
+    Args:
+        fipnames: Region report names to match. None matches any
+            region report name starting with FIP.
+    """
+    space = r"[^\S\n]"
+    if fipnames is None:
+        fipname_pattern = r"FIP\w{0,5}"
+    else:
+        fipname_pattern = "|".join(re.escape(fipname) for fipname in fipnames)
+    pattern = (
+        r"^(?:"
+        # Eclipse date line:
+        rf"(?:{space}{{2}}REPORT{space}+\d+{space}+(?P<eclday>\d+)"
+        rf"{space}+(?P<eclmonth>\w+){space}+(?P<eclyear>\d+))"
+        # OPM flow date line:
+        r"|(?:Starting time step.*? date = "
+        r"(?P<opmday>\d+)-(?P<opmmonth>\w+)-(?P<opmyear>\d+))"
+        # Region report header, when case insensitive this one works with
+        # both Eclipse100 and OPM:
+        rf"|(?i:.+(?<!\w)(?P<fipname>{fipname_pattern}){space}+REPORT{space}+REGION"
+        rf"{space}+(?P<region>\d+))"
+        # End of a report block:
+        r"|(?P<blockend> ={28})"
+        r").*"
+    )
+    return re.compile(pattern.encode(), re.MULTILINE)
+
+
+def _parse_report_block(lines: bytes) -> list[tuple]:
+    """Parse the lines inside a region report block"""
+    rows = []
+    for line in lines.decode("utf-8").splitlines():
+        upperline = line.upper()
+        if not (
+            "IN PLACE" in upperline or "OUTFLOW" in upperline or "MATERIAL" in upperline
+        ):
+            # Skip if we are not on an interesting line.
+            continue
+
+        # The colons in the report block are not reliably included
+        # (differs by Eclipse version), even in the same PRT file. We
+        # insert them in fixed positions and hope for the best (if the
+        # ASCII table is actually dynamic with respect to content, this
+        # will fail)
+        line = line.strip()
+        if line[0] != ":":
+            line = ":" + line
+        # There should another colon somewhere between 25 - 27
+        # (depend on OPM/Eclipse version)
+        if ":" not in line[25:27] and len(line) > 26:
+            line = line[:26] + ":" + line[27:]
+        rows.append(report_block_lineparser(line))
+    return rows
+
+
+def _parse_chunk(
+    prt: bytes | mmap.mmap, fipnames: list[str] | None, start: int, end: int
+) -> dict:
+    """Parse the region report blocks in one chunk of a PRT file.
+
+    The chunk must start and end at line boundaries. The parser state at
+    the start of the chunk is not known here, so rows before the first
+    date in the chunk get None as DATE. The returned dictionary tells the
+    caller how to stitch the chunk onto the state left by the previous
+    chunks:
+
+    * ``head``: Rows before the first region report header or report block
+      end, with None as FIPNAME and REGION. Only to be used if the chunk
+      starts inside a report block.
+    * ``rows``: Rows after that, with DATE, FIPNAME and REGION first.
+    * ``date``: The last date in the chunk, or None.
+    * ``state``: Tuple with in-report-block flag, FIPNAME and region index
+      at the end of the chunk, or None if the chunk has no region report
+      header or report block end.
+    """
+    head: list[list] = []
+    rows: list[list] = []
+    date = None
+    state: tuple[bool, str | None, int | None] | None = None
+    block_start = start
+    for match in _prt_scanner(fipnames).finditer(prt, start, end):
+        if state is None:
+            head.extend(
+                [date, None, None, *row]
+                for row in _parse_report_block(prt[block_start : match.start()])
+            )
+        elif state[0]:
+            rows.extend(
+                [date, state[1], state[2], *row]
+                for row in _parse_report_block(prt[block_start : match.start()])
+            )
+        block_start = match.end()
+        if match["eclday"] is not None or match["opmday"] is not None:
+            prefix = "ecl" if match["eclday"] is not None else "opm"
+            newdate = datetime.date(
+                year=int(match[prefix + "year"]),
+                month=parse_month(match[prefix + "month"].decode().upper()),
+                day=int(match[prefix + "day"]),
+            )
+            if newdate != date:
+                date = newdate
+                logger.debug("Found date: %s", date)
+        elif match["region"] is not None:
+            state = (True, match["fipname"].decode().upper(), int(match["region"]))
+            logger.debug("  %s region report for region %s", state[1], state[2])
+        else:
+            state = (False, None, None)
+    if state is None:
+        head.extend(
+            [date, None, None, *row]
+            for row in _parse_report_block(prt[block_start:end])
+        )
+    elif state[0]:
+        rows.extend(
+            [date, state[1], state[2], *row]
+            for row in _parse_report_block(prt[block_start:end])
+        )
+    return {"head": head, "rows": rows, "date": date, "state": state}
+
+
+def _parse_prtfile_chunk(
+    prtfile: str, fipnames: list[str] | None, start: int, end: int
+) -> dict:
+    """Parse one chunk of a memory mapped PRT file, for use in subprocesses"""
+    with (
+        Path(prtfile).open("rb") as prt_fh,
+        mmap.mmap(prt_fh.fileno(), 0, access=mmap.ACCESS_READ) as prt_map,
+    ):
+        return _parse_chunk(prt_map, fipnames, start, end)
+
+
+def _line_chunks(prt: bytes | mmap.mmap, nchunks: int) -> list[tuple[int, int]]:
+    """Split a buffer into (start, end) ranges of about equal size, cut
+    right after newlines"""
+    size = len(prt)
+    bounds = [0]
+    for chunkidx in range(1, nchunks):
+        cut = prt.find(b"\n", max(size * chunkidx // nchunks, bounds[-1])) + 1
+        if cut == 0:
+            break
+        bounds.append(cut)
+    if bounds[-1] != size:
+        bounds.append(size)
+    return list(itertools.pairwise(bounds))
+
+
+def _prt_chunks(
+    prtfile: str, nchunks: int
+) -> Iterator[tuple[bytes | mmap.mmap, int, int]]:
+    """Yield chunks of a PRT file as (buffer, start, end), cut at line
+    boundaries.
+
+    Plain files are memory mapped and split into nchunks chunks. Gzipped
+    files are decompressed as a stream, in pieces of about GZ_CHUNKSIZE bytes.
+    """
+    if prtfile.endswith(".gz"):
+        with gzip.open(prtfile, "rb") as gz_fh:
+            remainder = b""
+            while piece := gz_fh.read(GZ_CHUNKSIZE):
+                piece = remainder + piece
+                cut = piece.rfind(b"\n") + 1
+                remainder = piece[cut:]
+                if cut:
+                    yield piece, 0, cut
+            if remainder:
+                yield remainder, 0, len(remainder)
+        return
+    if Path(prtfile).stat().st_size == 0:
+        return
+    with (
+        Path(prtfile).open("rb") as prt_fh,
+        mmap.mmap(prt_fh.fileno(), 0, access=mmap.ACCESS_READ) as prt_map,
+    ):
+        for start, end in _line_chunks(prt_map, nchunks):
+            yield prt_map, start, end
+
+
+def _parse_prt_chunks(
+    prtfile: str, fipnames: list[str] | None, processes: int
+) -> Iterator[dict]:
+    """Parse the chunks of a PRT file, optionally in a process pool.
+
+    Yields the parsed chunks in file order. Memory mapped chunks
+    are mapped again in the subprocesses, gzipped chunks are sent over to
+    them. The number of chunks in flight is bounded to limit memory usage.
+    """
+    if processes <= 1:
+        for buffer, start, end in _prt_chunks(prtfile, 1):
+            yield _parse_chunk(buffer, fipnames, start, end)
+        return
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending: collections.deque = collections.deque()
+        for buffer, start, end in _prt_chunks(prtfile, processes):
+            if isinstance(buffer, mmap.mmap):
+                future = executor.submit(
+                    _parse_prtfile_chunk, prtfile, fipnames, start, end
+                )
+            else:
+                future = executor.submit(_parse_chunk, buffer, fipnames, start, end)
+            pending.append(future)
+            if len(pending) > 2 * processes:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def df(
+    prtfile: str | ResdataFiles,
+    fipname: str | list[str] = "FIPNUM",
+    processes: int = 1,
+) -> pd.DataFrame:
     """
     Parses a PRT file from and finds FIPXXXX REGION REPORT blocks and
     organizes those numbers into a dataframe
 
     Each row in the dataframe represents one parsed line in the PRT file, with
-    DATE and region index added.
+    DATE, FIPNAME and region index added.
+
+    Several region report families are collected in one pass through the
+    PRT file when a list of names is given. Gzipped PRT files are
+    decompressed on the fly.
 
     Args:
-        prtfile: filename (PRT) or a ResdataFiles object
+        prtfile: filename (PRT or PRT.gz) or a ResdataFiles object
         fipname: The name of the regport regions, FIPNUM, FIPZON or whatever
             Max length of the string is 8, the first three characters must be FIP,
             and the next 3 characters must be unique for a given :term:`.DATA file`.
+            Can also be a list of such names, or "all" for every region
+            report found in the file.
+        processes: Number of processes to parse chunks of the PRT file in.
     """
     if isinstance(prtfile, ResdataFiles):
         prtfile = prtfile.get_prtfilename()
-    if not fipname.startswith("FIP"):
-        raise ValueError("fipname must start with FIP")
-    if len(fipname) > 8:
-        raise ValueError("fipname can be at most 8 characters")
+    fipnames = [fipname] if isinstance(fipname, str) else list(fipname)
+    if "all" not in fipnames:
+        for name in fipnames:
+            if not name.startswith("FIP"):
+                raise ValueError("fipname must start with FIP")
+            if len(name) > 8:
+                raise ValueError("fipname can be at most 8 characters")
+    logger.info(
+        "Parsing file %s for blocks starting with %s REPORT REGION",
+        prtfile,
+        " or ".join(fipnames),
+    )
 
     # List of rows in final dataframe
-    records = []
+    records: list[list] = []
 
-    # State variables while parsing line by line:
+    # State variables carried from one chunk to the next:
     in_report_block = False
+    region_fipname = None
     region_index = None
     date = None
 
-    ecl_datematcher = re.compile(r"\s\sREPORT\s+\d+\s+(\d+)\s+(\w+)\s+(\d+)")
-    opm_datematcher = re.compile(r"Starting time step.*? date = (\d+)-(\w+)-(\d+)\s*")
-
-    # When case insensitive, this one works with both Eclipse100 and OPM:
-    reportblockmatcher = re.compile(
-        ".+" + fipname + r"\s+REPORT\s+REGION\s+(\d+)", re.IGNORECASE
+    chunks = _parse_prt_chunks(
+        str(prtfile), None if "all" in fipnames else fipnames, processes
     )
-
-    with Path(prtfile).open(encoding="utf-8") as prt_fh:
-        logger.info(
-            "Parsing file %s for blocks starting with %s REPORT REGION",
-            prtfile,
-            fipname,
-        )
-        for line in prt_fh:
-            matcheddate = re.match(ecl_datematcher, line)
-            if matcheddate is None:
-                matcheddate = re.match(opm_datematcher, line)
-            if matcheddate is not None:
-                newdate = datetime.date(
-                    year=int(matcheddate.group(3)),
-                    month=parse_month(matcheddate.group(2).upper()),
-                    day=int(matcheddate.group(1)),
-                )
-                if newdate != date:
-                    date = newdate
-                    logger.debug("Found date: %s", date)
-                continue
-            matchedreportblock = re.match(reportblockmatcher, line)
-            if matchedreportblock:
-                in_report_block = True
-                region_index = int(matchedreportblock.group(1))
-                logger.debug("  Region report for region %s", region_index)
-                continue
-            if line.startswith(" ============================"):
-                in_report_block = False
-                continue
-
-            if in_report_block:
-                interesting_strings = ["IN PLACE", "OUTFLOW", "MATERIAL"]
-                if not sum(string in line.upper() for string in interesting_strings):
-                    # Skip if we are not on an interesting line.
-                    continue
-
-                # The colons in the report block are not reliably included
-                # (differs by Eclipse version), even in the same PRT file. We
-                # insert them in fixed positions and hope for the best (if the
-                # ASCII table is actually dynamic with respect to content, this
-                # will fail)
-                line = line.strip()
-                if line[0] != ":":
-                    line = ":" + line
-                # There should another colon somewhere between 25 - 27
-                # (depend on OPM/Eclipse version)
-                if ":" not in line[25:27] and len(line) > 26:
-                    linechars = list(line)
-                    linechars[26] = ":"
-                    line = "".join(linechars)
-
-                records.append(
-                    [date, fipname, region_index, *list(report_block_lineparser(line))]
-                )
+    for chunk in chunks:
+        rows = chunk["rows"]
+        if in_report_block:
+            for row in chunk["head"]:
+                row[1:3] = region_fipname, region_index
+            rows = chunk["head"] + rows
+        for row in rows:
+            if row[0] is None:
+                row[0] = date
+        records.extend(rows)
+        if chunk["date"] is not None:
+            date = chunk["date"]
+        if chunk["state"] is not None:
+            in_report_block, region_fipname, region_index = chunk["state"]
     return pd.DataFrame(data=records, columns=REGION_REPORT_COLUMNS)
 
 
@@ -197,8 +400,18 @@ def fill_parser(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
     parser.add_argument(
         "--fipname",
         type=str,
-        help="Region parameter name of interest",
-        default="FIPNUM",
+        nargs="+",
+        help=(
+            "Region parameter name(s) of interest, or 'all' for every "
+            "region report in the PRT file"
+        ),
+        default=["FIPNUM"],
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        help="Number of processes for parsing chunks of the PRT file",
+        default=1,
     )
     parser.add_argument(
         "-o", "--output", type=str, help="Output CSV filename", default="outflow.csv"
@@ -211,9 +424,9 @@ def fill_parser(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
 def fipreports_main(args: argparse.Namespace) -> None:
     """Command line API"""
     logger = getLogger_res2csv(__name__, vars(args))
-    if args.PRTFILE.endswith(".PRT"):
+    if args.PRTFILE.endswith((".PRT", ".PRT.gz")):
         prtfile = args.PRTFILE
     else:
         prtfile = ResdataFiles(args.PRTFILE).get_prtfilename()
-    dframe = df(prtfile, args.fipname)
+    dframe = df(prtfile, args.fipname, processes=args.processes)
     write_dframe_stdout_file(dframe, args.output, index=False, caller_logger=logger)
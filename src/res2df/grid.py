@@ -13,8 +13,8 @@ file.
 import argparse
 import datetime
 import fnmatch
+import itertools
 import logging
-import textwrap
 from pathlib import Path
 
 import dateutil.parser
@@ -28,14 +28,19 @@ from .__version__ import __version__
 from .common import (
     comment_formatter,
     merge_zones,
-    runlength_compress,
     write_dframe_stdout_file,
+    write_inc_stdout_file,
 )
+from .common import fill_reverse_parser as common_fill_reverse_parser
+from .constants import MAGIC_STDOUT
 from .res2csvlogger import getLogger_res2csv
 from .resdatafiles import ResdataFiles
 
 logger = logging.getLogger(__name__)
 
+# Columns in grid dataframes that are not grid keywords to be exported
+NONKEYWORD_COLUMNS = ["I", "J", "K", "X", "Y", "Z", "VOLUME", "GLOBAL_INDEX"]
+
 
 def get_available_rst_dates(resdatafiles: ResdataFiles) -> list[datetime.date]:
     """Return a list of datetime objects for the available dates in the RST file"""
@@ -587,6 +592,22 @@ def fill_parser(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
     return parser
 
 
+def fill_reverse_parser(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """Fill a parser for the operation dataframe -> resdata :term:`include file`"""
+    common_fill_reverse_parser(parser, "grid", "grid.inc")
+    parser.add_argument(
+        "--dtype",
+        choices=["int", "float"],
+        help="Convert the keywords to integer or floating point data",
+    )
+    parser.add_argument(
+        "--binary",
+        action="store_true",
+        help="Write the keywords in binary resdata format instead of text",
+    )
+    return parser
+
+
 def drop_constant_columns(
     dframe: pd.DataFrame, alwayskeep: str | list[str] | None = None
 ) -> pd.DataFrame:
@@ -620,6 +641,56 @@ def drop_constant_columns(
     return dframe.drop(columnstodelete, axis=1)
 
 
+def _runlength_lines(vector: np.ndarray, indent: int = 5, width: int = 70) -> str:
+    """Format a vector as run-length encoded text lines for a grid keyword.
+
+    Repeated consecutive values are compressed to ``count*value`` as in
+    :func:`res2df.common.runlength_compress`, and the tokens are wrapped into
+    lines of at most ``width`` characters like :func:`textwrap.wrap` would do
+    with two spaces between the tokens. Runs are found on the array, and only
+    one value per run is converted to a string.
+
+    Args:
+        vector: One value for every cell in the grid.
+        indent: Number of spaces to start every line with.
+        width: Maximal line width, including the indentation.
+
+    Returns:
+        The lines, separated by newlines, without a trailing newline.
+    """
+    if len(vector) == 0:
+        return ""
+    changed = vector[1:] != vector[:-1]
+    if vector.dtype.kind == "f":
+        # NaNs are equal to each other, and -0.0 differs from 0.0 when printed:
+        changed &= ~(np.isnan(vector[1:]) & np.isnan(vector[:-1]))
+        changed |= np.signbit(vector[1:]) != np.signbit(vector[:-1])
+    starts = np.concatenate(([0], np.flatnonzero(changed) + 1))
+    counts = np.diff(np.append(starts, len(vector)))
+    tokens = vector[starts].astype(str)
+    repeated = counts > 1
+    tokens[repeated] = np.char.add(
+        np.char.add(counts[repeated].astype(str), "*"), tokens[repeated]
+    )
+
+    # Greedy line filling: the tokens from start to end (exclusive) fit on
+    # one line if their lengths and the separators sum to at most the width.
+    offsets = np.concatenate(([0], np.cumsum(np.char.str_len(tokens) + 2)))
+    linefill = width - indent + 2
+    line_ends = np.searchsorted(offsets, offsets[:-1] + linefill, side="right") - 1
+    line_ends = np.maximum(line_ends, np.arange(1, len(tokens) + 1)).tolist()
+    separators = ["  "] * len(tokens)
+    newline = "\n" + " " * indent
+    token_idx = line_ends[0]
+    while token_idx < len(tokens):
+        separators[token_idx - 1] = newline
+        token_idx = line_ends[token_idx]
+    separators[-1] = ""
+    return " " * indent + "".join(
+        itertools.chain.from_iterable(zip(tokens.tolist(), separators, strict=True))
+    )
+
+
 def df2res(
     grid_df: pd.DataFrame,
     keywords: str | list[str],
@@ -627,6 +698,7 @@ def df2res(
     dtype: type | None = None,
     filename: str | None = None,
     nocomments: bool = False,
+    binary: bool = False,
 ) -> str:
     """
     Write a :term:`include file` contents with grid data keyword, like PERMX, PORO,
@@ -661,7 +733,14 @@ def df2res(
             written to this filename.
         nocomments: Set to True to avoid any comments being written. Defaults
             to False.
+        binary: Set to True to write the keywords in binary (unformatted)
+            resdata format to ``filename`` instead of text. Integer data is
+            written as INTE and floating point data as REAL, determined from
+            ``dtype`` or from the dataframe column if ``dtype`` is not given.
+            Nothing is returned in this case.
     """
+    if binary and filename is None:
+        raise ValueError("A filename is required for binary output")
     if isinstance(keywords, str):
         keywords = [keywords]
 
@@ -706,6 +785,7 @@ def df2res(
     if not nocomments:
         string += comment_formatter(res2df_header)
     string += "\n"
+    binary_keywords: list[tuple[str, np.ndarray]] = []
 
     # If we have NaNs in the dataframe, we will be more careful (costs memory)
     if grid_df.isna().any().any():
@@ -732,16 +812,16 @@ def df2res(
                 global_size,
             )
             logger.warning("Data will be dumped, but may error in simulator")
-        strvector = "  ".join([str(x) for x in vector])
-        strvector = runlength_compress(strvector)
-
+        if binary:
+            if dtype is int or (
+                dtype is not float and pd.api.types.is_integer_dtype(grid_df[keyword])
+            ):
+                binary_keywords.append((keyword.ljust(8), vector.astype(np.int32)))
+            else:
+                binary_keywords.append((keyword.ljust(8), vector.astype(np.float32)))
+            continue
         string += keyword + "\n"
-        indent = " " * 5
-        string += "\n".join(
-            textwrap.wrap(
-                strvector, initial_indent=indent, subsequent_indent=indent, width=70
-            )
-        )
+        string += _runlength_lines(vector)
         string += "\n/"
         if not nocomments:
             string += (
@@ -752,6 +832,9 @@ def df2res(
 
     if filename is not None:
         Path(filename).parent.mkdir(parents=True, exist_ok=True)
+        if binary:
+            resfo.write(filename, binary_keywords)
+            return ""
         Path(filename).write_text(string, encoding="utf-8")
     return string
 
@@ -770,3 +853,25 @@ def grid_main(args: argparse.Namespace) -> None:
     if args.arrow:
         grid_df = _df2pyarrow(grid_df)
     write_dframe_stdout_file(grid_df, args.output, index=False, caller_logger=logger)
+
+
+def grid_reverse_main(args: argparse.Namespace) -> None:
+    """For command line utility for CSV to resdata"""
+    logger = getLogger_res2csv(__name__, vars(args))
+    grid_df = pd.read_csv(args.csvfile)
+    logger.info("Parsed %s", args.csvfile)
+    keywords = args.keywords or [
+        col
+        for col in grid_df.columns
+        if col not in NONKEYWORD_COLUMNS
+        and "@" not in col
+        and pd.api.types.is_numeric_dtype(grid_df[col])
+    ]
+    if args.binary:
+        if args.output == MAGIC_STDOUT:
+            raise ValueError("Binary output can not be written to stdout")
+        df2res(grid_df, keywords, dtype=args.dtype, filename=args.output, binary=True)
+        print(f"Wrote to {args.output}")
+        return
+    inc_string = df2res(grid_df, keywords, dtype=args.dtype)
+    write_inc_stdout_file(inc_string, args.output)
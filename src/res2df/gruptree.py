@@ -27,7 +27,7 @@ logger = logging.getLogger(__name__)
 
 
 def df(
-    deck: "ResdataFiles | opm.opmcommon_python.Deck",
+    deck: "ResdataFiles | opm.opmcommon_python.Deck | list",
     startdate: datetime.date | None = None,
     welspecs: bool = True,
 ) -> pd.DataFrame:
@@ -51,7 +51,8 @@ def df(
     startdate is only relevant when START is not in the :term:`deck`.
 
     Args:
-        deck: opm.io Deck object or ResdataFiles
+        deck: opm.io Deck object or ResdataFiles, or a list of
+            the deck keywords in deck order.
 
     Returns:
         pd.DataFrame with one row pr edge. Empty dataframe if no
@@ -61,8 +62,11 @@ def df(
     date: datetime.date | None
     date = startdate if startdate is not None else None
 
-    if not isinstance(deck, (ResdataFiles, opm.opmcommon_python.Deck)):
-        raise TypeError("Input deck must be either ResdataFiles or an opm Deck.")
+    if not isinstance(deck, (ResdataFiles, opm.opmcommon_python.Deck, list)):
+        raise TypeError(
+            "Input deck must be either ResdataFiles or an opm Deck, "
+            "or a list of deck keywords."
+        )
 
     if isinstance(deck, ResdataFiles):
         deck = deck.get_deck()
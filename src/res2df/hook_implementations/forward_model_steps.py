@@ -89,6 +89,54 @@ comment. For more options, use ``<XARG3>`` etc.
         )
 
 
+class Res2CsvAll(ForwardModelStepPlugin):
+    def __init__(self) -> None:
+        super().__init__(
+            name="RES2CSV_ALL",
+            command=[
+                shutil.which("res2csv"),
+                "all",
+                "--verbose",
+                "--extractors",
+                "<EXTRACTORS>",
+                "--output",
+                "<OUTPUTDIR>",
+                *[f"<XARG{num + 1}>" for num in range(10)],
+                "--",
+                "<ECLBASE>",
+            ],
+            default_mapping={
+                "<EXTRACTORS>": "all",
+                "<OUTPUTDIR>": ".",
+                **{f"<XARG{num + 1}>": "" for num in range(10)},
+            },
+        )
+
+    @staticmethod
+    def documentation() -> ForwardModelStepDocumentation | None:
+        return ForwardModelStepDocumentation(
+            description="""Run several ``res2csv`` subcommands in one go, with the
+command line utility ``res2csv all``. The deck is parsed only once and
+binary output files are opened only once, which is much faster than one
+``RES2CSV`` step pr. subcommand.
+
+Each extractor writes its data to ``<OUTPUTDIR>/<extractor>.csv``. The extractors
+run with their default options, use ``RES2CSV`` when you need to supply options
+to a specific subcommand. Options to ``res2csv all`` itself, like ``--arrow``,
+can be supplied through the arguments ``<XARGn>`` where ``n`` goes from 1 to 10.
+
+For more documentation, see https://equinor.github.io/res2df/.
+""",
+            category="utility.eclipse",
+            examples="""Exporting well connections, well controls, the group tree and
+RFT data to a directory named share/results/tables::
+
+   FORWARD_MODEL RES2CSV_ALL(<EXTRACTORS>="compdat,wcon,gruptree,rft", \
+     <OUTPUTDIR>=share/results/tables)
+""",
+        )
+
+
 class Csv2Res(ForwardModelStepPlugin):
     def __init__(self) -> None:
         super().__init__(
@@ -138,4 +186,4 @@ as the OUTPUT argument.""",
 
 @ert_plugin(name="RES2CSV")
 def installable_forward_model_steps() -> list[type[ForwardModelStepPlugin]]:
-    return [Res2Csv, Csv2Res]
+    return [Res2Csv, Res2CsvAll, Csv2Res]
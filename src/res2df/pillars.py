@@ -5,9 +5,10 @@ import datetime
 import logging
 
 import dateutil.parser
+import numpy as np
 import pandas as pd
 
-from .common import stack_on_colnames, write_dframe_stdout_file
+from .common import grouping_indices, write_dframe_stdout_file
 from .grid import dates2rstindices
 from .grid import df as create_grid_df
 from .res2csvlogger import getLogger_res2csv
@@ -43,6 +44,7 @@ def df(
     sgascutoff: float = 0.7,
     swatcutoff: float = 0.7,
     stackdates: bool = False,
+    pillarlabels: bool = True,
 ) -> pd.DataFrame:
     """Produce a dataframe with pillar information
 
@@ -80,6 +82,8 @@ def df(
         stackdates: If true, a column
             called DATE will be added and data for all restart
             dates will be added in a stacked manner.
+        pillarlabels: If true, the PILLAR column contains strings like "I-J".
+            If false, PILLAR is the integer (J - 1) * NX + I.
     """
     # List of vectors we want, conservative in order to save memory and cputime:
     vectors = []
@@ -92,7 +96,9 @@ def df(
 
     rstdates_iso = dates2rstindices(resdatafiles, rstdates)[2]
 
-    grid_df["PILLAR"] = grid_df["I"].astype(str) + "-" + grid_df["J"].astype(str)
+    # Pillars are grouped by integer keys, the strings are only made for output:
+    nx = resdatafiles.get_egrid().get_nx()
+    grid_df["PILLAR"] = pillar_keys(grid_df, nx)
     logger.info("Computing pillar statistics")
     groupbies = ["PILLAR"]
     if region:
@@ -102,43 +108,252 @@ def df(
             groupbies.append(region)
             grid_df[region] = grid_df[region].astype(int)
 
-    for datestr in rstdates_iso:
-        logger.info("Dynamic volumes for %s", datestr)
-        volumes = compute_volumes(grid_df, datestr=datestr)
-        grid_df = pd.concat([grid_df, volumes], axis="columns", sort=False)
-
     aggregators = {
-        key: AGGREGATORS[key.split("@")[0]]
-        for key in grid_df.columns
-        if key.split("@")[0] in AGGREGATORS
+        key: AGGREGATORS[key] for key in grid_df.columns if key in AGGREGATORS
     }
 
-    # Group over PILLAR and possibly regions:
-    grouped = (grid_df.groupby(groupbies).agg(aggregators)).reset_index()
+    # Group over PILLAR and possibly regions. The grid frame has one row
+    # pr. active cell, so the cached grouping of the active cells is reused:
+    try:
+        if len(grid_df) != resdatafiles.get_egrid().get_num_active():
+            raise ValueError("Grid data does not match the active cells")
+        order, starts, grouped = resdatafiles.get_cell_grouping(groupbies)
+        grouped = grouped.astype({col: grid_df[col].dtype for col in groupbies})
+    except (KeyError, ValueError):
+        order, starts = grouping_indices(
+            *(grid_df[col].to_numpy() for col in groupbies)
+        )
+        grouped = grid_df[groupbies].iloc[order[starts]].reset_index(drop=True)
+    for column, aggregator in aggregators.items():
+        grouped[column] = _reduce_groups(grid_df[column], order, starts, aggregator)
+
+    # Volumes and contacts for all dates at once, as (groups x dates) arrays
+    # in the same group order as the static aggregation above:
+    volumes, contacts = compute_pillar_dynamics(
+        grid_df,
+        groupbies,
+        rstdates_iso,
+        soilcutoff=soilcutoff,
+        sgascutoff=sgascutoff,
+        swatcutoff=swatcutoff,
+        grouping=(order, starts),
+    )
+
+    if pillarlabels:
+        grouped["PILLAR"] = pillar_labels(grouped["PILLAR"], nx)
 
+    if stackdates and rstdates_iso:
+        ndates = len(rstdates_iso)
+        stacked = grouped.iloc[np.repeat(np.arange(len(grouped)), ndates)]
+        stacked = stacked.reset_index(drop=True)
+        stacked.insert(
+            0, "DATE", np.tile(np.array(rstdates_iso, dtype=object), len(grouped))
+        )
+        columns = {name: values.ravel() for name, values in volumes.items()}
+        if "PORV" in stacked and "VOLUME" in stacked:
+            columns["PORO"] = (stacked["PORV"] / stacked["VOLUME"]).to_numpy()
+        columns.update({name: values.ravel() for name, values in contacts.items()})
+        return pd.concat(
+            [stacked, pd.DataFrame(columns, index=stacked.index)], axis="columns"
+        )
+
+    columns = _columns_at_dates(volumes, rstdates_iso)
     # Compute correct pillar averaged porosity (from bulk)
     if "PORV" in grouped and "VOLUME" in grouped:
-        grouped["PORO"] = grouped["PORV"] / grouped["VOLUME"]
-
-    # Compute contacts:
-    for datestr in rstdates_iso:
-        if "SWAT@" + datestr in grid_df and (
-            "SOIL@" + datestr in grid_df or "SGAS@" + datestr in grid_df
-        ):
-            contacts = compute_pillar_contacts(
-                grid_df,
-                region=region,
-                soilcutoff=soilcutoff,
-                sgascutoff=sgascutoff,
-                swatcutoff=swatcutoff,
-                datestr=datestr,
-            )
-            if not contacts.empty:
-                grouped = grouped.merge(contacts, how="left")
+        columns["PORO"] = (grouped["PORV"] / grouped["VOLUME"]).to_numpy()
+    columns.update(_columns_at_dates(contacts, rstdates_iso))
+    return pd.concat(
+        [grouped, pd.DataFrame(columns, index=grouped.index)], axis="columns"
+    )
+
+
+def _reduce_groups(
+    values: pd.Series, order: np.ndarray, starts: np.ndarray, aggregator: str
+) -> np.ndarray:
+    """Sum or average values over groups of sorted rows, skipping NaN
+    like DataFrame.groupby()"""
+    sorted_values = values.to_numpy(dtype=float)[order]
+    isvalue = ~np.isnan(sorted_values)
+    if not len(starts):
+        return np.zeros(0)
+    sums = np.add.reduceat(np.where(isvalue, sorted_values, 0), starts)
+    if aggregator == "sum":
+        return sums
+    counts = np.add.reduceat(isvalue, starts)
+    with np.errstate(invalid="ignore"):
+        return sums / counts
+
+
+def _columns_at_dates(
+    data: dict[str, np.ndarray], datestrs: list[str]
+) -> dict[str, np.ndarray]:
+    """Split (groups x dates) arrays into columns named like OWC@2000-01-01,
+    ordered by date. Columns with only NaN are not included."""
+    return {
+        f"{name}@{datestr}": values[:, dateidx]
+        for dateidx, datestr in enumerate(datestrs)
+        for name, values in data.items()
+        if not np.isnan(values[:, dateidx]).all()
+    }
+
+
+def compute_pillar_dynamics(
+    grid_df: pd.DataFrame,
+    groupbies: list[str],
+    datestrs: list[str],
+    soilcutoff: float = 0.2,
+    sgascutoff: float = 0.7,
+    swatcutoff: float = 0.7,
+    grouping: tuple[np.ndarray, np.ndarray] | None = None,
+) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray]]:
+    """Compute dynamic volumes and contacts pr. pillar for several dates at once
+
+    The saturations for all dates are kept as (cells x dates) arrays, sorted
+    by the group keys, and reduced over each group with segmented sums and
+    maxima. The results are the same as from compute_volumes() summed over
+    each group, and compute_pillar_contacts(), for each date.
+
+    Args:
+        grid_df: Grid data with Z, PORV and the group keys, and SWAT, SGAS,
+            1OVERBO and 1OVERBG with the date appended like SWAT@2000-01-01.
+        groupbies: Integer columns to group by, typically PILLAR and a region.
+            The groups are sorted by these.
+        datestrs: ISO-8601 dates to compute for
+        soilcutoff: See compute_pillar_contacts()
+        sgascutoff: See compute_pillar_contacts()
+        swatcutoff: See compute_pillar_contacts()
+        grouping: Sort permutation and group starts for the rows in grid_df,
+            like from grouping_indices() or ResdataFiles.get_cell_grouping().
+            Computed from the groupbies columns if not given.
+
+    Returns:
+        Two dictionaries with volumes (WATVOL, GASVOL, OILVOL, OILVOLSURF and
+        GASVOLSURF) and contacts (OWC and GOC), each value an array with one
+        row pr. group and one column pr. date. Values are NaN when not
+        computable for the group and date, and vectors not available for
+        any date are not included.
+    """
+    assert 0 <= swatcutoff <= 1
+    assert 0 <= soilcutoff <= 1
+    assert 0 <= sgascutoff <= 1
+
+    # Same as in compute_pillar_contacts():
+    epsilon_soil = 0.01
+
+    if grid_df.empty:
+        return {}, {}
+    if grouping is None:
+        grouping = grouping_indices(*(grid_df[col].to_numpy() for col in groupbies))
+    order, starts = grouping
+
+    def cell_array(vector: str) -> tuple[np.ndarray, np.ndarray]:
+        """Sorted (cells x dates) array for a vector, and its presence pr date"""
+        present = np.array([f"{vector}@{datestr}" in grid_df for datestr in datestrs])
+        values = np.full((len(order), len(datestrs)), np.nan)
+        for dateidx in np.flatnonzero(present):
+            values[:, dateidx] = grid_df[f"{vector}@{datestrs[dateidx]}"].to_numpy(
+                dtype=float
+            )[order]
+        return values, present
+
+    def group_sum(values: np.ndarray, present: np.ndarray) -> np.ndarray:
+        sums = np.add.reduceat(np.nan_to_num(values), starts, axis=0)
+        sums[:, ~present] = np.nan
+        return sums
+
+    def group_any(condition: np.ndarray) -> np.ndarray:
+        return np.logical_or.reduceat(condition, starts, axis=0)
+
+    def group_max_z(condition: np.ndarray) -> np.ndarray:
+        maxz = np.fmax.reduceat(
+            np.where(condition, zvalues[:, np.newaxis], -np.inf), starts, axis=0
+        )
+        maxz[~group_any(condition)] = np.nan
+        return maxz
+
+    swat, swat_present = cell_array("SWAT")
+    sgas, sgas_present = cell_array("SGAS")
+    soil = 1 - swat - np.where(sgas_present, sgas, 0)
+    soil_present = swat_present
+
+    volumes: dict[str, np.ndarray] = {}
+    contacts: dict[str, np.ndarray] = {}
+    if not (swat_present.any() or sgas_present.any()):
+        return volumes, contacts
+
+    porv = grid_df["PORV"].to_numpy(dtype=float)[order, np.newaxis]
+    oneoverbo, oneoverbo_present = cell_array("1OVERBO")
+    oneoverbg, oneoverbg_present = cell_array("1OVERBG")
+    dynamic_volumes = {
+        "WATVOL": (swat * porv, swat_present),
+        "GASVOL": (sgas * porv, sgas_present),
+        "OILVOL": (soil * porv, soil_present),
+        "OILVOLSURF": (soil * porv * oneoverbo, soil_present & oneoverbo_present),
+        "GASVOLSURF": (sgas * porv * oneoverbg, sgas_present & oneoverbg_present),
+    }
+    volumes.update(
+        (name, group_sum(values, present))
+        for name, (values, present) in dynamic_volumes.items()
+        if present.any()
+    )
+
+    if not swat_present.any():
+        return volumes, contacts
+    if "Z" not in grid_df:
+        raise KeyError("Z column must be present in dataframe")
+    zvalues = grid_df["Z"].to_numpy(dtype=float)[order]
+
+    # Only pillars with water in them can have an OWC:
+    waterpillars = group_any(swat > swatcutoff)
+    owc = np.full(waterpillars.shape, np.nan)
+    goc = np.full(waterpillars.shape, np.nan)
+    if soilcutoff:
+        owc = group_max_z(soil > soilcutoff)
+        owc[~waterpillars] = np.nan
+    if sgascutoff:
+        # Only count gas with a minute oil saturation, not gas in water:
+        goc = group_max_z((sgas > sgascutoff) & (soil > epsilon_soil))
+    owc[:, ~swat_present] = np.nan
+    goc[:, ~(swat_present & sgas_present)] = np.nan
+
+    # OWC and GOC are joined for dates where both are found, only
+    # keeping the groups with both contacts:
+    both = ~np.isnan(owc).all(axis=0) & ~np.isnan(goc).all(axis=0)
+    missing = np.isnan(owc) | np.isnan(goc)
+    owc[missing & both] = np.nan
+    goc[missing & both] = np.nan
+
+    contacts.update(
+        (name, values)
+        for name, values in {"OWC": owc, "GOC": goc}.items()
+        if not np.isnan(values).all()
+    )
+    return volumes, contacts
 
-    if stackdates:
-        return stack_on_colnames(grouped, sep="@", stackcolname="DATE", inplace=True)
-    return grouped
+
+def pillar_keys(grid_df: pd.DataFrame, nx: int | None = None) -> pd.Series:
+    """Compute an integer pillar key for each cell, (J - 1) * NX + I
+
+    Args:
+        grid_df: Dataframe with the columns I and J
+        nx: Number of cells in the I direction. If not given, the largest
+            I in grid_df is used.
+    """
+    if nx is None:
+        nx = int(grid_df["I"].max())
+    return (grid_df["J"].astype(np.int64) - 1) * nx + grid_df["I"].astype(np.int64)
+
+
+def pillar_labels(keys: pd.Series, nx: int) -> pd.Series:
+    """Convert integer pillar keys from pillar_keys() to strings like "I-J"
+
+    Args:
+        keys: Integer pillar keys
+        nx: The number of cells in the I direction used for the keys.
+    """
+    i_index = (keys - 1) % nx + 1
+    j_index = (keys - 1) // nx + 1
+    return i_index.astype(str) + "-" + j_index.astype(str)
 
 
 def compute_volumes(grid_df: pd.DataFrame, datestr: str | None = None) -> pd.DataFrame:
@@ -202,7 +417,8 @@ def compute_pillar_contacts(
     Requires the columns PILLAR, SOIL, SGAS and SWAT, I, J and Z
 
     SOIL should be pre-computed in three-phase runs before calling this.
-    PILLAR must be pre-computed in grid_df.
+    If PILLAR is not in grid_df, it is computed from I and J, and returned
+    as strings like "I-J".
 
     OWC is deepest cell centre pr. pillar with oil saturation above soilcutoff,
     among those pillars with at least one cell above swatcutoff.
@@ -224,7 +440,7 @@ def compute_pillar_contacts(
         swatcutoff: Pillars must have this amount of water in (in one cell)
             them to be available for OWC/GWC computations.
     Returns:
-        Index is PILLAR with values I-J. Rows only for
+        Dataframe with PILLAR, and region if given. Rows only for
         pillars where a contact was found. Empty dataframe if no contacts found.
     """
     assert 0 <= swatcutoff <= 1
@@ -245,13 +461,24 @@ def compute_pillar_contacts(
         return pd.DataFrame()
     logger.info("Computing contacts pr. pillar")
     groupbies = ["PILLAR"]
-    if "PILLAR" not in grid_df:
-        grid_df["PILLAR"] = grid_df["I"].astype(str) + "-" + grid_df["J"].astype(str)
 
     if "Z" not in grid_df:
         # To ensure same exception across Python 3.x:
         raise KeyError("Z column must be present in dataframe")
 
+    nx = None
+    if "PILLAR" not in grid_df:
+        # Group on integer keys, convert to string labels at the end:
+        nx = int(grid_df["I"].max())
+        columns = ["Z"] + [
+            vector + atdatestr
+            for vector in ["SWAT", "SOIL", "SGAS"]
+            if vector + atdatestr in grid_df
+        ]
+        if region:
+            columns.append(region)
+        grid_df = grid_df[columns].assign(PILLAR=pillar_keys(grid_df, nx))
+
     if region:
         groupbies.append(region)
     owc = pd.DataFrame()
@@ -312,10 +539,14 @@ def compute_pillar_contacts(
     if owc.empty and goc.empty:
         return pd.DataFrame()
     if not owc.empty and goc.empty:
-        return owc
-    if owc.empty and not goc.empty:
-        return goc
-    return owc.merge(goc)
+        contacts = owc
+    elif owc.empty and not goc.empty:
+        contacts = goc
+    else:
+        contacts = owc.merge(goc)
+    if nx is not None:
+        contacts["PILLAR"] = pillar_labels(contacts["PILLAR"], nx)
+    return contacts
 
 
 def fill_parser(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
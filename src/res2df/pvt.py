@@ -6,6 +6,7 @@ Data can be extracted from a complete deck or from individual files.
 
 import argparse
 import logging
+from collections.abc import Callable
 from pathlib import Path
 from typing import cast
 
@@ -15,6 +16,7 @@ import pandas as pd
 
 from .common import (
     comment_formatter,
+    fixed_width_tables,
     handle_wanted_keywords,
     keyworddata_to_df,
     write_dframe_stdout_file,
@@ -351,6 +353,7 @@ def df2res(
         supported=SUPPORTED_KEYWORDS,
         consecutive="PVTNUM",
         filename=filename,
+        writers=DF2RES_WRITERS,
     )
 
 
@@ -520,27 +523,12 @@ def df2res_pvdg(dframe: pd.DataFrame, comment: str | None = None) -> str:
             return ""
         subset["PVTNUM"] = 1
 
-    def _pvdg_pvtnum(dframe: pd.DataFrame) -> str:
-        """Create string with :term:`include file` contents for
-        PVDG-data with a specific PVTNUM
-
-        Args:
-            dframe (pd.DataFrame): Cropped to only contain the relevant data.
-
-        Returns:
-            string
-        """
-        string = ""
-        dframe = dframe.sort_values("PRESSURE")
-        for _, row in dframe.iterrows():
-            string += f"  {row['PRESSURE']:20.7f} {row['VOLUMEFACTOR']:20.7f} "
-            string += f"{row['VISCOSITY']:20.7f}\n"
-        return string + "/\n"
-
     subset = subset.set_index("PVTNUM").sort_index()
-    for pvtnum in subset.index.unique():
+    for pvtnum, table in fixed_width_tables(
+        subset, ["PRESSURE", "VOLUMEFACTOR", "VISCOSITY"], "PRESSURE"
+    ):
         string += f"-- PVTNUM: {pvtnum}\n"
-        string += _pvdg_pvtnum(subset[subset.index == pvtnum])
+        string += table + "/\n"
 
     return string + "\n"
 
@@ -565,27 +553,12 @@ def df2res_pvdo(dframe: pd.DataFrame, comment: str | None = None) -> str:
             return ""
         subset["PVTNUM"] = 1
 
-    def _pvdo_pvtnum(dframe: pd.DataFrame) -> str:
-        """Create string with :term:`include file` contents
-        for PVDO-data for a specific PVTNUM
-
-        Args:
-            dframe (pd.DataFrame): Cropped to only contain the relevant data.
-
-        Returns:
-            string
-        """
-        string = ""
-        dframe = dframe.sort_values("PRESSURE")
-        for _, row in dframe.iterrows():
-            string += f"  {row['PRESSURE']:20.7f} {row['VOLUMEFACTOR']:20.7f} "
-            string += f"{row['VISCOSITY']:20.7f}\n"
-        return string + "/\n"
-
     subset = subset.set_index("PVTNUM").sort_index()
-    for pvtnum in subset.index.unique():
+    for pvtnum, table in fixed_width_tables(
+        subset, ["PRESSURE", "VOLUMEFACTOR", "VISCOSITY"], "PRESSURE"
+    ):
         string += f"-- PVTNUM: {pvtnum}\n"
-        string += _pvdo_pvtnum(subset[subset.index == pvtnum])
+        string += table + "/\n"
 
     return string + "\n"
 
@@ -643,3 +616,15 @@ def df2res_pvto(dframe: pd.DataFrame, comment: str | None = None) -> str:
     for pvtnum in subset.index.unique():
         string += _pvto_pvtnum(subset[subset.index == pvtnum])
     return string + "\n"
+
+
+# The functions producing include file text pr. keyword, used by df2res():
+DF2RES_WRITERS: dict[str, Callable[[pd.DataFrame, str | None], str]] = {
+    "ROCK": df2res_rock,
+    "DENSITY": df2res_density,
+    "PVTW": df2res_pvtw,
+    "PVTG": df2res_pvtg,
+    "PVDG": df2res_pvdg,
+    "PVDO": df2res_pvdo,
+    "PVTO": df2res_pvto,
+}
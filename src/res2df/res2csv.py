@@ -200,6 +200,19 @@ def get_parser() -> argparse.ArgumentParser:
         ),
     )
 
+    # The "all" subcommand is implemented in the extractall module:
+    subparsers_dict["extractall"] = subparsers.add_parser(
+        "all",
+        help="Run several extractors in one go",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+        description=(
+            "Run a list of extractors on the same simulation case, writing "
+            "one output file pr. extractor. The deck is only parsed once, and "
+            "the schedule extractors (compdat, wcon and gruptree) share one "
+            "pass over the deck keywords."
+        ),
+    )
+
     for submodule, subparser in subparsers_dict.items():
         # Use the submodule's fill_parser() to add the submodule specific
         # arguments:
@@ -6,13 +6,15 @@ import os
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import opm.io
+import pandas as pd
 from resdata.grid import Grid
 from resdata.rd_util import FileMode
 from resdata.resfile import ResdataFile
 from resdata.summary import Summary
 
-from .common import convert_lyrlist_to_zonemap, parse_lyrfile
+from .common import convert_lyrlist_to_zonemap, grouping_indices, parse_lyrfile
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +74,12 @@ class ResdataFiles:
 
         self._deck = None
 
+        # Cached groupings of the active cells, see get_cell_grouping():
+        self._cell_ijk: np.ndarray | None = None
+        self._cell_groupings: dict[
+            tuple[str, ...], tuple[np.ndarray, np.ndarray, pd.DataFrame]
+        ] = {}
+
     def get_path(self) -> Path:
         """Return the full path to the directory with the .DATA file"""
         return Path(self._eclbase).absolute().parent
@@ -190,8 +198,13 @@ class ResdataFiles:
         return self._eclbase + ".UNRST"
 
     def get_prtfilename(self) -> str:
-        """Return the inferred name of the PRT file"""
-        return self._eclbase + ".PRT"
+        """Return the inferred name of the PRT file
+
+        A gzipped PRT file is returned if only that one exists."""
+        prtfilename = self._eclbase + ".PRT"
+        if not Path(prtfilename).exists() and Path(prtfilename + ".gz").exists():
+            return prtfilename + ".gz"
+        return prtfilename
 
     def close(self) -> None:
         """Close any opened files. Most files are opened though ecl with
@@ -204,6 +217,79 @@ class ResdataFiles:
         self._rstfile = None
         self._rftfile = None
 
+    def get_cell_grouping(
+        self, keys: str | list[str]
+    ) -> tuple[np.ndarray, np.ndarray, pd.DataFrame]:
+        """Return a cached grouping of the active cells on one or more keys
+
+        Repeated aggregations of cell data over pillars, layers, zones or
+        regions can then be done with segmented reductions, like
+        ``np.add.reduceat(values[order], starts)``, instead of a new
+        groupby for every aggregation. Cell data must be in the order of
+        the active cells, as in grid.df().
+
+        Args:
+            keys: Names of keys to group on. Supported are I, J, K, PILLAR
+                for (J - 1) * NX + I, ZONE from the default zonemap, and
+                integer vectors in the INIT file like FIPNUM or EQLNUM.
+
+        Returns:
+            Sort permutation of the active cells, the position in the
+            sorted cells where each group starts, and a dataframe with the
+            key values of each group. When grouping on ZONE, cells in
+            layers not in the zonemap are not in any group.
+        """
+        if isinstance(keys, str):
+            keys = [keys]
+        cachekey = tuple(keys)
+        if cachekey not in self._cell_groupings:
+            logger.info("Computing cell grouping on %s", ", ".join(keys))
+            arrays = [self._get_cell_key(key) for key in keys]
+            cells = np.arange(len(arrays[0]))
+            if "ZONE" in keys:
+                cells = cells[arrays[keys.index("ZONE")] >= 0]
+            order, starts = grouping_indices(*(array[cells] for array in arrays))
+            order = cells[order]
+            group_keys = pd.DataFrame(
+                {
+                    key: array[order[starts]]
+                    for key, array in zip(keys, arrays, strict=True)
+                }
+            )
+            if "ZONE" in keys:
+                zonenames = np.array(sorted(set(self.get_zonemap().values())))
+                group_keys["ZONE"] = zonenames[group_keys["ZONE"]]
+            self._cell_groupings[cachekey] = (order, starts, group_keys)
+        return self._cell_groupings[cachekey]
+
+    def _get_cell_key(self, key: str) -> np.ndarray:
+        """Return integer key values for each active cell, see get_cell_grouping()"""
+        if self._cell_ijk is None:
+            index_frame = self.get_egrid().export_index(active_only=True)
+            # ijk from resdata.grid is off by one:
+            self._cell_ijk = index_frame.to_numpy()[:, 0:3] + 1
+        if key in {"I", "J", "K"}:
+            return self._cell_ijk[:, "IJK".index(key)]
+        if key == "PILLAR":
+            nx = self.get_egrid().get_nx()
+            return (self._cell_ijk[:, 1] - 1) * nx + self._cell_ijk[:, 0]
+        if key == "ZONE":
+            # Zone names are coded by their sorted position, -1 for no zone:
+            zonemap = self.get_zonemap()
+            zonenames = sorted(set(zonemap.values()))
+            layer_codes = np.full(self._cell_ijk[:, 2].max() + 1, -1)
+            for layer, zonename in zonemap.items():
+                if layer < len(layer_codes):
+                    layer_codes[layer] = zonenames.index(zonename)
+            return layer_codes[self._cell_ijk[:, 2]]
+        init = self.get_initfile()
+        if key not in init:
+            raise KeyError(f"{key} not found in INIT file")
+        values = init.iget_named_kw(key, 0).numpy_view()
+        if len(values) != len(self._cell_ijk) or values.dtype.kind not in "iu":
+            raise ValueError(f"{key} is not an integer vector for the active cells")
+        return np.array(values)
+
     def get_zonemap(self, filename: str | None = None) -> dict[int, str]:
         """Return a dictionary from (int) K layers in the simgrid to strings
 
@@ -16,6 +16,7 @@ by adding the prefix ``ICD_``
 import argparse
 import collections
 import datetime
+import fnmatch
 import logging
 from collections.abc import Iterable
 from typing import Any
@@ -59,8 +60,18 @@ ICD_TOPOLOGY_COLS: set = {
     "ICD_SEGDEPTH",
 }
 
+# Columns added to the data from each RFT record, and their key in the
+# dictionaries provided by rftrecords().
+RECORD_COLUMNS: dict[str, str] = {
+    "DATE": "date",
+    "WELL": "wellname",
+    "WELLMODEL": "wellmodel",
+}
+
 
-def _rftrecords2df(rftfile: ResdataFile) -> pd.DataFrame:
+def _rftrecords2df(
+    rftfile: ResdataFile, recordidxs: np.ndarray | None = None
+) -> pd.DataFrame:
     """Construct a dataframe just for navigation on the RFT records,
     from the attribute 'headers' in ResdataFile object constructed from the
     binary RFT file
@@ -81,60 +92,174 @@ def _rftrecords2df(rftfile: ResdataFile) -> pd.DataFrame:
 
     Args:
         rftfile (ResdataFile)
+        recordidxs: If provided, only these headers are included. Each RFT
+            record must be included as a whole, starting with its TIME header.
     """
-    nav_df = pd.DataFrame(rftfile.headers)
-    nav_df.columns = ["recordname", "recordlength", "recordtype"]
-    mask = nav_df["recordname"].eq("TIME")
-    nav_df["timeindex"] = np.where(mask, nav_df.index, np.nan)
-    # the TIME record (in recordname) signifies that the forthcoming records
-    # belong to  this TIME value, and we make a new column in the header data that
+    headers = rftfile.headers
+    if recordidxs is None:
+        recordidxs = np.arange(len(headers))
+    nav_df = pd.DataFrame(
+        [headers[recordidx] for recordidx in recordidxs],
+        columns=["recordname", "recordlength", "recordtype"],
+        index=pd.Index(recordidxs, name="recordidx", dtype=int),
+    )
+    # The TIME record (in recordname) signifies that the forthcoming records
+    # belong to this TIME value, and we make a new column in the header data that
     # tells us the row number for the associated TIME record
-    nav_df = (
-        nav_df.ffill()
-    )  # forward fill (because any record is associated to the previous TIME record)
-    nav_df["timeindex"] = nav_df["timeindex"].astype(int)
+    is_time = (nav_df["recordname"] == "TIME").to_numpy()
+    nav_df["timeindex"] = np.maximum.accumulate(
+        np.where(is_time, nav_df.index, 0)
+    ).astype(int)
     logger.info(
         "Located %s RFT headers at %s distinct dates",
         len(nav_df),
         len(nav_df["timeindex"].unique()),
     )
-    nav_df.index.name = "recordidx"
     return nav_df.reset_index()
 
 
-def rftrecords(rftfile: ResdataFile) -> Iterable[dict[str, Any]]:
+def _matches(value: str, patterns: list[str] | None) -> bool:
+    """Check a value against a list of glob-style patterns.
+    None means no filtering"""
+    return patterns is None or any(
+        fnmatch.fnmatchcase(value, pattern) for pattern in patterns
+    )
+
+
+def rftrecords(
+    rftfile: ResdataFile,
+    wellname: str | list[str] | None = None,
+    date: str | datetime.date | list | None = None,
+) -> Iterable[dict[str, Any]]:
     """Generator for looping over RFT records in a ResdataFile object.
 
     Each returned RFT record is represented as a dict with the keys:
         headers: pd.DataFrame, indexed by recordname
+        records: dict from recordname to a tuple with recordidx,
+            recordlength and recordtype
+        date, wellname, wellmodel and timeindex
+
+    Records not matching the well and date filters are skipped while
+    scanning the headers, before any of their data is read.
 
     Args:
         ResdataFile made from a binary RFT file.
+        wellname: Well name or list of well names to include,
+            glob-style wildcards supported.
+        date: Date or list of dates to include, as datetime.date or as
+            YYYY-MM-DD strings where glob-style wildcards are supported.
     """
-    navigation_frame = _rftrecords2df(rftfile)
-    for timeindex, headers in navigation_frame.groupby("timeindex"):
-        headers = headers.set_index("recordname")
-        rftrecord: dict[str, Any] = {}
-        rftrecord["headers"] = headers
-        # All rows in nav_record_df represents  the data in the current
-        # RFT record
-        dateidx = int(headers.loc["DATE"]["recordidx"])
-        rftrecord["date"] = datetime.date(
-            rftfile[dateidx][2], rftfile[dateidx][1], rftfile[dateidx][0]
-        )
-        rftrecord["wellname"] = rftfile[int(headers.loc["WELLETC"]["recordidx"])][
-            1
-        ].strip()
+    wellnames = [wellname] if isinstance(wellname, str) else wellname
+    dates = [date] if isinstance(date, (str, datetime.date)) else date
+    datestrings = None if dates is None else [str(date) for date in dates]
+
+    # All headers between two TIME headers represent the data in one RFT record
+    recordnames = [header[0] for header in rftfile.headers]
+    starts = [idx for idx, name in enumerate(recordnames) if name == "TIME"]
+    ends = [*starts[1:], len(recordnames)]
+
+    selected = []
+    for start, end in zip(starts, ends, strict=True):
+        welletc = rftfile.iget_kw(recordnames.index("WELLETC", start, end))
+        rftwell = welletc[1].strip()
+        if not _matches(rftwell, wellnames):
+            continue
+        day, month, year = rftfile.iget_kw(
+            recordnames.index("DATE", start, end)
+        ).numpy_view()
+        rftdate = datetime.date(year, month, day)
+        if not _matches(str(rftdate), datestrings):
+            continue
+        selected.append((start, end, rftdate, rftwell, welletc[6].strip()))
+    if not selected:
+        return
 
-        rftrecord["wellmodel"] = rftfile[int(headers.loc["WELLETC"]["recordidx"])][
-            6
-        ].strip()
+    navigation_frame = _rftrecords2df(
+        rftfile,
+        np.concatenate([np.arange(start, end) for start, end, *_ in selected]),
+    )
+    headers_frame = navigation_frame.set_index("recordname")
+    recordlengths = navigation_frame["recordlength"].to_list()
+    recordtypes = navigation_frame["recordtype"].to_list()
+
+    position = 0
+    for start, end, rftdate, rftwell, wellmodel in selected:
+        framerows = slice(position, position + end - start)
+        position += end - start
+        records = {
+            name: (recordidx, length, recordtype)
+            for recordidx, name, length, recordtype in zip(
+                range(start, end),
+                recordnames[start:end],
+                recordlengths[framerows],
+                recordtypes[framerows],
+                strict=True,
+            )
+        }
+        rftrecord: dict[str, Any] = {}
+        rftrecord["headers"] = headers_frame.iloc[framerows]
+        rftrecord["records"] = records
+        rftrecord["date"] = rftdate
+        rftrecord["wellname"] = rftwell
+        rftrecord["wellmodel"] = wellmodel
         # wellmodel is either "STANDARD" or "MULTISEG"
 
-        rftrecord["timeindex"] = timeindex
+        rftrecord["timeindex"] = start
         yield rftrecord
 
 
+def _con_seg_columns(
+    rftfile: ResdataFile, rftrecords: list[dict[str, Any]], datatype: str
+) -> dict[str, np.ndarray]:
+    """Read the CON* or SEG* data for a list of RFT records, and concatenate
+    each column across the records.
+
+    Columns that are missing in some of the records are filled with NaN
+    for these records.
+
+    Args:
+        rftfile: ResdataFile made from a binary RFT file.
+        rftrecords: RFT records, as provided by rftrecords(). They must all
+            contain DEPTH (for CON) or SEGDEPTH (for SEG) data.
+        datatype: Either "CON" or "SEG"
+
+    Returns:
+        Dictionary from column name to concatenated column data. The column
+        CONIDX or SEGIDX counts the rows within each record, starting at 1.
+    """
+    depthname = "DEPTH" if datatype == "CON" else "SEGDEPTH"
+    rowcounts = [rftrecord["records"][depthname][1] for rftrecord in rftrecords]
+    chunks: dict[str, list] = {}
+    for recordpos, rftrecord in enumerate(rftrecords):
+        for name, (recordidx, length, recordtype) in rftrecord["records"].items():
+            # If CON type, ensure, no SEG data included, and vice versa
+            if length != rowcounts[recordpos] or name.startswith("SEG") != (
+                datatype == "SEG"
+            ):
+                continue
+            resdatakw = rftfile.iget_kw(recordidx)
+            if recordtype == "INTE":
+                values = resdatakw.numpy_view().astype(int)
+            elif recordtype in ["REAL", "DOUB"]:
+                values = resdatakw.numpy_view().astype(np.float64)
+            else:
+                values = np.array(list(resdatakw), dtype=object)
+            chunks.setdefault(name, [None] * len(rftrecords))[recordpos] = values
+
+    columns: dict[str, np.ndarray] = {}
+    for name, values_list in chunks.items():
+        columns[name] = np.concatenate(
+            [
+                np.full(rowcount, np.nan) if values is None else values
+                for values, rowcount in zip(values_list, rowcounts, strict=True)
+            ]
+        )
+    columns[datatype + "IDX"] = np.concatenate(
+        [np.arange(1, rowcount + 1) for rowcount in rowcounts]
+    )
+    return columns
+
+
 def get_con_seg_data(
     rftrecord: dict[str, Any], rftfile: ResdataFile, datatype: str
 ) -> pd.DataFrame:
@@ -160,36 +285,20 @@ def get_con_seg_data(
     """
     if datatype not in ["CON", "SEG"]:
         raise ValueError("datatype must equal CON or SEG")
+    return pd.DataFrame(_con_seg_columns(rftfile, [rftrecord], datatype))
 
-    headers = rftrecord["headers"]
-    if datatype == "CON":
-        rft_row_count = headers.loc["DEPTH"]["recordlength"]
-    else:
-        rft_row_count = headers.loc["SEGDEPTH"]["recordlength"]
-
-    data_headers = headers[headers.recordlength == rft_row_count].reset_index()[
-        ["recordidx", "recordname"]
-    ]
-    # If CON type, ensure, no SEG data included, and vice versa
-    if datatype == "CON":
-        data_headers = data_headers[~data_headers["recordname"].str.startswith("SEG")]
-    else:
-        data_headers = data_headers[data_headers["recordname"].str.startswith("SEG")]
 
-    data = pd.DataFrame(
-        {
-            row["recordname"]: list(rftfile[row["recordidx"]])
-            for _, row in data_headers.iterrows()
-        }
+def _records_frame(
+    rftfile: ResdataFile, rftrecords: list[dict[str, Any]], datatype: str
+) -> pd.DataFrame:
+    """Build one dataframe of CON* or SEG* data for many RFT records,
+    where the timeindex column tells which record each row belongs to."""
+    data = pd.DataFrame(_con_seg_columns(rftfile, rftrecords, datatype))
+    depthname = "DEPTH" if datatype == "CON" else "SEGDEPTH"
+    data["timeindex"] = np.repeat(
+        [rftrecord["timeindex"] for rftrecord in rftrecords],
+        [rftrecord["records"][depthname][1] for rftrecord in rftrecords],
     )
-
-    # Ensure integer headers are integers:
-    integer_columns = headers[headers["recordtype"] == "INTE"].index.to_numpy()
-    for col in (set(integer_columns) - {"DATE"}).intersection(
-        set(data_headers["recordname"].to_numpy())
-    ):
-        data[col] = data[col].astype(int)
-    data[datatype + "IDX"] = data.index + 1  # Add an index that starts with 1
     return data
 
 
@@ -203,17 +312,29 @@ def count_wellbranches(seg_data: pd.DataFrame) -> int:
     Args:
         pd.DataFrame, with at least the columns SEGIDX, SEGNXT and SEGBRNO
     """
-    if "LEAF" not in seg_data:
-        seg_data = process_seg_topology(seg_data)
+    return int(_count_wellbranches(_single_record(seg_data)).iloc[0])
 
-    branchcount = len(
-        seg_data[~seg_data["LEAF"] | seg_data["JUNCTION_downstream"]]["SEGBRNO"]
-        .dropna()
-        .unique()
-    )
 
-    # logger.debug("Branches found: %d", count_wellbranches(merged))
-    return max(1, branchcount)
+def _count_wellbranches(seg_data: pd.DataFrame) -> pd.Series:
+    """Count well branches for each RFT record in a segment dataframe.
+
+    Args:
+        seg_data: Segment data for one or more RFT records, separated
+            by the timeindex column.
+
+    Returns:
+        Number of branches (at least one), indexed by timeindex.
+    """
+    if "LEAF" not in seg_data:
+        seg_data = _process_seg_topology(seg_data)
+
+    branch_segments = seg_data[~seg_data["LEAF"] | seg_data["JUNCTION_downstream"]]
+    return (
+        branch_segments.groupby("timeindex")["SEGBRNO"]
+        .nunique()
+        .reindex(seg_data["timeindex"].unique(), fill_value=0)
+        .clip(lower=1)
+    )
 
 
 def process_seg_topology(seg_data: pd.DataFrame) -> pd.DataFrame:
@@ -235,20 +356,26 @@ def process_seg_topology(seg_data: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Augmented dataframe, extra columns and perhaps extra rows.
     """
+    return _process_seg_topology(_single_record(seg_data)).drop(columns="timeindex")
+
+
+def _process_seg_topology(seg_data: pd.DataFrame) -> pd.DataFrame:
+    """Determine and process the segment topology for one or more RFT records,
+    separated by the timeindex column. See process_seg_topology()."""
     if not {"SEGIDX", "SEGNXT"}.issubset(set(seg_data.columns)):
         raise ValueError("Insufficient topology columns in dataframe")
 
-    seg_data = seg_data.sort_values("SEGIDX")
+    seg_data = seg_data.sort_values(["timeindex", "SEGIDX"])
     # For the first segment, None is allowed as SEGNXT, which excludes
     # int as a  Pandas type. Convert to 0 for the moment
-    seg_data["SEGNXT"] = seg_data["SEGNXT"].fillna(value="0").astype(int)
+    seg_data["SEGNXT"] = seg_data["SEGNXT"].fillna(value=0).astype(int)
 
     # Outer merge first to add the upstream segment information to every row.
     merged = seg_data.merge(
         seg_data,
         how="left",
-        left_on="SEGIDX",
-        right_on="SEGNXT",
+        left_on=["timeindex", "SEGIDX"],
+        right_on=["timeindex", "SEGNXT"],
         suffixes=("", "_upstream"),
     )
     del merged["SEGNXT_upstream"]
@@ -259,23 +386,31 @@ def process_seg_topology(seg_data: pd.DataFrame) -> pd.DataFrame:
 
     # Now we can determine leaf segments by those with no extra information, since
     # we did an outer merge:
-    merged["LEAF"] = merged["SEGIDX_upstream"].replace(0, np.nan).isna()
+    merged["LEAF"] = merged["SEGIDX_upstream"] == 0
 
     # Flag segments that have multiple upstream segments as junctions
-    merged["JUNCTION"] = merged["SEGIDX"].duplicated(keep=False)
+    merged["JUNCTION"] = merged.duplicated(["timeindex", "SEGIDX"], keep=False)
 
     # Determine if a segment is alone on its own branch
-    merged["LONELYSEG"] = ~merged["SEGBRNO"].duplicated(keep=False)
+    merged["LONELYSEG"] = ~merged.duplicated(["timeindex", "SEGBRNO"], keep=False)
 
-    # We also want to flag the segment that is upstream a junction,
-    merged["JUNCTION_downstream"] = False
-    merged.loc[merged[merged["JUNCTION"]]["SEGIDX_upstream"], "JUNCTION_downstream"] = (
-        True
-    )
+    # We also want to flag the segment that is upstream a junction. The upstream
+    # segment index points to a row number within the record.
+    record_start = np.arange(len(merged)) - merged.groupby("timeindex").cumcount()
+    record_end = record_start + merged.groupby("timeindex")["SEGIDX"].transform("size")
+    junctions = merged["JUNCTION"].to_numpy()
+    rows = (record_start + merged["SEGIDX_upstream"]).to_numpy()[junctions]
+    rows = rows[rows < record_end.to_numpy()[junctions]]
+    merged["JUNCTION_downstream"] = np.isin(np.arange(len(merged)), rows)
 
     return merged
 
 
+def _single_record(dframe: pd.DataFrame) -> pd.DataFrame:
+    """Mark all rows in a dataframe as belonging to the same RFT record"""
+    return dframe.assign(timeindex=0)
+
+
 def seg2dicttree(seg_data: pd.DataFrame) -> dict:
     """Generate a nested dictionary representing the
     well through its segment topology
@@ -334,15 +469,27 @@ def split_seg_icd(seg_data: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
         Dataframe with the ICD segments only. Empty if no ICDs found.
         and wider.
     """
+    seg_data, icd_data = _split_seg_icd(_single_record(seg_data))
+    return (
+        seg_data.drop(columns="timeindex"),
+        icd_data.drop(columns="timeindex", errors="ignore"),
+    )
+
+
+def _split_seg_icd(seg_data: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Split segment data for one or more RFT records, separated by the
+    timeindex column, into non-ICD and ICD segments. See split_seg_icd().
+
+    The timeindex column is not prefixed in the ICD dataframe.
+    """
 
     # Ensure we have some topology data present:
     if "LEAF" not in seg_data:
-        seg_data = process_seg_topology(seg_data)
+        seg_data = _process_seg_topology(seg_data)
 
-    icd_present = seg_data["SEGBRNO"].max() > count_wellbranches(seg_data)
-
-    if not icd_present:
-        return (seg_data, pd.DataFrame())
+    icd_present = seg_data.groupby("timeindex")["SEGBRNO"].transform("max") > seg_data[
+        "timeindex"
+    ].map(_count_wellbranches(seg_data))
 
     # ICD segments are those where:
     #  * Leaf segments (connected reservoir / con_data row)
@@ -352,17 +499,15 @@ def split_seg_icd(seg_data: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
     #    STOP: Cannot use this criteria, because junctions  due to ICDs
     #    are legit.
     #  * The segment must be on a branch with only one segment
-    icd_seg_indices = seg_data[
-        seg_data["LEAF"] & seg_data["LONELYSEG"]
-    ].index.to_numpy()
-    non_icd_seg_indices = seg_data[
-        ~(seg_data["LEAF"] & seg_data["LONELYSEG"])
-    ].index.to_numpy()
+    icd_segments = icd_present & seg_data["LEAF"] & seg_data["LONELYSEG"]
 
-    icd_seg_data = seg_data.reindex(icd_seg_indices)
-    seg_data = seg_data.reindex(non_icd_seg_indices)
+    if not icd_segments.any():
+        return (seg_data, pd.DataFrame())
 
-    icd_seg_data.columns = ["ICD_" + x for x in icd_seg_data.columns]
+    icd_seg_data = seg_data[icd_segments].rename(
+        columns=lambda col: col if col == "timeindex" else "ICD_" + col
+    )
+    seg_data = seg_data[~icd_segments]
 
     logger.debug(
         "Found %d ICD segments, indices %s",
@@ -402,6 +547,25 @@ def merge_icd_seg_conseg(
             ICD segment. One-to-one correspondence to con_data through ICD_SEGBRNO
             and CONBRNO required. Can be empty or None if no ICD present.
     """
+    if seg_data is None or seg_data.empty:
+        return _merge_icd_seg_conseg(con_data)
+    if icd_data is not None and not icd_data.empty:
+        icd_data = _single_record(icd_data)
+    return _merge_icd_seg_conseg(
+        _single_record(con_data), _single_record(seg_data), icd_data
+    ).drop(columns="timeindex")
+
+
+def _merge_icd_seg_conseg(
+    con_data: pd.DataFrame,
+    seg_data: pd.DataFrame | None = None,
+    icd_data: pd.DataFrame | None = None,
+) -> pd.DataFrame:
+    """Merge ICD segments to the CONxxxxx data for one or more RFT records,
+    separated by the timeindex column. See merge_icd_seg_conseg().
+
+    The timeindex column is only required when segment data is supplied.
+    """
     if seg_data is None:
         seg_data = pd.DataFrame()
     if icd_data is None:
@@ -420,16 +584,27 @@ def merge_icd_seg_conseg(
             "icd.csv", index=False
         )
 
+    if seg_data.empty:
+        # Non-multisegment wells have only reservoir connection data.
+        return con_data
+
     data = pd.DataFrame()
     if not icd_data.empty:
         # Merge ICD_* columns onto the dataframe representing reservoir
         # connections.
-        data = con_data.merge(icd_data, left_on="CONSEGNO", right_on="ICD_SEGIDX")
+        data = con_data.merge(
+            icd_data,
+            left_on=["timeindex", "CONSEGNO"],
+            right_on=["timeindex", "ICD_SEGIDX"],
+        )
 
         # Merge SEGxxxxx to the dataframe with icd's and reservoir connections.
-        assert not seg_data.empty
-
-        data = data.merge(seg_data, how="left", left_on="ICD_SEGNXT", right_on="SEGIDX")
+        data = data.merge(
+            seg_data,
+            how="left",
+            left_on=["timeindex", "ICD_SEGNXT"],
+            right_on=["timeindex", "SEGIDX"],
+        )
 
         # The merge has potentially included extra rows due to junctions.
         # After ICD merge, we can require that SEGIDX_upstream equals CONSEGNO
@@ -439,25 +614,33 @@ def merge_icd_seg_conseg(
         #  segment is on the same row in the dataframe.
 
         # Gather connections that are not associated to ICDs:
-        no_icd_con_segments = set(con_data["CONSEGNO"]) - set(icd_data["ICD_SEGIDX"])
-        con_data_no_icd = (
-            con_data.set_index("CONSEGNO").loc[list(no_icd_con_segments)].reset_index()
+        icd_con_segments = pd.MultiIndex.from_frame(
+            con_data[["timeindex", "CONSEGNO"]]
+        ).isin(pd.MultiIndex.from_frame(icd_data[["timeindex", "ICD_SEGIDX"]]))
+        con_data_no_icd = con_data[~icd_con_segments]
+        # In records with ICDs, these are ordered by segment:
+        order = np.where(
+            con_data_no_icd["timeindex"].isin(icd_data["timeindex"]),
+            con_data_no_icd["CONSEGNO"],
+            con_data_no_icd.groupby("timeindex").cumcount(),
         )
+        con_data_no_icd = con_data_no_icd.iloc[
+            np.lexsort((order, con_data_no_icd["timeindex"]))
+        ]
     else:
         con_data_no_icd = con_data
 
-    if not seg_data.empty:
-        data = pd.concat(
-            [
-                data,
-                con_data_no_icd.merge(seg_data, left_on="CONSEGNO", right_on="SEGIDX"),
-            ],
-            sort=False,
-        )
-    else:
-        # Non-multisegment wells have only reservoir connection data.
-        return con_data
-    return data
+    return pd.concat(
+        [
+            data,
+            con_data_no_icd.merge(
+                seg_data,
+                left_on=["timeindex", "CONSEGNO"],
+                right_on=["timeindex", "SEGIDX"],
+            ),
+        ],
+        sort=False,
+    )
 
 
 def add_extras(dframe: pd.DataFrame, inplace: bool = True) -> pd.DataFrame:
@@ -510,27 +693,25 @@ def add_extras(dframe: pd.DataFrame, inplace: bool = True) -> pd.DataFrame:
 
 def df(
     resdatafiles: ResdataFiles,
-    wellname: str | None = None,
-    date: str | None = None,
+    wellname: str | list[str] | None = None,
+    date: str | datetime.date | list | None = None,
 ) -> pd.DataFrame:
     """Loop over an RFT file and construct a dataframe representation
     of the data, ordered by well and date.
 
     Args:
         resdatafiles: Object used to locate the RFT file
-        wellname: If provided, only wells matching this string exactly
-            will be included
-        date: If provided, all other dates will be ignored. YYYY-MM-DD.
+        wellname: If provided, only wells matching this string, or any
+            of the strings in a list, will be included. Glob-style
+            wildcards are supported.
+        date: If provided, all other dates will be ignored. YYYY-MM-DD,
+            or a list of dates. Glob-style wildcards are supported.
     """
     rftfile = resdatafiles.get_rftfile()
 
-    rftdata = []
-    for rftrecord in rftrecords(rftfile):
-        if wellname is not None and rftrecord["wellname"] != wellname:
-            continue
-        if date is not None and str(rftrecord["date"]) != date:
-            continue
-
+    standard_records = []
+    multiseg_records = []
+    for rftrecord in rftrecords(rftfile, wellname=wellname, date=date):
         logger.info(
             "Extracting %s well %s at %s, record index: %s",
             rftrecord["wellmodel"],
@@ -539,9 +720,7 @@ def df(
             rftrecord["timeindex"],
         )
 
-        headers = rftrecord["headers"]
-
-        if "DEPTH" not in headers.index:
+        if "DEPTH" not in rftrecord["records"]:
             logger.debug(
                 "Well %s has no data to extract at %s",
                 rftrecord["wellname"],
@@ -549,72 +728,100 @@ def df(
             )
             continue
 
-        con_data = get_con_seg_data(rftrecord, rftfile, "CON")
-
-        # Process multisegment data (not necessarily the same number
-        # of rows as the connection data). Data for segments
-        # that are not associated with a connection will not be
-        # included.
-
-        has_seg_data = any(headers.index.str.startswith("SEG"))
+        has_seg_data = any(name.startswith("SEG") for name in rftrecord["records"])
         if rftrecord["wellmodel"] == "MULTISEG" and not has_seg_data:
             logger.warning(
                 "Well %s is a multisegment well, but has no SEG data",
                 rftrecord["wellname"],
             )
             # This should probably never happen (?)
-
-        seg_data = pd.DataFrame()
-        icd_data = pd.DataFrame()
         if has_seg_data:
-            seg_data = get_con_seg_data(rftrecord, rftfile, "SEG")
-
-            # For each downstream segment, merge in the data for its
-            # upstream segment, and determine leaf nodes:
-            seg_data = process_seg_topology(seg_data)
-            logger.debug(pretty_print_well(seg_data))
-
-            # NB: The enumeration of branches is not necessarily consecutive
-            # from SEGBRNO.
-
-            # Now we can test if we have any ICD segments, that is the
-            # case if we have any segments that have SEGBRNO higher than
-            # the branch count.
-
-            seg_data, icd_data = split_seg_icd(seg_data)
+            multiseg_records.append(rftrecord)
+        else:
+            standard_records.append(rftrecord)
 
-            # Branch counting must be done after ICD's are split out.
-            branchcount = count_wellbranches(seg_data)
+    rftdata = []
+    if standard_records:
+        # Wells without segment data need no topology processing.
+        con_data = _records_frame(rftfile, standard_records, "CON")
+        rftdata.append(add_extras(_merge_icd_seg_conseg(con_data), inplace=True))
 
+    if multiseg_records:
+        # Process multisegment data (not necessarily the same number
+        # of rows as the connection data). Data for segments
+        # that are not associated with a connection will not be
+        # included. All records are processed together, separated
+        # by the timeindex column.
+        con_data = _records_frame(rftfile, multiseg_records, "CON")
+        seg_data = _records_frame(rftfile, multiseg_records, "SEG")
+
+        # For each downstream segment, merge in the data for its
+        # upstream segment, and determine leaf nodes:
+        seg_data = _process_seg_topology(seg_data)
+        if logger.isEnabledFor(logging.DEBUG):
+            for _, record_seg_data in seg_data.groupby("timeindex"):
+                logger.debug(pretty_print_well(record_seg_data))
+
+        # NB: The enumeration of branches is not necessarily consecutive
+        # from SEGBRNO.
+
+        # Now we can test if we have any ICD segments, that is the
+        # case if we have any segments that have SEGBRNO higher than
+        # the branch count.
+
+        seg_data, icd_data = _split_seg_icd(seg_data)
+
+        # Branch counting must be done after ICD's are split out.
+        branchcounts = _count_wellbranches(seg_data)
+        icdcounts = (
+            icd_data["timeindex"].value_counts() if not icd_data.empty else pd.Series()
+        )
+        for rftrecord in multiseg_records:
             logger.info(
-                "Found %d branch(es), and %d icd segment(s)", branchcount, len(icd_data)
+                "Found %d branch(es), and %d icd segment(s) in well %s at %s",
+                branchcounts.get(rftrecord["timeindex"], 1),
+                icdcounts.get(rftrecord["timeindex"], 0),
+                rftrecord["wellname"],
+                rftrecord["date"],
             )
 
-        con_icd_seg = merge_icd_seg_conseg(con_data, seg_data, icd_data)
+        con_icd_seg = _merge_icd_seg_conseg(con_data, seg_data, icd_data)
+        rftdata.append(add_extras(con_icd_seg, inplace=True))
 
-        con_icd_seg = add_extras(con_icd_seg, inplace=True)
-
-        con_icd_seg["DATE"] = rftrecord["date"]
-        con_icd_seg["WELL"] = rftrecord["wellname"]
-        con_icd_seg["WELLMODEL"] = rftrecord["wellmodel"]
-
-        # Delete topology columns
-        delete_cols = {col for col in con_icd_seg.columns if col.endswith("stream")}
-        delete_cols = delete_cols.union(
+    if not rftdata:
+        return pd.DataFrame()
+    # Put the records back in the order of the RFT file:
+    rftdata_df = pd.concat(rftdata, ignore_index=True, sort=False).sort_values(
+        "timeindex", kind="stable"
+    )
+    records_by_timeindex = {
+        rftrecord["timeindex"]: rftrecord
+        for rftrecord in standard_records + multiseg_records
+    }
+    for column, key in RECORD_COLUMNS.items():
+        rftdata_df[column] = rftdata_df["timeindex"].map(
             {
-                "LEAF",
-                "ICD_LEAF",
-                "JUNCTION",
-                "ICD_JUNCTION",
-                "LONELYSEG",
-                "ICD_LONELYSEG",
+                timeindex: rftrecord[key]
+                for timeindex, rftrecord in records_by_timeindex.items()
             }
         )
-        con_icd_seg = con_icd_seg[list(set(con_icd_seg.columns) - delete_cols)]
-
-        rftdata.append(con_icd_seg)
+    del rftdata_df["timeindex"]
 
-    rftdata_df = pd.concat(rftdata, ignore_index=True, sort=False)
+    # Delete topology columns
+    delete_cols = {col for col in rftdata_df.columns if col.endswith("stream")}
+    delete_cols = delete_cols.union(
+        {
+            "LEAF",
+            "ICD_LEAF",
+            "JUNCTION",
+            "ICD_JUNCTION",
+            "LONELYSEG",
+            "ICD_LONELYSEG",
+        }
+    )
+    rftdata_df = rftdata_df[
+        [col for col in rftdata_df.columns if col not in delete_cols]
+    ].reset_index(drop=True)
 
     # Fill empty cells with zeros. This is to avoid Spotfire
     # interpreting columns with numbers as strings. An alternative
@@ -653,11 +860,19 @@ def fill_parser(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
         ),
     )
     parser.add_argument(
-        "--wellname", type=str, help="Restrict data to one named well", default=None
+        "--wellname",
+        type=str,
+        nargs="+",
+        help="Restrict data to named wells, wildcards like OP_* are supported",
+        default=None,
     )
 
     parser.add_argument(
-        "--date", type=str, help="Restrict data to one date, YYYY-MM-DD", default=None
+        "--date",
+        type=str,
+        nargs="+",
+        help="Restrict data to dates, YYYY-MM-DD, wildcards like 2001-* are supported",
+        default=None,
     )
     parser.add_argument(
         "-o", "--output", type=str, help="Name of output CSV file.", default="rft.csv"
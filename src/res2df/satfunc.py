@@ -15,8 +15,10 @@ TABDIMS or to supply the satnumcount directly to avoid possible bugs.
 
 import argparse
 import logging
+from collections.abc import Callable
 from pathlib import Path
 
+import numpy as np
 import opm.io
 import pandas as pd
 
@@ -265,6 +267,7 @@ def df2res(
         supported=SUPPORTED_KEYWORDS,
         consecutive="SATNUM",
         filename=filename,
+        writers=DF2RES_WRITERS,
     )
     return string
 
@@ -363,21 +366,59 @@ def _df2res_satfuncs(
         subset["SATNUM"] = 1
     subset = subset.set_index("SATNUM").sort_index()
 
-    # Make a function that is to be called for each SATNUM
-    def _df2res_satfuncs_satnum(keyword: str, dframe: pd.DataFrame) -> str:
-        """Create string with :term:`include file` contents
-        for one saturation function for one specific SATNUM"""
-        col_headers = RENAMERS[keyword]["DATA"]
-        string = (
-            "-- "
-            + dframe[col_headers]
-            .to_string(float_format=" %g", header=True, index=False)
-            .strip()
+    # Format the values for all SATNUMs at once, as DataFrame.to_string() with
+    # float_format=" %g" would do, numeric column headers get a space in front:
+    col_headers = RENAMERS[keyword]["DATA"]
+    headers = []
+    cells = []
+    for col in col_headers:
+        values = subset[col]
+        if pd.api.types.is_float_dtype(values.dtype):
+            floats = values.to_numpy(dtype=float, na_value=np.nan)
+            strings = np.char.mod(" %g", floats)
+            strings[np.isnan(floats)] = "NaN"
+        else:
+            strings = values.astype(str).to_numpy(dtype=str)
+        cells.append(strings)
+        headers.append(
+            " " + col if pd.api.types.is_numeric_dtype(values.dtype) else col
         )
-        return string + "\n/\n"
-
-    # Loop over every SATNUM
-    for satnum in subset.index.unique():
-        string += f"-- SATNUM: {satnum}\n"
-        string += _df2res_satfuncs_satnum(keyword, subset[subset.index == satnum])
+    satnums = subset.index.to_numpy()
+    starts = np.flatnonzero(np.concatenate(([True], satnums[1:] != satnums[:-1])))
+    ends = np.append(starts[1:], len(subset))
+
+    # Loop over every SATNUM, with right-aligned columns pr. table
+    for start, end in zip(starts, ends, strict=True):
+        string += f"-- SATNUM: {satnums[start]}\n"
+        table = [strings[start:end] for strings in cells]
+        widths = [
+            max(len(header), int(np.char.str_len(strings).max()))
+            for header, strings in zip(headers, table, strict=True)
+        ]
+        lines = [
+            " ".join(
+                header.rjust(width)
+                for header, width in zip(headers, widths, strict=True)
+            )
+        ]
+        lines.extend(
+            " ".join(
+                value.rjust(width) for value, width in zip(row, widths, strict=True)
+            )
+            for row in zip(*(strings.tolist() for strings in table), strict=True)
+        )
+        string += "-- " + "\n".join(lines).strip() + "\n/\n"
     return string + "\n"
+
+
+# The functions producing include file text pr. keyword, used by df2res():
+DF2RES_WRITERS: dict[str, Callable[[pd.DataFrame, str | None], str]] = {
+    "SWOF": df2res_swof,
+    "SGOF": df2res_sgof,
+    "SGFN": df2res_sgfn,
+    "SGWFN": df2res_sgwfn,
+    "SWFN": df2res_swfn,
+    "SLGOF": df2res_slgof,
+    "SOF2": df2res_sof2,
+    "SOF3": df2res_sof3,
+}
@@ -11,6 +11,7 @@ from ._vfp import (
     df2res,
     df2ress,
     dfs,
+    evaluate,
     fill_parser,
     fill_reverse_parser,
     pyarrow2basic_data,
@@ -28,6 +29,7 @@ __all__ = [
     "df2res",
     "df2ress",
     "dfs",
+    "evaluate",
     "fill_parser",
     "fill_reverse_parser",
     "pyarrow2basic_data",
@@ -7,6 +7,7 @@ output both in csv format as a pandas DataFrame or in pyarrow and pyarrow.table
 import argparse
 import logging
 import sys
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -27,14 +28,55 @@ from ..res2csvlogger import getLogger_res2csv
 from ..resdatafiles import ResdataFiles
 from . import _vfpinj as vfpinj
 from . import _vfpprod as vfpprod
+from ._vfpcommon import _string2intlist
 from ._vfpdefs import SUPPORTED_KEYWORDS, VFPTYPE
 
 logger = logging.getLogger(__name__)
 
+# The functions producing include file text pr. keyword, used by df2ress():
+DF2RES_WRITERS: dict[str, Callable[[pd.DataFrame, str | None], str]] = {
+    "VFPPROD": vfpprod.df2res,
+    "VFPINJ": vfpinj.df2res,
+}
+
+
+def _vfp_keywords(
+    deck: "opm.opmcommon_python.Deck",
+    keyword: str | list[str],
+    vfpnumbers_str: str | None = None,
+) -> list["opm.opmcommon_python.DeckKeyword"]:
+    """Collect VFPPROD/VFPINJ keywords from a deck in one pass
+
+    The keywords VFPPROD/VFPINJ can be used many times in Eclipse and be
+    introduced in separate files or a common file. Keywords are returned in
+    deck order, only the table number is read for filtering on vfpnumbers_str.
+
+    Args:
+        deck:           :term:`deck`
+        keyword:        VFP table type, 'VFPPROD' or 'VFPINJ', or a list of these
+        vfpnumbers_str: String with list of vfp table numbers to extract.
+                        Syntax "[0,1,8:11]" corresponds to [0,1,8,9,10,11].
+    """
+    keywords = [keyword] if isinstance(keyword, str) else keyword
+    for vfp_keyword in keywords:
+        if vfp_keyword not in SUPPORTED_KEYWORDS:
+            raise ValueError(
+                f"VFP type {vfp_keyword} not supported choose 'VFPPROD'or 'VFPINJ'"
+            )
+    vfpnumbers = _string2intlist(vfpnumbers_str) if vfpnumbers_str else None
+
+    # The table number is the first item of the first record:
+    return [
+        deck_keyword
+        for deck_keyword in deck
+        if deck_keyword.name in keywords
+        and (vfpnumbers is None or deck_keyword[0][0].get_int(0) in vfpnumbers)
+    ]
+
 
 def basic_data(
     deck: "str | ResdataFiles | opm.opmcommon_python.Deck",
-    keyword: str = "VFPPROD",
+    keyword: str | list[str] = "VFPPROD",
     vfpnumbers_str: str | None = None,
 ) -> list[dict[str, Any]]:
     """Produce a dictionary with basic data for an Eclipe VFPPROD/VFPINJ.
@@ -44,7 +86,7 @@ def basic_data(
 
     Args:
         deck:           :term:`.DATA file` or string with :term:`deck`
-        keyword:        VFP table type, i.e. 'VFPPROD' or 'VFPINJ'
+        keyword:        VFP table type, 'VFPPROD' or 'VFPINJ', or a list of these
         vfpnumbers_str: String with list of vfp table numbers to extract.
                         Syntax "[0,1,8:11]" corresponds to [0,1,8,9,10,11].
     """
@@ -54,25 +96,15 @@ def basic_data(
     elif isinstance(deck, str):
         deck = ResdataFiles.str2deck(deck)
 
-    if keyword not in SUPPORTED_KEYWORDS:
-        raise ValueError(
-            f"VFP type {keyword} not supported choose 'VFPPROD'or 'VFPINJ'"
-        )
-
-    # The keywords VFPPROD/VFPINJ can be used many times in Eclipse and be introduced in
-    # separate files or a common file. Need to loop to find all instances of keyword and
-    # store separately
+    # Keywords are already filtered on vfpnumbers_str
     basic_data_vfps = []
-    for deck_keyword in deck:
-        if deck_keyword.name == keyword:
-            if deck_keyword.name == "VFPPROD":
-                basic_data_vfpprod = vfpprod.basic_data(deck_keyword, vfpnumbers_str)
-                if basic_data_vfpprod is not None:
-                    basic_data_vfps.append(basic_data_vfpprod)
-            elif deck_keyword.name == "VFPINJ":
-                basic_data_vfpinj = vfpinj.basic_data(deck_keyword, vfpnumbers_str)
-                if len(basic_data_vfpinj) > 0:
-                    basic_data_vfps.append(basic_data_vfpinj)
+    for deck_keyword in _vfp_keywords(deck, keyword, vfpnumbers_str):
+        if deck_keyword.name == "VFPPROD":
+            basic_data_vfpprod = vfpprod.basic_data(deck_keyword)
+            if basic_data_vfpprod is not None:
+                basic_data_vfps.append(basic_data_vfpprod)
+        elif deck_keyword.name == "VFPINJ":
+            basic_data_vfps.append(vfpinj.basic_data(deck_keyword))
 
     return basic_data_vfps
 
@@ -197,6 +229,36 @@ def basic_data2pyarrow(data: dict[str, Any], /) -> pa.Table:
     raise ValueError("VFP_TYPE not found in basic data")
 
 
+def evaluate(data: dict[str, Any], points: pd.DataFrame | np.ndarray, /) -> np.ndarray:
+    """Evaluate a VFPPROD/VFPINJ table in a batch of points
+
+    The tabulated values (typically BHP) are interpolated multilinearly
+    in all dimensions, and extrapolated linearly from the first or last
+    interval outside the table ranges, as in the simulator.
+
+    Args:
+        data:   Dictionary with basic data representation of
+                VFPPROD or VFPINJ (see basic_data)
+        points: Dataframe with columns RATE, PRESSURE, WFR, GFR and ALQ
+                (RATE and PRESSURE for VFPINJ), or an array with these
+                columns in that order
+
+    Returns:
+        Array with tabulated values interpolated to the points
+    """
+
+    if "VFP_TYPE" in data:
+        vfp_type = data["VFP_TYPE"]
+        if vfp_type == VFPTYPE.VFPPROD:
+            return vfpprod.evaluate(data, points)
+        elif vfp_type == VFPTYPE.VFPINJ:
+            return vfpinj.evaluate(data, points)
+        else:
+            raise ValueError(f"Unknown VFP_TYPE {vfp_type.value}")
+
+    raise ValueError("VFP_TYPE not found in basic data")
+
+
 def df2basic_data(dframe: pd.DataFrame, /) -> dict[str, Any] | None:
     """Produce a dictionary with basic data types for a VFPPROD/VFPINJ
     liftcurve table represented as a Pandas DataFrame
@@ -240,7 +302,7 @@ def pyarrow2basic_data(pa_table: pa.Table) -> dict[str, Any] | None:
 
 def dfs(
     deck: "str | ResdataFiles | opm.opmcommon_python.Deck",
-    keyword: str = "VFPPROD",
+    keyword: str | list[str] = "VFPPROD",
     vfpnumbers_str: str | None = None,
 ) -> list[pd.DataFrame]:
     """Produce a list of dataframes of vfp tables from a :term:`deck`
@@ -249,7 +311,7 @@ def dfs(
 
     Args:
         deck:           :term:`.DATA file` or string with :term:`deck`
-        keyword:        VFP table type, i.e. 'VFPPROD' or 'VFPINJ'
+        keyword:        VFP table type, 'VFPPROD' or 'VFPINJ', or a list of these
         vfpnumbers_str: String with list of vfp table numbers to extract.
                         Syntax "[0,1,8:11]" corresponds to [0,1,8,9,10,11].
     """
@@ -258,32 +320,12 @@ def dfs(
     elif isinstance(deck, str):
         deck = ResdataFiles.str2deck(deck)
 
-    if keyword not in SUPPORTED_KEYWORDS:
-        raise ValueError(
-            f"VFP type {keyword} not supported choose 'VFPPROD'or 'VFPINJ'"
-        )
-
-    # The keywords VFPPROD/VFPINJ can be used many times in Eclipse and be introduced in
-    # separate files or a common file. Need to loop to find all instances of keyword and
-    # store separately
-    dfs_vfp = []
-    for deck_keyword in deck:
-        if deck_keyword.name == keyword:
-            if deck_keyword.name == "VFPPROD":
-                df_vfpprod = vfpprod.df(deck_keyword, vfpnumbers_str)
-                if df_vfpprod is not None:
-                    dfs_vfp.append(df_vfpprod)
-            elif deck_keyword.name == "VFPINJ":
-                df_vfpinj = vfpinj.df(deck_keyword, vfpnumbers_str)
-                if df_vfpinj is not None:
-                    dfs_vfp.append(df_vfpinj)
-
-    return dfs_vfp
+    return [basic_data2df(data) for data in basic_data(deck, keyword, vfpnumbers_str)]
 
 
 def pyarrow_tables(
     deck: "str | ResdataFiles | opm.opmcommon_python.Deck",
-    keyword: str = "VFPPROD",
+    keyword: str | list[str] = "VFPPROD",
     vfpnumbers_str: str | None = None,
 ) -> list[pa.Table]:
     """Produce a list of pyarrow.Table of vfp tables from a :term:`deck`
@@ -292,7 +334,7 @@ def pyarrow_tables(
 
     Args:
         deck:           :term:`.DATA file` or string with :term:`deck`
-        keyword:        VFP table type, i.e. 'VFPPROD' or 'VFPINJ'
+        keyword:        VFP table type, 'VFPPROD' or 'VFPINJ', or a list of these
         vfpnumbers_str: String with list of vfp table numbers to extract.
                         Syntax "[0,1,8:11]" corresponds to [0,1,8,9,10,11].
     """
@@ -301,27 +343,9 @@ def pyarrow_tables(
     elif isinstance(deck, str):
         deck = ResdataFiles.str2deck(deck)
 
-    if keyword not in SUPPORTED_KEYWORDS:
-        raise ValueError(
-            f"VFP type {keyword} not supported choose 'VFPPROD'or 'VFPINJ'"
-        )
-
-    # The keywords VFPPROD/VFPINJ can be used many times in Eclipse and be introduced in
-    # separate files or a common file. Need to loop to find all instances of keyword and
-    # store separately
-    pyarrow_tables_vfp = []
-    for deck_keyword in deck:
-        if deck_keyword.name == keyword:
-            if deck_keyword.name == "VFPPROD":
-                pa_table_vfpprod = vfpprod.pyarrow(deck_keyword, vfpnumbers_str)
-                if pa_table_vfpprod is not None:
-                    pyarrow_tables_vfp.append(pa_table_vfpprod)
-            elif deck_keyword.name == "VFPINJ":
-                pa_table_vfpinj = vfpinj.pyarrow(deck_keyword, vfpnumbers_str)
-                if pa_table_vfpinj is not None:
-                    pyarrow_tables_vfp.append(pa_table_vfpinj)
-
-    return pyarrow_tables_vfp
+    return [
+        basic_data2pyarrow(data) for data in basic_data(deck, keyword, vfpnumbers_str)
+    ]
 
 
 def df2ress(
@@ -352,15 +376,9 @@ def df2ress(
     for vfpno in vfp_numbers:
         df_vfp = dframe[dframe["TABLE_NUMBER"] == vfpno]
         if np.all(df_vfp["VFP_TYPE"] == keyword):
-            if comments and keyword in comments:
-                if keyword == "VFPPROD":
-                    vfp_strs.append(vfpprod.df2res(df_vfp, comments["VFPPROD"]))
-                elif keyword == "VFPINJ":
-                    vfp_strs.append(vfpinj.df2res(df_vfp, comments["VFPINJ"]))
-            elif keyword == "VFPPROD":
-                vfp_strs.append(vfpprod.df2res(df_vfp))
-            elif keyword == "VFPINJ":
-                vfp_strs.append(vfpinj.df2res(df_vfp))
+            vfp_strs.append(
+                DF2RES_WRITERS[keyword](df_vfp, (comments or {}).get(keyword))
+            )
         else:
             raise ValueError(
                 f"VFP number {vfpno} does not have consistent "
@@ -408,7 +426,7 @@ def df2res(
 
 def df(
     deck: "str | ResdataFiles | opm.opmcommon_python.Deck",
-    keyword: str = "VFPPROD",
+    keyword: str | list[str] = "VFPPROD",
     vfpnumbers_str: str | None = None,
 ) -> pd.DataFrame:
     """Produce a dataframes of all vfp tables from a deck
@@ -417,7 +435,7 @@ def df(
 
     Args:
         deck:           :term:`.DATA file` or string wit :term:`deck`
-        keyword:        VFP table type, i.e. 'VFPPROD' or 'VFPINJ'
+        keyword:        VFP table type, 'VFPPROD' or 'VFPINJ', or a list of these
         vfpnumbers_str: str with list of VFP table numbers to extract
     """
 
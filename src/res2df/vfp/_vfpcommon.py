@@ -6,6 +6,7 @@ Data can be extracted from a complete deck or from individual files. Supports
 output both in csv format as a pandas DataFrame or in pyarrow and pyarrow.table
 """
 
+import itertools
 import logging
 
 import numpy as np
@@ -86,6 +87,58 @@ def _deckrecord2list(
     return values
 
 
+def _read_table_records(
+    keyword: "opm.opmcommon_python.DeckKeyword",
+    first_record: int,
+    no_indices: int,
+    no_flow_values: int,
+    tableno: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Read the records with tabulated values of a VFPPROD/VFPINJ keyword
+
+    The values of all records are read into one flat array, which is
+    reshaped to a table with one row pr. record.
+
+    Args:
+        keyword:        VFPPROD or VFPINJ keyword
+        first_record:   Index of the first record with tabulated values
+        no_indices:     Number of indices in each record, i.e. 4 for VFPPROD
+                        (THP, WFR, GFR, ALQ) and 1 for VFPINJ (THP)
+        no_flow_values: Number of tabulated values in each record
+        tableno:        VFP table number, for error messages
+
+    Returns:
+        Tuple with int array of indices (dim (no indices) x (no records))
+        and array of tabulated values (dim (no records) x (no flow values))
+    """
+    records = [keyword[n] for n in range(first_record, len(keyword))]
+    indices = np.array(
+        [[record[i].get_int(0) for i in range(no_indices)] for record in records],
+        dtype=int,
+    ).reshape(len(records), no_indices)
+    value_items = [record[no_indices] for record in records]
+    if any(len(item) != no_flow_values for item in value_items):
+        raise ValueError(
+            "Dimension of record of tabulated values "
+            "does not match number of flow values "
+            f"in vfp table {tableno}"
+        )
+    table = np.fromiter(
+        itertools.chain.from_iterable(item.get_raw_data_list() for item in value_items),
+        dtype=float,
+        count=len(records) * no_flow_values,
+    ).reshape(len(records), no_flow_values)
+
+    # Defaulted values are read as zero, these are returned as NaN like
+    # parse_opmio_deckrecord does. This is using a private attribute of an
+    # OPM DeckItem, see also https://github.com/OPM/opm-common/issues/2598
+    for row, column in zip(*np.nonzero(table == 0), strict=True):
+        if value_items[row].__defaulted(int(column)):
+            table[row, column] = np.nan
+
+    return indices.T, table
+
+
 def _stack_vfptable2df(
     index_names_list: list[str],
     index_values_list: np.ndarray | list[list[float]],
@@ -119,52 +172,29 @@ def _stack_vfptable2df(
                 "Number of flow values not equal to number of tabulated values"
             )
 
-    df_vfptable = pd.DataFrame(table_values_list)
-    no_indices = len(index_names_list)
-
-    # insert index values as first columns in dataframe
-    for i in range(no_indices):
-        df_vfptable.insert(i, index_names_list[i], index_values_list[i])
-
-    #  create multi-index for columns
-    indextuples = [(index_name, "DELETE") for index_name in index_names_list]
-    indextuples.extend(("TAB", str(flowvalue)) for flowvalue in flow_values_list)
-
-    # Set the columns to a MultiIndex, to facilitate stacking
-    df_vfptable.columns = pd.MultiIndex.from_tuples(indextuples)
-
-    # Now stack
-    df_vfptable_stacked = df_vfptable.stack(future_stack=True).sort_index()
-
-    # In order to propagate the gfr, thp, wct values after
-    # stacking to the correct rows, we should either understand
-    # how to do that properly using pandas, but for now, we try a
-    # backwards fill, hopefully that is robust enough
-    # Also reset the index:
-    df_vfptable_stacked = (
-        df_vfptable_stacked.bfill().reset_index().drop("level_0", axis="columns")
+    no_records = len(table_values_list)
+    no_flow_values = len(flow_values_list)
+
+    # Long format, one row pr. tabulated value. Index values are
+    # repeated for each flow value in a record, and the flow values are
+    # repeated for each record:
+    columns = {"RATE": np.tile(np.asarray(flow_values_list, dtype=float), no_records)}
+    for index_name, index_values in zip(
+        index_names_list, index_values_list, strict=True
+    ):
+        columns[index_name] = np.repeat(
+            np.asarray(index_values, dtype=float), no_flow_values
+        )
+    columns["TAB"] = np.asarray(table_values_list, dtype=float).reshape(
+        no_records * no_flow_values
     )
-    # This column is not meaningful (it is the old index)
 
-    # Delete rows that does not belong to any flow rate (this is
-    # possibly a by-product of not doing the stacking in an
-    # optimal way)
-    df_vfptable_stacked = df_vfptable_stacked[
-        df_vfptable_stacked["level_1"] != "DELETE"
-    ]
-
-    # Add correct column name for the flow values that we have stacked
-    cols = list(df_vfptable_stacked.columns)
-    cols[cols.index("level_1")] = "RATE"
-    df_vfptable_stacked.columns = cols
-    df_vfptable_stacked["RATE"] = df_vfptable_stacked["RATE"].astype(float)
-
-    # Sort values in correct order
-    df_vfptable_stacked = df_vfptable_stacked.sort_values(
-        by=[*index_names_list, "RATE"], ascending=True, ignore_index=True
+    # Sort values in correct order, np.lexsort uses the last key as the
+    # primary key:
+    order = np.lexsort(
+        [columns["RATE"]] + [columns[name] for name in reversed(index_names_list)]
     )
-
-    return df_vfptable_stacked
+    return pd.DataFrame({name: values[order] for name, values in columns.items()})
 
 
 def _write_vfp_range(
@@ -190,13 +220,171 @@ def _write_vfp_range(
         var_type_str = var_type
 
     deck_str = f"-- {var_type_str} units - {unit_type} ( {len(values)} values )\n"
-    for i, value in enumerate(values):
-        deck_str += format % value
-        if (i + 1) % values_per_line == 0 and i < len(values) - 1:
-            deck_str += "\n"
-        else:
-            deck_str += " "
+    # Format all values in one go, with a line break after every
+    # values_per_line value:
+    separators = [
+        "\n" if (i + 1) % values_per_line == 0 and i < len(values) - 1 else " "
+        for i in range(len(values))
+    ]
+    deck_str += "".join(format + separator for separator in separators) % tuple(values)
     deck_str += " /\n"
     deck_str += "\n"
 
     return deck_str
+
+
+def _write_table_rows(
+    indices: list[np.ndarray],
+    table: np.ndarray,
+    format: str = "%10.6g",
+    values_per_line: int = 5,
+) -> str:
+    """Creates a :term:`include file` content string for the records of
+    a VFPPROD/VFPINJ table (BHP part)
+
+    Each record starts with the indices of the record, and the tabulated
+    values follow with values_per_line values pr. line. The records are
+    formatted with one format string pr. record.
+
+    Args:
+        indices:         List of int arrays, the first index values for each
+                         record, like THP, WFR, GFR and ALQ indices
+        table:           Array of tabulated values (BHP)
+        format:          Format string for values
+        values_per_line: Number of values per line in output
+    """
+    no_records = len(indices[0])
+    no_flow_values = table.size // no_records
+    if table.size % no_records > 0:
+        raise ValueError("Incompatible BHP table size")
+    table = table.reshape(no_records, no_flow_values)
+
+    separators = []
+    for n in range(no_flow_values):
+        if (n + 1) % values_per_line == 0 and n < no_flow_values - 1:
+            separators.append("\n" + " " * 11)
+        elif (n + 1) % values_per_line == 0 or n == no_flow_values - 1:
+            separators.append("\n")
+        else:
+            separators.append(" ")
+    record_format = (
+        " ".join(["%2d"] * len(indices))
+        + "".join(format + separator for separator in separators)
+        + "/\n"
+    )
+    return "".join(
+        record_format % (*record_indices, *values)
+        for record_indices, values in zip(
+            zip(*(index_array.tolist() for index_array in indices), strict=True),
+            table.tolist(),
+            strict=True,
+        )
+    )
+
+
+def _interpolation_data(
+    values: np.ndarray, points: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find interpolation intervals and weights for points along one axis
+
+    The interval is the one containing the point, or the first or last
+    interval for points outside the axis range, meaning that values are
+    extrapolated linearly, like the simulator does. An axis with only one
+    value gives the (constant) value at that index.
+
+    Args:
+        values: Increasing axis values (e.g. THP_VALUES)
+        points: Points to find interpolation data for
+
+    Returns:
+        Tuple with the lower index of the interval for each point and
+        the weight of the upper index of the interval
+    """
+    if values.size == 1:
+        return np.zeros(points.size, dtype=int), np.zeros(points.size)
+    lower = np.clip(np.searchsorted(values, points) - 1, 0, values.size - 2)
+    start = values[lower]
+    end = values[lower + 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factor = np.where(end > start, (points - start) / (end - start), 0.0)
+    return lower, factor
+
+
+def _points2axes(
+    points: pd.DataFrame | np.ndarray, columns: list[str]
+) -> list[np.ndarray]:
+    """Split points to evaluate a VFP table in into one array pr. axis
+
+    Args:
+        points:  Dataframe with the given columns, or array with
+                 one column pr. axis in the order of columns
+        columns: Names of the axes, i.e. RATE, PRESSURE, WFR, GFR, ALQ
+    """
+    if isinstance(points, pd.DataFrame):
+        missing = [column for column in columns if column not in points]
+        if missing:
+            raise ValueError(f"Missing columns {missing} in points")
+        return [points[column].to_numpy(dtype=float) for column in columns]
+    points = np.atleast_2d(np.asarray(points, dtype=float))
+    if points.ndim != 2 or points.shape[1] != len(columns):
+        raise ValueError(f"Points must have {len(columns)} columns: {columns}")
+    return list(points.T)
+
+
+def _table_array(
+    indices: list[np.ndarray], shape: tuple[int, ...], table: np.ndarray
+) -> np.ndarray:
+    """Reshape tabulated values to an array with one dimension pr. axis
+
+    Args:
+        indices: List of int arrays with (1-based) axis indices for each
+                 record, like THP, WFR, GFR and ALQ indices
+        shape:   Number of values along each axis, with the number of
+                 flow values last
+        table:   Tabulated values (BHP), ordered as records
+    """
+    table_array = np.full(shape, np.nan)
+    table_array[tuple(np.asarray(index_array) - 1 for index_array in indices)] = (
+        np.asarray(table, dtype=float).reshape(len(indices[0]), shape[-1])
+    )
+    return table_array
+
+
+def _interpolate_table(
+    axes_values: list[np.ndarray],
+    table_array: np.ndarray,
+    points: list[np.ndarray],
+) -> np.ndarray:
+    """Multilinear interpolation in a VFP table
+
+    Args:
+        axes_values: List with values along each axis of table_array
+        table_array: Tabulated values, with one dimension pr. axis
+        points:      List with points along each axis, all of same length
+
+    Returns:
+        Interpolated value for each point
+    """
+    # The (index, weight) pairs along each axis, only one for axes
+    # with one value:
+    axes_corners: list[list[tuple[np.ndarray, np.ndarray | float]]] = []
+    for values, axis_points in zip(axes_values, points, strict=True):
+        lower, factor = _interpolation_data(
+            np.asarray(values, dtype=float), np.asarray(axis_points, dtype=float)
+        )
+        if len(values) == 1:
+            axes_corners.append([(lower, 1.0)])
+        else:
+            axes_corners.append([(lower, 1.0 - factor), (lower + 1, factor)])
+
+    # Sum up the contributions from each corner of the hypercube around
+    # the points. Corners with zero weight are skipped, so that undefined
+    # (NaN) table values only affect points they contribute to:
+    result = np.zeros(len(points[0]))
+    for corner in itertools.product(*axes_corners):
+        weight = np.ones(len(points[0]))
+        for _, axis_weight in corner:
+            weight *= axis_weight
+        values = table_array[tuple(index for index, _ in corner)]
+        result += np.where(weight != 0, weight * values, 0.0)
+    return result
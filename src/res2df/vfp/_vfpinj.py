@@ -10,7 +10,6 @@ pyarrow.Table to file as Eclipse .Ecl format
 """
 
 import logging
-import numbers
 from typing import Any
 
 import numpy as np
@@ -27,8 +26,13 @@ from opm.io.deck import DeckKeyword  # noqa: F401
 from ..common import comment_formatter, parse_opmio_deckrecord
 from ._vfpcommon import (
     _deckrecord2list,
+    _interpolate_table,
+    _points2axes,
+    _read_table_records,
     _stack_vfptable2df,
     _string2intlist,
+    _table_array,
+    _write_table_rows,
     _write_vfp_range,
 )
 from ._vfpdefs import (
@@ -116,26 +120,9 @@ def basic_data(
         )
 
     # Extract interpolation values and tabulated values (BHP values)
-    bhp_table: list[list[float]] = []
-    thp_indices: list[float] = []
-    for n in range(3, num_rec):
-        bhp_record = parse_opmio_deckrecord(keyword[n], "VFPINJ", "records", 3)
-        bhp_values: Any | list[float]
-        if isinstance(bhp_record.get("VALUES"), list):
-            bhp_values = bhp_record.get("VALUES")
-        elif isinstance(bhp_record.get("VALUES"), numbers.Number):
-            bhp_values = [bhp_record.get("VALUES")]
-
-        thp_index = bhp_record["THP_INDEX"]
-        thp_indices.append(thp_index)
-
-        if len(bhp_values) != no_flow_values:
-            raise ValueError(
-                "Dimension of record of tabulated values "
-                "does not match number of flow values "
-                f"in vfp table {tableno}"
-            )
-        bhp_table.append(bhp_values)
+    (thp_indices,), bhp_table = _read_table_records(
+        keyword, 3, 1, no_flow_values, tableno
+    )
 
     vfpinj_data = {
         "VFP_TYPE": VFPTYPE.VFPINJ,
@@ -147,8 +134,8 @@ def basic_data(
         "TAB_TYPE": tab_type,
         "THP_VALUES": np.array(thp_values),
         "FLOW_VALUES": np.array(flow_values),
-        "THP_INDICES": np.array(thp_indices),
-        "BHP_TABLE": np.array(bhp_table),
+        "THP_INDICES": thp_indices,
+        "BHP_TABLE": bhp_table,
     }
 
     return vfpinj_data
@@ -184,7 +171,7 @@ def basic_data2df(
     """
 
     # Generate list with values instead of indices
-    thp_values_list = [thp_values[i - 1] for i in thp_indices]
+    thp_values_list = np.asarray(thp_values)[np.asarray(thp_indices) - 1]
 
     # create stacked dataframe from VFP table values
     index_names = ["PRESSURE"]
@@ -284,7 +271,7 @@ def basic_data2pyarrow(
     no_thp_values = len(thp_values)
     no_flow_values = len(flow_values)
     pa_table = pa.table(
-        tab_data.reshape(no_thp_values, no_flow_values).tolist(), schema=schema
+        list(tab_data.reshape(no_thp_values, no_flow_values)), schema=schema
     )
 
     return pa_table
@@ -466,6 +453,34 @@ def _check_basic_data(vfp_data: dict[str, Any]) -> bool:
     return True
 
 
+def evaluate(vfp_data: dict[str, Any], points: pd.DataFrame | np.ndarray) -> np.ndarray:
+    """Evaluate a VFPINJ table in a set of points by multilinear interpolation
+
+    Points outside the table ranges are extrapolated linearly from the
+    first or last interval, as in the simulator.
+
+    Args:
+        vfp_data: Dictionary with basic data for a VFPINJ keyword
+        points:   Dataframe with columns RATE and PRESSURE, or
+                  an array with these columns in that order
+
+    Returns:
+        Tabulated values (e.g. BHP) in the points
+    """
+    _check_basic_data(vfp_data)
+    rate, thp = _points2axes(points, ["RATE", "PRESSURE"])
+    axes_values = [
+        vfp_data["THP_VALUES"],
+        vfp_data["FLOW_VALUES"],
+    ]
+    table_array = _table_array(
+        [vfp_data["THP_INDICES"]],
+        tuple(len(values) for values in axes_values),
+        vfp_data["BHP_TABLE"],
+    )
+    return _interpolate_table(axes_values, table_array, [thp, rate])
+
+
 def df(
     keyword: "opm.opmcommon_python.DeckKeyword",
     vfpnumbers_str: str | None = None,
@@ -589,34 +604,7 @@ def _write_table_records(
         format:          Format string for values
         values_per_line: Number of values per line in output
     """
-
-    deck_str = ""
-    no_records = len(thp_indices)
-    no_flow_values = table.size // no_records
-    if table.size % no_records > 0:
-        raise ValueError("Incompatible BHP table size")
-    else:
-        table = table.reshape(no_records, no_flow_values)
-
-    for row in range(no_records):
-        thp = thp_indices[row]
-        deck_str += f"{thp:2d}"
-        for n, value in enumerate(table[row, :]):
-            deck_str += format % value
-            if (n + 1) % values_per_line == 0:
-                if n < no_flow_values - 1:
-                    deck_str += "\n"
-                    deck_str += " " * 11
-                else:
-                    deck_str += "\n"
-            elif n == no_flow_values - 1:
-                deck_str += "\n"
-            else:
-                deck_str += " "
-
-        deck_str += "/\n"
-
-    return deck_str
+    return _write_table_rows([thp_indices], table, format, values_per_line)
 
 
 def df2res(dframe: pd.DataFrame, comment: str | None = None) -> str:
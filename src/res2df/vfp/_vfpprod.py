@@ -10,7 +10,6 @@ pyarrow.Table to file as Eclipse .Ecl format.
 """
 
 import logging
-import numbers
 from typing import Any
 
 import numpy as np
@@ -27,8 +26,13 @@ from opm.io.deck import DeckKeyword  # noqa: F401
 from ..common import comment_formatter, parse_opmio_deckrecord
 from ._vfpcommon import (
     _deckrecord2list,
+    _interpolate_table,
+    _points2axes,
+    _read_table_records,
     _stack_vfptable2df,
     _string2intlist,
+    _table_array,
+    _write_table_rows,
     _write_vfp_range,
 )
 from ._vfpdefs import (
@@ -141,36 +145,9 @@ def basic_data(
         )
 
     # Extract interpolation values and tabulated values (BHP values)
-    bhp_table: list[list[float]] = []
-    thp_indices: list[float] = []
-    wfr_indices: list[float] = []
-    gfr_indices: list[float] = []
-    alq_indices: list[float] = []
-    for n in range(6, num_rec):
-        bhp_record = parse_opmio_deckrecord(keyword[n], "VFPPROD", "records", 6)
-        bhp_values: Any | list[float]
-        if isinstance(bhp_record.get("VALUES"), list):
-            bhp_values = bhp_record.get("VALUES")
-        elif isinstance(bhp_record.get("VALUES"), numbers.Number):
-            bhp_values = [bhp_record.get("VALUES")]
-
-        thp_index = bhp_record["THP_INDEX"]
-        wfr_index = bhp_record["WFR_INDEX"]
-        gfr_index = bhp_record["GFR_INDEX"]
-        alq_index = bhp_record["ALQ_INDEX"]
-
-        thp_indices.append(thp_index)
-        wfr_indices.append(wfr_index)
-        gfr_indices.append(gfr_index)
-        alq_indices.append(alq_index)
-
-        if len(bhp_values) != no_flow_values:
-            raise ValueError(
-                "Dimension of record of tabulated "
-                "values does not match number of flow values "
-                f"in vfp table {tableno}"
-            )
-        bhp_table.append(bhp_values)
+    (thp_indices, wfr_indices, gfr_indices, alq_indices), bhp_table = (
+        _read_table_records(keyword, 6, 4, no_flow_values, tableno)
+    )
 
     vfpprod_data = {
         "VFP_TYPE": VFPTYPE.VFPPROD,
@@ -188,11 +165,11 @@ def basic_data(
         "GFR_VALUES": np.array(gfr_values),
         "ALQ_VALUES": np.array(alq_values),
         "FLOW_VALUES": np.array(flow_values),
-        "THP_INDICES": np.array(thp_indices),
-        "WFR_INDICES": np.array(wfr_indices),
-        "GFR_INDICES": np.array(gfr_indices),
-        "ALQ_INDICES": np.array(alq_indices),
-        "BHP_TABLE": np.array(bhp_table),
+        "THP_INDICES": thp_indices,
+        "WFR_INDICES": wfr_indices,
+        "GFR_INDICES": gfr_indices,
+        "ALQ_INDICES": alq_indices,
+        "BHP_TABLE": bhp_table,
     }
 
     return vfpprod_data
@@ -249,10 +226,10 @@ def basic_data2df(
     """
 
     # Generate list with values instead of indices in index columns
-    thp_values_list = [thp_values[i - 1] for i in thp_indices]
-    wfr_values_list = [wfr_values[i - 1] for i in wfr_indices]
-    gfr_values_list = [gfr_values[i - 1] for i in gfr_indices]
-    alq_values_list = [alq_values[i - 1] for i in alq_indices]
+    thp_values_list = np.asarray(thp_values)[np.asarray(thp_indices) - 1]
+    wfr_values_list = np.asarray(wfr_values)[np.asarray(wfr_indices) - 1]
+    gfr_values_list = np.asarray(gfr_values)[np.asarray(gfr_indices) - 1]
+    alq_values_list = np.asarray(alq_values)[np.asarray(alq_indices) - 1]
 
     # create stacked dataframe from VFP table values
     index_names = ["PRESSURE", "WFR", "GFR", "ALQ"]
@@ -403,7 +380,7 @@ def basic_data2pyarrow(
     no_flow_values = len(flow_values)
     no_records = no_thp_values * no_wfr_values * no_gfr_values * no_alq_values
     pa_table = pa.table(
-        tab_data.reshape(no_records, no_flow_values).tolist(), schema=schema
+        list(tab_data.reshape(no_records, no_flow_values)), schema=schema
     )
 
     return pa_table
@@ -710,6 +687,44 @@ def _check_basic_data(vfp_data: dict[str, Any]) -> bool:
     return True
 
 
+def evaluate(vfp_data: dict[str, Any], points: pd.DataFrame | np.ndarray) -> np.ndarray:
+    """Evaluate a VFPPROD table in a set of points by multilinear interpolation
+
+    Points outside the table ranges are extrapolated linearly from the
+    first or last interval, as in the simulator.
+
+    Args:
+        vfp_data: Dictionary with basic data for a VFPPROD keyword
+        points:   Dataframe with columns RATE, PRESSURE, WFR, GFR and ALQ, or
+                  an array with these columns in that order
+
+    Returns:
+        Tabulated values (e.g. BHP) in the points
+    """
+    _check_basic_data(vfp_data)
+    rate, thp, wfr, gfr, alq = _points2axes(
+        points, ["RATE", "PRESSURE", "WFR", "GFR", "ALQ"]
+    )
+    axes_values = [
+        vfp_data["THP_VALUES"],
+        vfp_data["WFR_VALUES"],
+        vfp_data["GFR_VALUES"],
+        vfp_data["ALQ_VALUES"],
+        vfp_data["FLOW_VALUES"],
+    ]
+    table_array = _table_array(
+        [
+            vfp_data["THP_INDICES"],
+            vfp_data["WFR_INDICES"],
+            vfp_data["GFR_INDICES"],
+            vfp_data["ALQ_INDICES"],
+        ],
+        tuple(len(values) for values in axes_values),
+        vfp_data["BHP_TABLE"],
+    )
+    return _interpolate_table(axes_values, table_array, [thp, wfr, gfr, alq, rate])
+
+
 def df(
     keyword: "opm.opmcommon_python.DeckKeyword",
     vfpnumbers_str: str | None = None,
@@ -868,37 +883,12 @@ def _write_table_records(
         format:          Format string for values
         values_per_line: Number of values per line in output
     """
-
-    deck_str = ""
-    no_records = len(thp_indices)
-    no_flow_values = table.size // no_records
-    if table.size % no_records > 0:
-        raise ValueError("Incompatible BHP table size")
-    else:
-        table = table.reshape(no_records, no_flow_values)
-
-    for row in range(no_records):
-        thp = thp_indices[row]
-        wfr = wfr_indices[row]
-        gfr = gfr_indices[row]
-        alq = alq_indices[row]
-        deck_str += f"{thp:2d} {wfr:2d} {gfr:2d} {alq:2d}"
-        for n, value in enumerate(table[row, :]):
-            deck_str += format % value
-            if (n + 1) % values_per_line == 0:
-                if n < no_flow_values - 1:
-                    deck_str += "\n"
-                    deck_str += " " * 11
-                else:
-                    deck_str += "\n"
-            elif n == no_flow_values - 1:
-                deck_str += "\n"
-            else:
-                deck_str += " "
-
-        deck_str += "/\n"
-
-    return deck_str
+    return _write_table_rows(
+        [thp_indices, wfr_indices, gfr_indices, alq_indices],
+        table,
+        format,
+        values_per_line,
+    )
 
 
 def df2res(dframe: pd.DataFrame, comment: str | None = None) -> str:
@@ -22,10 +22,12 @@ logger = logging.getLogger(__name__)
 WCONKEYS = ["WCONHIST", "WCONINJE", "WCONINJH", "WCONPROD"]
 
 
-def df(deck: "ResdataFiles | opm.opmcommon_python.Deck") -> pd.DataFrame:
+def df(deck: "ResdataFiles | opm.opmcommon_python.Deck | list") -> pd.DataFrame:
     """Loop through the :term:`deck` and pick up information found
 
     The loop over the :term:`deck` is a state machine, as it has to pick up dates
+
+    The deck can also be given as a list of its keywords in deck order.
     """
 
     if isinstance(deck, ResdataFiles):
@@ -6,6 +6,7 @@ from enum import StrEnum
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 
@@ -149,20 +150,34 @@ def _aggregate_layer_to_zone(compdat_df: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame with one row per unique combination of well, zone and date.
 
     """
-    records = []
-    for (well, zone, date), group_df in compdat_df.groupby(["WELL", "ZONE", "DATE"]):
-        open_compl_df = group_df[group_df["OP/SH"] == "OPEN"]
-        has_open_compl = open_compl_df.shape[0] > 0
-        records.append(
-            {
-                "WELL": well,
-                "ZONE": zone,
-                "DATE": date,
-                "KH": open_compl_df["KH"].sum() if has_open_compl else 0,
-                "OP/SH": "OPEN" if has_open_compl else "SHUT",
-            }
-        )
-    return pd.DataFrame(records)
+    keys = ["WELL", "ZONE", "DATE"]
+    is_open = compdat_df["OP/SH"] == "OPEN"
+    # Categorical well and zone names make the grouping cheaper in both
+    # memory and time, they are converted back when the result is ready.
+    dframe = pd.DataFrame(
+        {
+            "WELL": compdat_df["WELL"].astype("category"),
+            "ZONE": compdat_df["ZONE"].astype("category"),
+            "DATE": compdat_df["DATE"],
+            "KH": compdat_df["KH"].where(is_open, 0),
+            "OP/SH": is_open,
+        }
+    )
+    aggregated = (
+        dframe.groupby(keys, observed=True, sort=True)
+        .agg({"KH": "sum", "OP/SH": "any"})
+        .reset_index()
+    )
+    if aggregated.empty:
+        return pd.DataFrame()
+    for col in ["WELL", "ZONE"]:
+        aggregated[col] = aggregated[col].astype(compdat_df[col].dtype)
+    if not aggregated["OP/SH"].any():
+        # KH is only summed from open connections, with no open
+        # connections at all it is the integer 0:
+        aggregated["KH"] = 0
+    aggregated["OP/SH"] = np.where(aggregated["OP/SH"], "OPEN", "SHUT")
+    return aggregated
 
 
 def _merge_compdat_and_connstatus(
@@ -3,8 +3,8 @@
 import argparse
 import logging
 import re
-from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from .common import write_dframe_stdout_file
@@ -34,28 +34,45 @@ def df(resdatafiles: ResdataFiles) -> pd.DataFrame:
 def _extract_status_changes(smry: pd.DataFrame) -> pd.DataFrame:
     """Extracts connections status changes from a dataframe of CPI
     summary data.
+
+    A CPI value of 0 means that the connection is SHUT
+    A CPI value > 0 means that the connection is OPEN
+
+    All connections are processed at once on the matrix of CPI values,
+    comparing each row to the previous, where the connection is assumed
+    SHUT prior to the first date.
     """
     cpi_columns = [
         col
         for col in smry.columns
         if re.match(r"^CPI:[A-Z0-9_-]{1,8}:[0-9]+,[0-9]+,[0-9]+$", col)
     ]
-    dframe = pd.DataFrame(columns=["DATE", "WELL", "I", "J", "K", "OP/SH"])
 
-    for col in cpi_columns:
-        colsplit = col.split(":")
-        well = colsplit[1]
-        i, j, k = colsplit[2].split(",")
-
-        status_changes = _extract_single_connection_status_changes(
-            smry.index, smry[col]
-        )
-        for date, status in status_changes:
-            dframe.loc[dframe.shape[0]] = [date, well, i, j, k, status]
-
-    dframe["I"] = dframe["I"].astype(int)
-    dframe["J"] = dframe["J"].astype(int)
-    dframe["K"] = dframe["K"].astype(int)
+    # Transposed to have one row pr. connection, one column pr. date:
+    values = smry[cpi_columns].to_numpy(dtype=float).T
+    prev_values = np.zeros_like(values)
+    prev_values[:, 1:] = values[:, :-1]
+
+    opened = (values > 0) & (prev_values == 0)
+    shut = (prev_values > 0) & (values == 0)
+    # np.nonzero() returns the changes ordered by connection, then by date:
+    conn_idx, date_idx = np.nonzero(opened | shut)
+
+    conn_names = np.array([col.split(":")[1] for col in cpi_columns], dtype=object)
+    conn_ijk = np.array(
+        [col.split(":")[2].split(",") for col in cpi_columns], dtype=int
+    ).reshape(-1, 3)
+
+    dframe = pd.DataFrame(
+        {
+            "DATE": smry.index[date_idx],
+            "WELL": conn_names[conn_idx],
+            "I": conn_ijk[conn_idx, 0],
+            "J": conn_ijk[conn_idx, 1],
+            "K": conn_ijk[conn_idx, 2],
+            "OP/SH": np.where(opened[conn_idx, date_idx], "OPEN", "SHUT"),
+        }
+    )
 
     logger.info(
         "Dataframe with well connection status ready, %d rows",
@@ -64,28 +81,6 @@ def _extract_status_changes(smry: pd.DataFrame) -> pd.DataFrame:
     return dframe
 
 
-def _extract_single_connection_status_changes(
-    dates: pd.Index, conn_values: pd.Series
-) -> list[tuple[Any, str]]:
-    """Extracts the status history of a single connection as a list of tuples
-    on the form (date, status)
-
-    A CPI value of 0 means that the connection is SHUT
-    A CPI value > 0 means that the connection is OPEN
-    """
-    status_changes = []
-    prev_value = 0
-    for date, value in zip(dates, conn_values, strict=False):
-        if value > 0 and prev_value == 0:
-            # Connection is OPEN and was SHUT at previous timestep
-            status_changes.append((date, "OPEN"))
-        elif prev_value > 0 and value == 0:
-            # Connection is SHUT and was OPEN at previous timestep
-            status_changes.append((date, "SHUT"))
-        prev_value = value
-    return status_changes
-
-
 def fill_parser(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
     """Set up sys.argv parsers.
 
@@ -8,7 +8,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from res2df import common, equil, resdatafiles
+from res2df import common, equil, resdatafiles, satfunc
 
 
 def test_opmkeywords():
@@ -85,6 +85,21 @@ def test_stack_on_colname():
     assert not stacked.isna().sum().sum()
 
 
+def test_grouping_indices():
+    """Sort permutation and group starts should match pandas groupby"""
+    dframe = pd.DataFrame({"A": [3, 1, 3, 2, 1, 3], "B": [1, 2, 1, 1, 1, 2]})
+    order, starts = common.grouping_indices(dframe["A"], dframe["B"])
+    sums = np.add.reduceat(np.arange(6)[order], starts)
+    expected = dframe.assign(VAL=np.arange(6)).groupby(["A", "B"])["VAL"].sum()
+    np.testing.assert_array_equal(sums, expected)
+    np.testing.assert_array_equal(
+        dframe.to_numpy()[order][starts], expected.index.to_frame().to_numpy()
+    )
+
+    order, starts = common.grouping_indices(np.array([]))
+    assert len(order) == 0 and len(starts) == 0
+
+
 def test_write_dframe_file(tmp_path):
     """Test that we can write dataframes to files."""
     os.chdir(tmp_path)
@@ -142,9 +157,8 @@ def test_handle_wanted_keywords(wanted, deckstr, supported, expected):
 
 
 def df2res_equil(dframe, comment=None):
-    """Wrapper function to be able to test df2res
-
-    (it asks for a function in the calling module)"""
+    """Wrapper function to be able to test df2res with a writer function
+    from this module"""
     return equil.df2res_equil(dframe, comment)
 
 
@@ -165,52 +179,68 @@ def test_df2res():
             }
         ]
     )
-    with pytest.raises(AssertionError):
-        # supported keywords are not supplied
+    with pytest.raises(ValueError, match="writers must map keywords"):
+        # writer functions are not supplied
         common.df2res(dframe)
-    with pytest.raises(AssertionError):
-        common.df2res(dframe, supported=None)
+    with pytest.raises(ValueError, match="writers must map keywords"):
+        common.df2res(dframe, supported=["EQUIL"], writers={})
+
+    writers = {"EQUIL": df2res_equil}
 
     with pytest.raises(ValueError, match="KEYWORD must be in the dataframe"):
         common.df2res(
-            dframe.drop("KEYWORD", axis=1), keywords=["EQUIL"], supported=["EQUIL"]
+            dframe.drop("KEYWORD", axis=1),
+            keywords=["EQUIL"],
+            supported=["EQUIL"],
+            writers=writers,
         )
 
-    string = common.df2res(dframe, supported=["EQUIL"])
+    string = common.df2res(dframe, supported=["EQUIL"], writers=writers)
     # The next calls differ only in timestamp:
     assert len(string) == len(
-        common.df2res(dframe, keywords="EQUIL", supported=["EQUIL"])
+        common.df2res(dframe, keywords="EQUIL", supported=["EQUIL"], writers=writers)
     )
     assert len(string) == len(
-        common.df2res(dframe, keywords=["EQUIL"], supported=["EQUIL"])
+        common.df2res(dframe, keywords=["EQUIL"], supported=["EQUIL"], writers=writers)
     )
     assert "EQUIL\n" in string
     assert "2469" in string
     assert "-- Output file printed by tests.test_common" in string
 
-    assert not common.df2res(dframe, supported=["PORO"])
+    assert not common.df2res(dframe, supported=["PORO"], writers=writers)
 
     assert "EQUIL\n-- foobar" in common.df2res(
-        dframe, comments={"EQUIL": "foobar"}, supported=["EQUIL"]
+        dframe, comments={"EQUIL": "foobar"}, supported=["EQUIL"], writers=writers
     )
     assert "\n\n-- masterfoobar\nEQUIL" in common.df2res(
-        dframe, comments={"master": "masterfoobar"}, supported=["EQUIL"]
+        dframe,
+        comments={"master": "masterfoobar"},
+        supported=["EQUIL"],
+        writers=writers,
     )
 
     tworows = pd.concat([dframe, dframe])
     tworows["EQLNUM"] = [3, 1]
     tworows["PRESSURE"] = [3456, 1234]
     with pytest.raises(ValueError):
-        common.df2res(tworows, supported=["EQUIL"], consecutive="EQLNUM")
+        common.df2res(
+            tworows, supported=["EQUIL"], consecutive="EQLNUM", writers=writers
+        )
     # This would be a bug if client code did this, because the wrong
     # consecutive column is set:
-    assert "3456" in common.df2res(tworows, supported=["EQUIL"], consecutive="PVTNUM")
+    assert "3456" in common.df2res(
+        tworows, supported=["EQUIL"], consecutive="PVTNUM", writers=writers
+    )
     tworows["EQLNUM"] = [1, 3]
     with pytest.raises(ValueError):
-        common.df2res(tworows, supported=["EQUIL"], consecutive="EQLNUM")
+        common.df2res(
+            tworows, supported=["EQUIL"], consecutive="EQLNUM", writers=writers
+        )
     tworows["EQLNUM"] = [2, 1]
     # Passes because the frame is sorted on EQLNUM:
-    string = common.df2res(tworows, supported=["EQUIL"], consecutive="EQLNUM")
+    string = common.df2res(
+        tworows, supported=["EQUIL"], consecutive="EQLNUM", writers=writers
+    )
     assert "EQUIL" in string
     assert string.find("3456") > string.find("1234")
 
@@ -294,6 +324,50 @@ def test_well_matching_template(template, wells, output):
     assert common.get_wells_matching_template(template, wells) == output
 
 
+@pytest.mark.parametrize("processes", [1, 2])
+def test_df2res_realizations(tmp_path, processes):
+    """Test writing one include file pr. realization"""
+    swof_df = pd.DataFrame(
+        {
+            "KEYWORD": "SWOF",
+            "SATNUM": [1, 1, 2, 2],
+            "SW": [0.1, 1.0, 0.2, 1.0],
+            "KRW": [0.0, 1.0, 0.0, 0.9],
+            "KROW": [1.0, 0.0, 0.8, 0.0],
+            "PCOW": 0.0,
+        }
+    )
+    ensemble_df = pd.concat(
+        [swof_df.assign(REALIZATION=real) for real in [3, 0, 1]], ignore_index=True
+    )
+    ensemble_df.loc[ensemble_df["REALIZATION"] == 1, "KRW"] *= 0.5
+    filenames = common.df2res_realizations(
+        satfunc.df2res,
+        ensemble_df,
+        str(tmp_path / "realization-{realization}/relperm.inc"),
+        processes=processes,
+        comments={"SWOF": "ensemble"},
+    )
+    assert filenames == [
+        str(tmp_path / f"realization-{real}/relperm.inc") for real in [0, 1, 3]
+    ]
+    for real, filename in zip([0, 1, 3], filenames, strict=True):
+        expected = satfunc.df2res(
+            ensemble_df[ensemble_df["REALIZATION"] == real].drop(columns="REALIZATION"),
+            comments={"SWOF": "ensemble"},
+        )
+        # Skip the header with the timestamp:
+        assert (
+            Path(filename).read_text(encoding="utf8").splitlines()[3:]
+            == expected.splitlines()[3:]
+        )
+
+    with pytest.raises(ValueError, match="REALIZATION must be in the dataframe"):
+        common.df2res_realizations(satfunc.df2res, swof_df, "{realization}.inc")
+    with pytest.raises(ValueError, match="filename must contain"):
+        common.df2res_realizations(satfunc.df2res, ensemble_df, "relperm.inc")
+
+
 @pytest.mark.parametrize(
     "dframe, keyword, comment, renamer, drop_trailing_columns, expected",
     [
@@ -398,6 +472,34 @@ def test_well_matching_template(template, wells, output):
             # Here, the I column should not be dropped but defaulted
             id="nan-column3",
         ),
+        pytest.param(
+            pd.DataFrame(
+                {
+                    "DATUM_DEPTH": [2000.5, 2100.25],
+                    "DATUM_PRESSURE": [200.0, np.nan],
+                    "OWC": [2200, 2300],
+                }
+            ),
+            "EQUIL",
+            None,
+            None,
+            True,
+            "EQUIL\n-- DATUM_DEPTH DATUM_PRESSURE  OWC\n"
+            "  2000.50          200.0 2200 /\n"
+            "  2100.25             1* 2300 /\n",
+            id="float-formatting",
+        ),
+        pytest.param(
+            pd.DataFrame({"DATUM_DEPTH": [1e-8, 2100.0], "DATUM_PRESSURE": [1.0, 3.0]}),
+            "EQUIL",
+            None,
+            None,
+            True,
+            "EQUIL\n-- DATUM_DEPTH  DATUM_PRESSURE\n"
+            "  1.000000e-08             1.0 /\n"
+            "  2.100000e+03             3.0 /\n",
+            id="float-formatting-scientific",
+        ),
         pytest.param(
             pd.DataFrame([{"FOOWELL": "OP1"}]),
             "COMPDAT",
@@ -447,3 +549,14 @@ def test_generic_deck_table(
         drop_trailing_columns=drop_trailing_columns,
     )
     assert stringtable == expected
+
+
+def test_fixed_width_tables():
+    """Rows are sorted pr. table, rows with equal sort values keep their order"""
+    dframe = pd.DataFrame(
+        {"PRESSURE": [200, 100, 100, 50], "VALUE": [1, 2, 3, 4]},
+        index=pd.Index([1, 1, 1, 2], name="PVTNUM"),
+    )
+    assert common.fixed_width_tables(
+        dframe, ["PRESSURE", "VALUE"], "PRESSURE", fmt="%g"
+    ) == [(1, "  100 2\n  100 3\n  200 1\n"), (2, "  50 4\n")]
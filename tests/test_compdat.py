@@ -255,6 +255,35 @@ def test_unrollbogus():
     assert (unrolled == bogusdf).all().all()
 
 
+def test_unrolldf():
+    """Rows without ranges are kept first, then the unrolled ranges in order"""
+    dframe = pd.DataFrame(
+        [
+            ["OP1", 3, 5, 1.0],
+            ["OP2", 1, 1, 2.0],
+            ["OP3", 2, 1, 3.0],
+            ["OP4", 7, 8, 4.0],
+        ],
+        columns=["WELL", "K1", "K2", "KH"],
+    )
+    unrolled = compdat.unrolldf(dframe)
+    pd.testing.assert_frame_equal(
+        unrolled,
+        pd.DataFrame(
+            [
+                ["OP2", 1, 1, 2.0],
+                ["OP1", 3, 3, 1.0],
+                ["OP1", 4, 4, 1.0],
+                ["OP1", 5, 5, 1.0],
+                ["OP4", 7, 7, 4.0],
+                ["OP4", 8, 8, 4.0],
+            ],
+            columns=["WELL", "K1", "K2", "KH"],
+            index=[1, 0, 0, 0, 3, 3],
+        ),
+    )
+
+
 def test_initmerging():
     """Test that we can ask for INIT vectors to be merged into the data"""
     resdatafiles = ResdataFiles(REEK)
@@ -701,3 +730,87 @@ def test_wsegvalv_max_default():
             ]
         ),
     )
+
+
+def test_state_cube():
+    """Test the interval representation of the connection states"""
+    schstr = """
+COMPDAT
+ 'OP1' 1 1 1 2 'OPEN' 1* 1* 1* 100 /
+/
+DATES
+ 1 JAN 2000 /
+/
+WELOPEN
+ 'OP1' 'SHUT' 1 1 2 /
+/
+COMPDAT
+ 'OP2' 2 2 1 1 'OPEN' 1* 1* 1* 50 /
+/
+DATES
+ 1 FEB 2000 /
+/
+WELOPEN
+ 'OP1' 'OPEN' /
+/
+"""
+    compdat_df = compdat.deck2dfs(ResdataFiles.str2deck(schstr))["COMPDAT"]
+    cube = compdat.state_cube(compdat_df)
+    assert "DATE" not in cube
+    assert len(cube) == 6
+    assert cube["VALID_FROM"].isna().sum() == 2
+    assert cube["VALID_TO"].isna().sum() == 3
+    op1_k2 = cube[(cube["WELL"] == "OP1") & (cube["K1"] == 2)]
+    assert list(op1_k2["OP/SH"]) == ["OPEN", "SHUT", "OPEN"]
+    assert list(op1_k2["VALID_TO"]) == [
+        pd.Timestamp("2000-01-01"),
+        pd.Timestamp("2000-02-01"),
+        pd.NaT,
+    ]
+
+    state = compdat.state_at(cube, ["1999-01-01", "2000-01-15", "2000-02-01"])
+    assert list(state["DATE"].unique()) == [
+        pd.Timestamp("1999-01-01"),
+        pd.Timestamp("2000-01-15"),
+        pd.Timestamp("2000-02-01"),
+    ]
+    open_kh = state[state["OP/SH"] == "OPEN"].groupby("DATE")["KH"].sum()
+    assert list(open_kh) == [200, 150, 250]
+
+    # Empty input:
+    assert compdat.state_at(compdat.state_cube(pd.DataFrame()), "2000-01-01").empty
+
+    # Input with K1-K2 ranges must be unrolled first:
+    rangedeck = ResdataFiles.str2deck(schstr.split("DATES", maxsplit=1)[0])
+    rolled_df = compdat.deck2dfs(rangedeck, unroll=False)["COMPDAT"]
+    with pytest.raises(ValueError, match="must be unrolled"):
+        compdat.state_cube(rolled_df)
+    pd.testing.assert_frame_equal(
+        compdat.state_cube(compdat.unrolldf(rolled_df)),
+        compdat.state_cube(compdat.deck2dfs(rangedeck)["COMPDAT"]),
+    )
+
+    table = compdat.state_cube2pyarrow(cube)
+    assert table.num_rows == len(cube)
+    assert str(table.schema.field("K1").type) == "int32"
+
+
+def test_state_at_equals_replay():
+    """The state lookups must be equal to replaying the event log"""
+    compdat_df = compdat.deck2dfs(ResdataFiles.file2deck(SCHFILE))["COMPDAT"]
+    dates = pd.to_datetime(compdat_df["DATE"]).dropna().unique()
+    dates = [*dates, *(dates + pd.Timedelta(days=1)), pd.Timestamp("2100-01-01")]
+    state = compdat.state_at(compdat.state_cube(compdat_df), dates)
+    for date in dates:
+        replayed = compdat_df[pd.to_datetime(compdat_df["DATE"]) <= date]
+        replayed = replayed.drop_duplicates(
+            subset=["WELL", "I", "J", "K1"], keep="last"
+        )
+        pd.testing.assert_frame_equal(
+            state[state["DATE"] == date][replayed.columns.drop("DATE")]
+            .sort_values(["WELL", "I", "J", "K1"])
+            .reset_index(drop=True),
+            replayed.drop(columns="DATE")
+            .sort_values(["WELL", "I", "J", "K1"])
+            .reset_index(drop=True),
+        )
@@ -1,6 +1,9 @@
 import os
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 from res2df import ResdataFiles
 
 TESTDIR = Path(__file__).absolute().parent
@@ -66,3 +69,27 @@ def test_filedescriptors():
     resdatafiles.get_deck()
     # This should not leave any file descriptor open
     assert len(list(fd_dir.glob("*"))) == pre_fd_count
+
+
+def test_cell_grouping():
+    """Cached groupings of the active cells should match pandas groupby"""
+    resdatafiles = ResdataFiles(EIGHTCELLS)
+    index_frame = resdatafiles.get_egrid().export_index(active_only=True)
+    cells = pd.DataFrame(
+        {
+            "PILLAR": index_frame["j"] * resdatafiles.get_egrid().get_nx()
+            + index_frame["i"]
+            + 1,
+            "K": index_frame["k"] + 1,
+            "FIPNUM": resdatafiles.get_initfile()["FIPNUM"][0].numpy_copy(),
+        }
+    ).reset_index(drop=True)
+    for keys in (["PILLAR"], ["K"], ["FIPNUM", "PILLAR"]):
+        order, starts, group_keys = resdatafiles.get_cell_grouping(keys)
+        expected = cells.groupby(keys).size().rename("SIZE").reset_index()
+        pd.testing.assert_frame_equal(group_keys, expected[keys], check_dtype=False)
+        np.testing.assert_array_equal(np.diff([*starts, len(order)]), expected["SIZE"])
+        np.testing.assert_array_equal(
+            cells[keys].to_numpy()[order][starts], group_keys.to_numpy()
+        )
+    assert resdatafiles.get_cell_grouping(["K"]) is resdatafiles.get_cell_grouping("K")
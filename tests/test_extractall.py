@@ -0,0 +1,107 @@
+"""Test module for running several extractors in one go"""
+
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from res2df import ResdataFiles, compdat, extractall, gruptree, res2csv, rft, wcon
+
+TESTDIR = Path(__file__).absolute().parent
+REEK = str(TESTDIR / "data/reek/eclipse/model/2_R001_REEK-0.DATA")
+EIGHTCELLS = str(TESTDIR / "data/eightcells/EIGHTCELLS.DATA")
+
+
+@pytest.mark.parametrize(
+    "extractors, expected",
+    [
+        ("compdat", ["compdat"]),
+        ("compdat,wcon", ["compdat", "wcon"]),
+        (["compdat, wcon", "rft"], ["compdat", "wcon", "rft"]),
+        ("wcon compdat wcon", ["wcon", "compdat"]),
+        ("all", list(extractall.EXTRACTORS)),
+    ],
+)
+def test_parse_extractors(extractors, expected):
+    assert extractall.parse_extractors(extractors) == expected
+
+
+def test_parse_extractors_unsupported():
+    with pytest.raises(ValueError, match="Unsupported extractor"):
+        extractall.parse_extractors("compdat,foo")
+
+
+def test_schedule_keywords():
+    """The shared keyword walk should only keep what the extractors need"""
+    deck = ResdataFiles(REEK).get_deck()
+    keywords = extractall.schedule_keywords(deck, ["wcon"])
+    assert {kword.name for kword in keywords} <= set(
+        extractall.DATE_KEYWORDS + extractall.SCHEDULE_KEYWORDS["wcon"]
+    )
+    assert "WCONHIST" in {kword.name for kword in keywords}
+
+
+@pytest.mark.parametrize("datafile", [REEK, EIGHTCELLS])
+def test_dfs_equal_to_single_extractors(datafile):
+    """Check that the shared deck pass gives the same as each extractor alone"""
+    resdatafiles = ResdataFiles(datafile)
+    frames = extractall.dfs(resdatafiles, "compdat,wcon,gruptree")
+    assert list(frames) == ["compdat", "wcon", "gruptree"]
+    pd.testing.assert_frame_equal(frames["compdat"], compdat.df(resdatafiles))
+    pd.testing.assert_frame_equal(frames["wcon"], wcon.df(resdatafiles))
+    pd.testing.assert_frame_equal(frames["gruptree"], gruptree.df(resdatafiles))
+
+
+def test_main_subparsers(tmp_path, mocker):
+    """Test command line interface"""
+    mocker.patch(
+        "sys.argv",
+        [
+            "res2csv",
+            "all",
+            "-v",
+            "--extractors",
+            "compdat,wcon,gruptree,rft",
+            "-o",
+            str(tmp_path / "tables"),
+            REEK,
+        ],
+    )
+    res2csv.main()
+
+    for extractor in ["compdat", "wcon", "gruptree", "rft"]:
+        assert not pd.read_csv(tmp_path / "tables" / f"{extractor}.csv").empty
+    assert len(pd.read_csv(tmp_path / "tables" / "rft.csv")) == len(
+        rft.df(ResdataFiles(REEK))
+    )
+
+
+def test_main_deck_only(tmp_path, mocker, caplog):
+    """With all extractors, those with missing input files are skipped
+    while the deck based tables are still written"""
+    datafile = tmp_path / "EIGHTCELLS.DATA"
+    shutil.copy(EIGHTCELLS, datafile)
+    mocker.patch(
+        "sys.argv",
+        ["res2csv", "all", "-o", str(tmp_path / "tables"), str(datafile)],
+    )
+    res2csv.main()
+
+    for extractor in ["compdat", "equil", "faults"]:
+        assert (tmp_path / "tables" / f"{extractor}.csv").is_file()
+    for extractor in ["fipreports", "grid", "rft"]:
+        assert not (tmp_path / "tables" / f"{extractor}.csv").exists()
+        assert f"Skipping {extractor}" in caplog.text
+
+
+def test_dfs_missing_input_raises(tmp_path):
+    """Missing input files are only skipped when all extractors are requested"""
+    datafile = tmp_path / "EIGHTCELLS.DATA"
+    shutil.copy(EIGHTCELLS, datafile)
+    resdatafiles = ResdataFiles(str(datafile))
+    with pytest.raises(FileNotFoundError):
+        extractall.dfs(resdatafiles, "compdat,fipreports")
+    assert list(
+        extractall.dfs(resdatafiles, "compdat,fipreports", skip_missing=True)
+    ) == ["compdat"]
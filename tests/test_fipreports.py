@@ -1,6 +1,7 @@
 """Test module for fipreports"""
 
 import datetime
+import gzip
 import os
 from pathlib import Path
 
@@ -83,6 +84,39 @@ def test_mockprtfile():
         fipreports.df(MOCKPRTFILE, fipname="FIP456789")
 
 
+@pytest.mark.parametrize("fipname", [["FIPNUM", "FIPZON", "FIPOWG", "FIPOPM"], "all"])
+def test_multiple_fipnames(fipname):
+    """Several region report families should be collected in one pass"""
+    dframe = fipreports.df(MOCKPRTFILE, fipname=fipname)
+    assert set(dframe["FIPNAME"]) == {"FIPNUM", "FIPZON", "FIPOWG", "FIPOPM"}
+    for single_fipname, single_dframe in dframe.groupby("FIPNAME"):
+        assert len(single_dframe) == len(
+            fipreports.df(MOCKPRTFILE, fipname=single_fipname)
+        )
+
+    with pytest.raises(ValueError):
+        fipreports.df(MOCKPRTFILE, fipname=["FIPNUM", "WIPNUM"])
+
+
+@pytest.mark.parametrize(
+    "prtfile",
+    [MOCKPRTFILE, str(TESTDIR / "data/reek/eclipse/model/2_R001_REEK-0-OPMFLOW.PRT")],
+)
+def test_chunked_and_gzipped(prtfile, tmp_path, monkeypatch):
+    """Parsing in chunks, in parallel or from a gzipped file must give the same
+    as parsing the whole file in one go, also when chunks start inside
+    report blocks"""
+    expected = fipreports.df(prtfile, fipname="all")
+    pd.testing.assert_frame_equal(
+        fipreports.df(prtfile, fipname="all", processes=2), expected
+    )
+
+    gzfile = tmp_path / "FOO.PRT.gz"
+    gzfile.write_bytes(gzip.compress(Path(prtfile).read_bytes()))
+    monkeypatch.setattr(fipreports, "GZ_CHUNKSIZE", 997)
+    pd.testing.assert_frame_equal(fipreports.df(str(gzfile), fipname="all"), expected)
+
+
 def test_prtstring(tmp_path):
     """Test a PRT from string, verifying every detail of the dataframe"""
     prtstring = """
@@ -530,6 +564,23 @@ def test_report_block_lineparser():
     assert int(tup[7]) == 22298026321
 
 
+def test_prt_scanner():
+    """The scanner should only match whole lines of interest"""
+    scanner = fipreports._prt_scanner(["FIPNUM"])
+    text = (
+        b"  REPORT   1     1 JAN 2000\n"
+        b" :  FIPNUM REPORT REGION    2     :\n"
+        b" :  FIPZON REPORT REGION    3     :\n"
+        b"  REPORT\n   2  1 FEB 2000\n"
+        b" ============================\n"
+    )
+    matches = list(scanner.finditer(text))
+    assert len(matches) == 3
+    assert matches[0]["eclmonth"] == b"JAN"
+    assert matches[1]["region"] == b"2"
+    assert matches[2]["blockend"]
+
+
 def test_cmdline(tmp_path, mocker):
     """Test command line interface"""
     tmpcsvfile = tmp_path / "TMP-fipreports.csv"
@@ -9,8 +9,9 @@ import numpy as np
 import pandas as pd
 import pyarrow as pa
 import pytest
+import resfo
 
-from res2df import ResdataFiles, common, grid, res2csv
+from res2df import ResdataFiles, common, csv2res, grid, res2csv
 
 TESTDIR = Path(__file__).absolute().parent
 REEK = str(TESTDIR / "data/reek/eclipse/model/2_R001_REEK-0.DATA")
@@ -289,6 +290,61 @@ def test_df2res_mock():
     assert len(simple_fipnum_inc.replace("\n", " ").split()) == 5
 
 
+def test_df2res_binary(tmp_path, mocker):
+    """Test writing grid keywords in binary format, from the API and csv2res"""
+    a_grid = pd.DataFrame(
+        {"GLOBAL_INDEX": [0, 1, 3], "FIPNUM": [1, 2, 3], "PORO": [0.1, 0.2, 0.3]}
+    )
+    assert not grid.df2res(
+        a_grid, ["FIPNUM", "PORO"], filename=str(tmp_path / "a.bin"), binary=True
+    )
+    fipnum, poro = resfo.read(tmp_path / "a.bin")
+    assert fipnum[0] == "FIPNUM  "
+    assert fipnum[1].dtype.kind == "i"
+    assert list(fipnum[1]) == [1, 2, 0, 3]
+    assert poro[0] == "PORO    "
+    assert poro[1].dtype == np.dtype(">f4")
+    assert np.allclose(poro[1], [0.1, 0.2, 0, 0.3])
+
+    grid.df2res(
+        a_grid, "FIPNUM", dtype=float, filename=str(tmp_path / "b.bin"), binary=True
+    )
+    assert resfo.read(tmp_path / "b.bin")[0][1].dtype.kind == "f"
+
+    with pytest.raises(ValueError, match="filename is required"):
+        grid.df2res(a_grid, "FIPNUM", binary=True)
+
+    a_grid.assign(I=1, X=1.0).to_csv(tmp_path / "grid.csv", index=False)
+    mocker.patch(
+        "sys.argv",
+        ["csv2res", "grid", str(tmp_path / "grid.csv"), "--binary", "-o", "c.bin"],
+    )
+    os.chdir(tmp_path)
+    csv2res.main()
+    assert [kw for kw, _ in resfo.read("c.bin")] == ["FIPNUM  ", "PORO    "]
+
+    mocker.patch(
+        "sys.argv",
+        ["csv2res", "grid", "grid.csv", "-k", "FIPNUM", "--dtype", "int", "-o", "c"],
+    )
+    csv2res.main()
+    assert "FIPNUM\n     1  2  0  3\n/" in Path("c").read_text(encoding="utf8")
+
+
+def test_runlength_lines():
+    """Test the run-length encoded and wrapped lines for grid keywords"""
+    assert not grid._runlength_lines(np.array([]))
+    assert grid._runlength_lines(np.array([1, 1, 2, 3, 3, 3])) == "     2*1  2  3*3"
+    assert (
+        grid._runlength_lines(np.array([0.0, 0.0, -0.0, np.nan, np.nan, 1.5]))
+        == "     2*0.0  -0.0  2*nan  1.5"
+    )
+    lines = grid._runlength_lines(np.arange(100) * 1000).splitlines()
+    assert lines[0] == "     " + "  ".join(str(value * 1000) for value in range(11))
+    assert all(len(line) <= 70 for line in lines)
+    assert " ".join(lines).split() == [str(value * 1000) for value in range(100)]
+
+
 def test_subvectors():
     """Test that we can ask for a few vectors only"""
     resdatafiles = ResdataFiles(EIGHTCELLS)
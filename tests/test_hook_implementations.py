@@ -20,6 +20,7 @@ def test_hooks_are_installed_in_erts_plugin_manager():
     available_fm_steps = [step().name for step in plugin_m.forward_model_steps]
     assert "CSV2RES" in available_fm_steps
     assert "RES2CSV" in available_fm_steps
+    assert "RES2CSV_ALL" in available_fm_steps
 
 
 def test_hook_implementations_have_docs_installed():
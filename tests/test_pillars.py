@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -258,6 +259,76 @@ def test_compute_pillar_contacts(pillar_df, args, expectedrows):
     )
 
 
+def test_pillar_keys():
+    """Integer pillar keys should round-trip to I-J labels"""
+    cells = pd.DataFrame({"I": [1, 3, 1, 2, 3], "J": [1, 1, 2, 4, 4]})
+    keys = pillars.pillar_keys(cells, nx=3)
+    assert list(keys) == [1, 3, 4, 11, 12]
+    assert list(pillars.pillar_labels(keys, nx=3)) == [
+        "1-1",
+        "3-1",
+        "1-2",
+        "2-4",
+        "3-4",
+    ]
+    pd.testing.assert_series_equal(pillars.pillar_keys(cells), keys)
+
+
+def test_compute_pillar_contacts_from_ij():
+    """Without a PILLAR column, contacts are grouped on I and J"""
+    cells = pd.DataFrame(
+        columns=["I", "J", "SWAT", "SOIL", "Z"],
+        data=[[1, 1, 0.2, 0.8, 1000], [1, 1, 1, 0, 1001], [2, 1, 0.2, 0.8, 1000]],
+    )
+    pd.testing.assert_frame_equal(
+        pillars.compute_pillar_contacts(cells, soilcutoff=0.5),
+        pd.DataFrame([{"PILLAR": "1-1", "OWC": 1000}]),
+    )
+    assert "PILLAR" not in cells
+
+
+def test_compute_pillar_dynamics():
+    """Volumes and contacts for several dates at once should match the
+    computations done one date at a time"""
+    datestrs = ["2000-01-01", "2001-01-01"]
+    grid_df = pd.DataFrame(
+        {
+            "PILLAR": [2, 1, 1, 2, 1, 2],
+            "Z": [1000, 1000, 1010, 1010, 1020, 1020],
+            "PORV": [1, 2, 3, 4, 5, 6],
+            "SWAT@2000-01-01": [0.1, 0.2, 0.3, 0.9, 0.9, 1],
+            "SGAS@2000-01-01": [0.8, 0.7, 0, 0, 0, 0],
+            "SWAT@2001-01-01": [0.2, 0.2, 0.8, 0.9, 0.9, 1],
+            "SGAS@2001-01-01": [0.7, 0.1, 0, 0, 0, 0],
+        }
+    )
+    volumes, contacts = pillars.compute_pillar_dynamics(
+        grid_df, ["PILLAR"], datestrs, soilcutoff=0.5, sgascutoff=0.5
+    )
+    assert set(volumes) == {"WATVOL", "GASVOL", "OILVOL"}
+    for dateidx, datestr in enumerate(datestrs):
+        with_volumes = pd.concat(
+            [grid_df, pillars.compute_volumes(grid_df, datestr)], axis="columns"
+        )
+        expected_volumes = with_volumes.groupby("PILLAR").sum()
+        for name, values in volumes.items():
+            np.testing.assert_allclose(
+                values[:, dateidx], expected_volumes[f"{name}@{datestr}"]
+            )
+        expected_contacts = (
+            pillars.compute_pillar_contacts(
+                with_volumes, soilcutoff=0.5, sgascutoff=0.5, datestr=datestr
+            )
+            .set_index("PILLAR")
+            .reindex([1, 2])
+        )
+        for name, values in contacts.items():
+            np.testing.assert_array_equal(
+                values[:, dateidx], expected_contacts.get(f"{name}@{datestr}", np.nan)
+            )
+    assert set(contacts) == {"OWC", "GOC"}
+
+
 @pytest.mark.parametrize(
     "dframe, datestr, expectedrows",
     [
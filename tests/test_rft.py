@@ -62,6 +62,23 @@ def test_get_con_seg_data():
         rft.get_con_seg_data(None, None, "FOO")
 
 
+def test_con_seg_columns():
+    """Reading CON data for all records at once should give the same as
+    reading each record by itself"""
+    rftfile = ResdataFiles(REEK).get_rftfile()
+    rftrecs = [rec for rec in rft.rftrecords(rftfile) if "DEPTH" in rec["records"]]
+    con_data = pd.DataFrame(rft._con_seg_columns(rftfile, rftrecs, "CON"))
+    pd.testing.assert_frame_equal(
+        con_data,
+        pd.concat(
+            [rft.get_con_seg_data(rec, rftfile, "CON") for rec in rftrecs],
+            ignore_index=True,
+        ),
+    )
+    assert con_data["CONIPOS"].dtype == int
+    assert con_data["PRESSURE"].dtype == float
+
+
 def test_minimal_well():
     """Test a dummy well dataset
 
@@ -360,6 +377,61 @@ def test_longer_branched_partly_icd_well():
     assert all(con_seg["DRAWDOWN"].to_numpy() == [10, 10, 9, 9])
 
 
+def test_batch_topology():
+    """Processing several RFT records at once, separated by timeindex,
+    should give the same as processing each record by itself"""
+    icd_well = (
+        pd.DataFrame(
+            {
+                "SEGIDX": [1, 2, 3, 4, 5],
+                "SEGNXT": [None, 1, 1, 2, 3],
+                "SEGBRNO": [1, 1, 2, 3, 4],
+            }
+        ),
+        pd.DataFrame(
+            {"CONSEGNO": [4, 5], "PRESSURE": [301, 302], "CONPRES": [291, 292]}
+        ),
+    )
+    partly_icd_well = (
+        pd.DataFrame(
+            {"SEGIDX": [1, 2, 3, 4], "SEGNXT": [None, 1, 2, 2], "SEGBRNO": [1, 1, 1, 2]}
+        ),
+        pd.DataFrame(
+            {"CONSEGNO": [4, 3], "PRESSURE": [301, 302], "CONPRES": [291, 292]}
+        ),
+    )
+    records = [icd_well, partly_icd_well, icd_well]
+
+    expected = []
+    for timeindex, (wellseg, con_data) in enumerate(records):
+        seg_data, icd_data = rft.split_seg_icd(wellseg)
+        con_seg = rft.merge_icd_seg_conseg(con_data, seg_data, icd_data)
+        expected.append(con_seg.assign(timeindex=timeindex))
+
+    seg_data, icd_data = rft._split_seg_icd(
+        pd.concat(
+            [wellseg.assign(timeindex=idx) for idx, (wellseg, _) in enumerate(records)]
+        )
+    )
+    assert list(rft._count_wellbranches(seg_data)) == [2, 2, 2]
+    con_seg = rft._merge_icd_seg_conseg(
+        pd.concat(
+            [
+                con_data.assign(timeindex=idx)
+                for idx, (_, con_data) in enumerate(records)
+            ]
+        ),
+        seg_data,
+        icd_data,
+    )
+    pd.testing.assert_frame_equal(
+        con_seg.sort_values("timeindex", kind="stable").reset_index(drop=True),
+        pd.concat(expected, ignore_index=True),
+        check_like=True,
+        check_dtype=False,
+    )
+
+
 def test_seg2dicttree():
     """Test making a dictionary tree from segment structure as a dataframe"""
     assert rft.seg2dicttree(pd.DataFrame()) == {}
@@ -491,6 +563,37 @@ def test_rft2df():
     assert not rftdf.columns.empty
 
 
+@pytest.mark.parametrize(
+    "wellname, date, expected_wells, expected_dates",
+    [
+        ("OP_1", None, {"OP_1"}, None),
+        (["OP_1", "WI_1"], None, {"OP_1", "WI_1"}, None),
+        ("WI_*", None, {"WI_1", "WI_2", "WI_3"}, None),
+        (None, "2001-03-01", None, {"2001-03-01"}),
+        (None, "2001-*", None, {"2001-01-01", "2001-03-01"}),
+        (None, [datetime.date(2000, 2, 1), "2000-06-01"], None, None),
+        ("OP_*", "2001-*", {"OP_4", "OP_5"}, {"2001-01-01"}),
+        ("FOO", None, set(), None),
+        # Matching is case sensitive on all platforms:
+        ("op_*", None, set(), None),
+    ],
+)
+def test_rft2df_filters(wellname, date, expected_wells, expected_dates):
+    """Test filtering on wells and dates, with lists and wildcards"""
+    resdatafiles = ResdataFiles(REEK)
+    all_rft = rft.df(resdatafiles)
+    rftdf = rft.df(resdatafiles, wellname=wellname, date=date)
+    if expected_wells is not None:
+        assert set(rftdf.get("WELL", [])) == expected_wells
+    if expected_dates is not None:
+        assert set(rftdf["DATE"].astype(str)) == expected_dates
+    if not rftdf.empty:
+        mask = all_rft["WELL"].isin(rftdf["WELL"].unique()) & all_rft["DATE"].isin(
+            rftdf["DATE"].unique()
+        )
+        assert len(rftdf) == mask.sum()
+
+
 def test_main_subparsers(tmp_path, mocker):
     """Test command line interface"""
     tmpcsvfile = tmp_path / ".TMP-rft.csv"
@@ -1,5 +1,6 @@
 import copy
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -1372,3 +1373,109 @@ def test_basic_data_array_dim_exceptions_vfpinjs(vfpinj_array_name, test_input,
     ][1:]
     with pytest.raises(ValueError):
         vfp._vfpinj._check_basic_data(basic_data_vfpinj_wrong_dim)
+
+
+@pytest.mark.parametrize("test_input, dummy", VFPPROD_CASES + VFPINJ_CASES)
+def test_evaluate_nodes(test_input, dummy):
+    """Test that evaluating VFP tables in the table nodes gives the
+    tabulated values"""
+    deck = ResdataFiles.str2deck(test_input)
+    for keyword in ["VFPPROD", "VFPINJ"]:
+        for basic_data in vfp.basic_data(deck, keyword):
+            vfpdf = vfp.basic_data2df(basic_data)
+            np.testing.assert_allclose(vfp.evaluate(basic_data, vfpdf), vfpdf["TAB"])
+
+
+@pytest.mark.parametrize(
+    "points, expected",
+    [
+        ([[50000, 100]], [180.11]),
+        # Interpolation in both dimensions:
+        ([[275000, 150]], [220.165]),
+        # Linear extrapolation outside table ranges:
+        ([[50000, 300]], [360.13]),
+        ([[0, 100]], [181.21]),
+        (
+            pd.DataFrame({"PRESSURE": [100, 150], "RATE": [50000, 275000]}),
+            [180.11, 220.165],
+        ),
+    ],
+)
+@pytest.mark.parametrize("test_input, dummy", [VFPINJ_CASES[0]])
+def test_evaluate_vfpinj(points, expected, test_input, dummy):
+    """Test interpolation and extrapolation in a VFPINJ table"""
+    deck = ResdataFiles.str2deck(test_input)
+    basic_data = vfp.basic_data(deck, "VFPINJ")[0]
+    np.testing.assert_allclose(vfp.evaluate(basic_data, points), expected)
+
+
+def test_evaluate_defaulted_value():
+    """Test that a defaulted (NaN) table value only gives NaN in points
+    where it contributes to the interpolation"""
+    deck = ResdataFiles.str2deck(
+        """
+VFPINJ
+ 3 3200.0 GAS THP METRIC BHP /
+ 50000 500000 5e+06  /
+ 100 200  /
+ 1    180.11  1*   150.31 /
+ 2    190     200  240.32 /
+"""
+    )
+    basic_data = vfp.basic_data(deck, "VFPINJ")[0]
+    np.testing.assert_allclose(
+        vfp.evaluate(
+            basic_data,
+            [[50000, 100], [50000, 200], [5e6, 100], [50000, 150], [275000, 150]],
+        ),
+        [180.11, 190, 150.31, 185.055, np.nan],
+    )
+
+
+@pytest.mark.parametrize("test_input, dummy", [VFPINJ_CASES[0]])
+def test_evaluate_exceptions(test_input, dummy):
+    """Test that points not matching the VFP table raise errors"""
+    deck = ResdataFiles.str2deck(test_input)
+    basic_data = vfp.basic_data(deck, "VFPINJ")[0]
+    with pytest.raises(ValueError, match="Missing columns"):
+        vfp.evaluate(basic_data, pd.DataFrame({"RATE": [50000]}))
+    with pytest.raises(ValueError, match="Points must have 2 columns"):
+        vfp.evaluate(basic_data, [[50000, 100, 0]])
+
+
+def test_basic_data_defaulted_values():
+    """Test that defaulted tabulated values are read as NaN"""
+    deck = ResdataFiles.str2deck(
+        """
+VFPINJ
+ 3 3200.0 GAS THP METRIC BHP /
+ 50000 500000 5e+06  /
+ 100 200  /
+ 1    180.11  1*   150.31 /
+ 2    1*     0.0   240.32 /
+"""
+    )
+    basic_data = vfp.basic_data(deck, "VFPINJ")[0]
+    np.testing.assert_array_equal(basic_data["THP_INDICES"], [1, 2])
+    np.testing.assert_array_equal(
+        basic_data["BHP_TABLE"], [[180.11, np.nan, 150.31], [np.nan, 0.0, 240.32]]
+    )
+
+
+@pytest.mark.parametrize("vfpinj_input, dummy_vfpinj", [VFPINJ_CASES[0]])
+@pytest.mark.parametrize("test_input, dummy", [MULTIPLE_VFP_CASES[0]])
+def test_dfs_keyword_list(vfpinj_input, dummy_vfpinj, test_input, dummy):
+    """Test extracting both VFPPROD and VFPINJ in one pass, with the
+    tables in deck order"""
+    deck = ResdataFiles.str2deck(vfpinj_input + test_input)
+    vfpinjs = vfp.dfs(deck, "VFPINJ")
+    expected = vfpinjs[:1] + vfp.dfs(deck, "VFPPROD") + vfpinjs[1:]
+    vfpdfs = vfp.dfs(deck, ["VFPPROD", "VFPINJ"])
+    assert len(vfpdfs) == len(expected)
+    for vfpdf, expected_df in zip(vfpdfs, expected, strict=True):
+        pd.testing.assert_frame_equal(vfpdf, expected_df)
+
+    pa_tables = vfp.pyarrow_tables(deck, ["VFPPROD", "VFPINJ"], vfpnumbers_str="[2:3]")
+    assert [
+        int(pa_table.schema.metadata[b"TABLE_NUMBER"]) for pa_table in pa_tables
+    ] == [3, 2, 3]
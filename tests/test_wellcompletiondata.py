@@ -266,6 +266,99 @@ CASES = [
         ),
         id="Multiple wells and zones",
     ),
+    # Float KH with OPEN and SHUT connections in a zone, and a zone with only
+    # SHUT connections. Only the open KH is summed, the SHUT zone gets KH 0.
+    pytest.param(
+        pd.DataFrame(
+            columns=["DATE", "WELL", "I", "J", "K1", "OP/SH", "KH", "ZONE"],
+            data=[
+                [
+                    datetime(year=2000, month=1, day=1),
+                    "OP1",
+                    1,
+                    1,
+                    1,
+                    "OPEN",
+                    1.5,
+                    "Z1",
+                ],
+                [
+                    datetime(year=2000, month=1, day=1),
+                    "OP1",
+                    1,
+                    1,
+                    2,
+                    "SHUT",
+                    2.5,
+                    "Z1",
+                ],
+                [
+                    datetime(year=2000, month=1, day=1),
+                    "OP1",
+                    1,
+                    1,
+                    3,
+                    "OPEN",
+                    3.5,
+                    "Z1",
+                ],
+                [
+                    datetime(year=2000, month=1, day=1),
+                    "OP1",
+                    1,
+                    1,
+                    4,
+                    "SHUT",
+                    4.5,
+                    "Z2",
+                ],
+            ],
+        ),
+        pd.DataFrame(
+            columns=["DATE", "WELL", "OP/SH", "KH", "ZONE"],
+            data=[
+                [datetime(year=2000, month=1, day=1), "OP1", "OPEN", 5.0, "Z1"],
+                [datetime(year=2000, month=1, day=1), "OP1", "SHUT", 0.0, "Z2"],
+            ],
+        ),
+        id="Mixed open and shut, float KH",
+    ),
+    # With no open connections at all, KH is the integer 0.
+    pytest.param(
+        pd.DataFrame(
+            columns=["DATE", "WELL", "I", "J", "K1", "OP/SH", "KH", "ZONE"],
+            data=[
+                [
+                    datetime(year=2000, month=1, day=1),
+                    "OP1",
+                    1,
+                    1,
+                    1,
+                    "SHUT",
+                    1.5,
+                    "Z1",
+                ],
+                [
+                    datetime(year=2000, month=1, day=1),
+                    "OP1",
+                    1,
+                    1,
+                    2,
+                    "SHUT",
+                    2.5,
+                    "Z2",
+                ],
+            ],
+        ),
+        pd.DataFrame(
+            columns=["DATE", "WELL", "OP/SH", "KH", "ZONE"],
+            data=[
+                [datetime(year=2000, month=1, day=1), "OP1", "SHUT", 0, "Z1"],
+                [datetime(year=2000, month=1, day=1), "OP1", "SHUT", 0, "Z2"],
+            ],
+        ),
+        id="All shut, float KH",
+    ),
 ]
 
 
@@ -77,6 +77,26 @@ def test_eightcells_dataset():
                 columns=["DATE", "WELL", "I", "J", "K", "OP/SH"],
             ),
         ),
+        # A connection that is reopened after being shut
+        (
+            pd.DataFrame(
+                [
+                    ["2000-01-01", 1, 0],
+                    ["2000-01-02", 0, 0],
+                    ["2000-01-03", 2, 0],
+                    ["2000-01-04", 3, 0],
+                ],
+                columns=["DATE", "CPI:OP1:1,1,1", "CPI:OP1:1,1,2"],
+            ),
+            pd.DataFrame(
+                [
+                    ["2000-01-01", "OP1", 1, 1, 1, "OPEN"],
+                    ["2000-01-02", "OP1", 1, 1, 1, "SHUT"],
+                    ["2000-01-03", "OP1", 1, 1, 1, "OPEN"],
+                ],
+                columns=["DATE", "WELL", "I", "J", "K", "OP/SH"],
+            ),
+        ),
         # Two wells. Dates containing hours
         (
             pd.DataFrame(
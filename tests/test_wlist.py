@@ -623,3 +623,37 @@ def test_expand_wlist(wlist_df, expected_df):
     pd.testing.assert_frame_equal(
         compdat.expand_wlist(wlist_df), expected_df, check_like=True
     )
+
+
+def test_wlist_intervals():
+    """Test the interval representation of well list memberships"""
+    wlist_df = pd.DataFrame(
+        [
+            {"NAME": "OP", "ACTION": "NEW", "WELLS": "OP1 OP2", "DATE": "2000-01-01"},
+            {"NAME": "OP", "ACTION": "DEL", "WELLS": "OP1", "DATE": "2000-02-01"},
+            {"NAME": "IN", "ACTION": "NEW", "WELLS": "IN1", "DATE": "2000-02-01"},
+            {"NAME": "OP", "ACTION": "ADD", "WELLS": "OP3", "DATE": "2000-03-01"},
+            {"NAME": "IN", "ACTION": "MOV", "WELLS": "OP2", "DATE": "2000-03-01"},
+        ]
+    )
+    wlist_df["DATE"] = pd.to_datetime(wlist_df["DATE"]).dt.date
+    intervals = compdat.wlist_intervals(wlist_df)
+    expected = pd.DataFrame(
+        [
+            ["IN", "IN1", "2000-02-01", None],
+            ["IN", "OP2", "2000-03-01", None],
+            ["OP", "OP1", "2000-01-01", "2000-02-01"],
+            ["OP", "OP2", "2000-01-01", "2000-03-01"],
+            ["OP", "OP3", "2000-03-01", None],
+        ],
+        columns=["NAME", "WELL", "VALID_FROM", "VALID_TO"],
+    )
+    for col in ["VALID_FROM", "VALID_TO"]:
+        expected[col] = pd.to_datetime(expected[col]).astype(intervals[col].dtype)
+    pd.testing.assert_frame_equal(intervals, expected)
+
+    # Expanding on already expanded well lists gives the same intervals
+    pd.testing.assert_frame_equal(
+        compdat.wlist_intervals(compdat.expand_wlist(wlist_df)), intervals
+    )
+    assert compdat.wlist_intervals(pd.DataFrame()).empty